@@ -0,0 +1,119 @@
+# benchmarks/element_memory.py
+"""
+Compares the memory taken by all_page_elements in its dictionary form and in the compact element model.
+
+Pages of paragraphs and tables with per-cell details are generated in the shape produced by
+extract_page_text(..., calculate_cell_confidence=True). Each form is then measured with tracemalloc,
+along with the time taken to serialize it to JSON.
+
+Usage:
+    python benchmarks/element_memory.py [--pages N] [--rows N] [--columns N]
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from document_intelligence_wrapper.extractors.element_model import PageElements, dumps_page_elements, orjson
+
+
+def polygon(rng):
+    x, y = rng.uniform(0, 7), rng.uniform(0, 10)
+    return [x, y, x + 1.25, y, x + 1.25, y + 0.25, x, y + 0.25]
+
+
+def confidence(rng):
+    return {"average": rng.random(), "weighted": rng.random()}
+
+
+def generate_pages(pages, paragraphs, tables, rows, columns, seed=0):
+    """
+    Generates all_page_elements in dictionary form.
+    """
+    rng = random.Random(seed)
+    all_page_elements = []
+    for page_number in range(1, pages + 1):
+        elements = []
+        for index in range(paragraphs):
+            elements.append({
+                "element_name": "paragraph",
+                "content": f"Paragraph {index} of page {page_number}",
+                "bounding_box": polygon(rng),
+                "confidence_score": confidence(rng),
+            })
+        for _ in range(tables):
+            elements.append({
+                "element_name": "table",
+                "content": "| table |",
+                "bounding_box": polygon(rng),
+                "confidence_score": confidence(rng),
+                "cells": [
+                    {
+                        "rowIndex": row,
+                        "columnIndex": column,
+                        "content": f"{rng.randint(0, 99999)}",
+                        "bounding_box": polygon(rng),
+                        "confidence_score": confidence(rng),
+                    }
+                    for row in range(rows) for column in range(columns)
+                ],
+            })
+        all_page_elements.append({"page_number": page_number, "elements": elements})
+    return all_page_elements
+
+
+def measure(build):
+    """
+    Returns the value built and the number of bytes it holds.
+    """
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return value, size
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=40, help="Number of pages.")
+    parser.add_argument("--paragraphs", type=int, default=30, help="Number of paragraphs per page.")
+    parser.add_argument("--tables", type=int, default=2, help="Number of tables per page.")
+    parser.add_argument("--rows", type=int, default=40, help="Number of rows per table.")
+    parser.add_argument("--columns", type=int, default=8, help="Number of columns per table.")
+    args = parser.parse_args(argv)
+
+    pages = generate_pages(args.pages, args.paragraphs, args.tables, args.rows, args.columns)
+    serialized = json.dumps(pages)
+    element_count = sum(
+        1 + len(element.get("cells", ())) for page in pages for element in page["elements"]
+    )
+    del pages
+
+    dict_pages, dict_bytes = measure(lambda: json.loads(serialized))
+    compact_pages, compact_bytes = measure(lambda: [PageElements.from_dict(page) for page in json.loads(serialized)])
+
+    start = time.perf_counter()
+    json.dumps(dict_pages, ensure_ascii=False)
+    dict_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    dumps_page_elements(compact_pages)
+    compact_seconds = time.perf_counter() - start
+
+    print(f"elements and cells: {element_count}")
+    print(f"{'form':<10}{'MB':>10}{'bytes/element':>16}{'to JSON ms':>14}")
+    print(f"{'dict':<10}{dict_bytes / 1e6:>10.1f}{dict_bytes / element_count:>16.0f}{dict_seconds * 1000:>14.1f}")
+    print(f"{'compact':<10}{compact_bytes / 1e6:>10.1f}{compact_bytes / element_count:>16.0f}{compact_seconds * 1000:>14.1f}")
+    print(f"serializer: {'orjson' if orjson is not None else 'json'}")
+
+
+if __name__ == "__main__":
+    main()
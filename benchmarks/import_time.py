@@ -0,0 +1,79 @@
+# benchmarks/import_time.py
+"""
+Measures the cold import time of the package's entry points.
+
+Every scenario runs in a fresh interpreter so nothing is cached between measurements. The "eager"
+scenario imports every public entry point up front, which is what importing the package used to cost.
+
+Usage:
+    python benchmarks/import_time.py [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules whose presence after an import shows that a heavy dependency was loaded
+HEAVY_MODULES = ["numpy", "pandas", "azure.core", "azure.ai.documentintelligence"]
+
+SCENARIOS = {
+    "package": "import document_intelligence_wrapper",
+    "table_markdown": "from document_intelligence_wrapper import table_markdown",
+    "extract_page_text": "from document_intelligence_wrapper import extract_page_text",
+    "analyze_document_text": "from document_intelligence_wrapper import analyze_document_text",
+    "eager": (
+        "from document_intelligence_wrapper import table_markdown, extract_page_text, analyze_document_text, "
+        "DocumentIntelligenceClientWrapper; "
+        "import document_intelligence_wrapper.extractors.confidence_engine"
+    ),
+}
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(statement, repeat):
+    """
+    Runs the import statement in fresh interpreters and returns the timings and loaded heavy modules.
+    """
+    timings = []
+    loaded = []
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-c", PROBE.format(statement=statement, heavy=HEAVY_MODULES)],
+            capture_output=True, text=True, cwd=REPO_ROOT
+        )
+        if completed.returncode != 0:
+            return None, completed.stderr.strip().splitlines()[-1]
+        result = json.loads(completed.stdout)
+        timings.append(result["seconds"])
+        loaded = result["loaded"]
+    return timings, loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10, help="Number of fresh interpreters per scenario.")
+    args = parser.parse_args(argv)
+
+    print(f"{'scenario':<24}{'median ms':>12}{'min ms':>10}  heavy modules loaded")
+    for name, statement in SCENARIOS.items():
+        timings, loaded = measure(statement, args.repeat)
+        if timings is None:
+            print(f"{name:<24}{'failed':>12}{'':>10}  {loaded}")
+            continue
+        print(f"{name:<24}{statistics.median(timings) * 1000:>12.1f}{min(timings) * 1000:>10.1f}  {', '.join(loaded) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
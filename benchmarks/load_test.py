@@ -0,0 +1,288 @@
+# benchmarks/load_test.py
+"""
+Drives analyze_document_text through DocumentIntelligenceClientWrapper at a given concurrency and reports
+throughput, latency percentiles and where the time went.
+
+By default a local mock service (benchmarks/mock_service.py) is started in a subprocess, so the CPU time
+measured is the client's alone; --endpoint points the test at a service that is already running instead.
+Documents are analyzed from worker threads (--mode threads), from one event loop with the asynchronous
+client (--mode async), or through analyze_documents (--mode batch). In every mode the client's retry policy
+retries throttled requests after the mock's Retry-After, up to its retry_status limit (3 by default), and batch
+mode also holds back its workers while the service throttles. Batch mode does not take --columnar or
+--max-polling-delay.
+
+The report gives documents per second, latency percentiles, the requests the mock throttled, and the time of
+each pipeline stage: the upload, the polling (which also covers the SDK's deserialization of the result unless
+--columnar is set) and the post-processing. The CPU time of the process is compared with the summed latency
+of the documents to split it between time spent on the CPU here and time spent waiting on the service.
+
+Usage:
+    python benchmarks/load_test.py [--documents 200] [--concurrency 16] [--mode threads|async|batch] [--pages 10]
+        [--latency 1.0] [--rate-limit 15] [--columnar] [--max-polling-delay 2] [--output results.json]
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.run_benchmarks import percentile
+from document_intelligence_wrapper.extractors.instrumentation import StageRecorder, add_stage_listener, remove_stage_listener
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# The stages spent waiting on the service, and the stages processing its result in this process
+WAIT_STAGES = ("upload", "polling")
+POST_PROCESSING_STAGES = ("columnar", "process_document", "extract_page_text")
+
+# A minimal PDF uploaded when no document is given; the mock does not look at it
+DEFAULT_DOCUMENT = b"%PDF-1.4\n1 0 obj << /Type /Page >> endobj\n2 0 obj << /Type /Pages /Count 1 >> endobj\n%%EOF\n"
+
+
+def start_mock_service(args):
+    """
+    Starts benchmarks/mock_service.py in a subprocess and returns the process and its endpoint.
+    """
+    command = [
+        sys.executable, os.path.join(BENCHMARKS_DIR, "mock_service.py"),
+        "--pages", str(args.pages), "--latency", str(args.latency), "--latency-per-page", str(args.latency_per_page),
+        "--jitter", str(args.jitter), "--poll-retry-after", str(args.poll_retry_after),
+    ]
+    if args.rate_limit:
+        command += ["--rate-limit", str(args.rate_limit)]
+    if args.result:
+        command += ["--result", args.result]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    endpoint = process.stdout.readline().strip()
+    if not endpoint:
+        process.kill()
+        raise RuntimeError("The mock service did not start")
+    return process, endpoint
+
+
+def _mock_stats(endpoint):
+    try:
+        with urllib.request.urlopen(f"{endpoint}/_stats", timeout=5) as response:
+            return json.load(response)
+    except OSError:
+        # Not the mock service
+        return None
+
+
+def _analyze_options(args):
+    return {
+        "calculate_confidence": not args.no_confidence,
+        "calculate_cell_confidence": args.cell_confidence,
+        "max_polling_delay": args.max_polling_delay,
+        "columnar": args.columnar,
+        "polling_interval": args.polling_interval,
+    }
+
+
+def run_threads(args, endpoint, document):
+    """
+    Analyzes the documents from a pool of args.concurrency threads sharing one client.
+
+    Returns:
+        tuple: The latency of every successful document and the errors raised.
+    """
+    from document_intelligence_wrapper import DocumentIntelligenceClientWrapper, analyze_document_text
+
+    wrapper = DocumentIntelligenceClientWrapper(
+        endpoint, args.key, pool_maxsize=args.concurrency, polling_interval=args.polling_interval
+    )
+    client = wrapper.get_document_intelligence_client()
+    options = _analyze_options(args)
+
+    def analyze(_):
+        start = time.perf_counter()
+        analyze_document_text(client, document, **options)
+        return time.perf_counter() - start
+
+    latencies, errors = [], []
+    with wrapper, concurrent.futures.ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        for future in concurrent.futures.as_completed([executor.submit(analyze, i) for i in range(args.documents)]):
+            try:
+                latencies.append(future.result())
+            except Exception as e:
+                errors.append(e)
+    return latencies, errors
+
+
+def run_async(args, endpoint, document):
+    """
+    Analyzes the documents from one event loop with at most args.concurrency analyses in flight.
+    """
+    from document_intelligence_wrapper import AsyncDocumentIntelligenceClientWrapper, analyze_document_text_async
+
+    options = _analyze_options(args)
+
+    async def main():
+        semaphore = asyncio.Semaphore(args.concurrency)
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count())
+
+        async with AsyncDocumentIntelligenceClientWrapper(
+            endpoint, args.key, pool_maxsize=args.concurrency, polling_interval=args.polling_interval
+        ) as wrapper:
+            async def analyze():
+                async with semaphore:
+                    start = time.perf_counter()
+                    await analyze_document_text_async(wrapper.client, document, executor=executor, **options)
+                    return time.perf_counter() - start
+
+            outcomes = await asyncio.gather(*(analyze() for _ in range(args.documents)), return_exceptions=True)
+        executor.shutdown()
+        return outcomes
+
+    outcomes = asyncio.run(main())
+    latencies = [outcome for outcome in outcomes if not isinstance(outcome, BaseException)]
+    errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+    return latencies, errors
+
+
+def run_batch(args, endpoint, document):
+    """
+    Analyzes the documents with analyze_documents, timing each one from when the batch pulls it.
+    """
+    from document_intelligence_wrapper import DocumentIntelligenceClientWrapper, analyze_documents
+
+    wrapper = DocumentIntelligenceClientWrapper(
+        endpoint, args.key, pool_maxsize=args.concurrency, polling_interval=args.polling_interval
+    )
+    started = {}
+
+    def sources():
+        for _ in range(args.documents):
+            # A view of its own per document, so each result can be matched with its start time
+            source = memoryview(document)
+            started[id(source)] = time.perf_counter()
+            yield source
+
+    latencies, errors = [], []
+    with wrapper:
+        for batch_result in analyze_documents(
+            wrapper.get_document_intelligence_client(), sources(), max_concurrency=args.concurrency,
+            calculate_confidence=not args.no_confidence, calculate_cell_confidence=args.cell_confidence
+        ):
+            if batch_result.error is None:
+                latencies.append(time.perf_counter() - started.pop(id(batch_result.source)))
+            else:
+                errors.append(batch_result.error)
+    return latencies, errors
+
+
+def report(latencies, errors, wall, cpu, stages, mock_stats):
+    """
+    Returns the results of the run as a dictionary.
+    """
+    waiting = sum(stages.get(name, {}).get("total", 0) for name in WAIT_STAGES)
+    post_processing = sum(stages.get(name, {}).get("total", 0) for name in POST_PROCESSING_STAGES)
+    summed_latency = sum(latencies)
+    return {
+        "documents": len(latencies),
+        "errors": len(errors),
+        "wall_seconds": wall,
+        "documents_per_second": len(latencies) / wall if wall else 0,
+        "latency": {
+            "p50": statistics.median(latencies) if latencies else None,
+            "p90": percentile(latencies, 0.9) if latencies else None,
+            "p99": percentile(latencies, 0.99) if latencies else None,
+            "max": max(latencies) if latencies else None,
+        },
+        "cpu_seconds": cpu,
+        # The share of the documents' summed latency this process spent on the CPU rather than waiting
+        "cpu_share_of_latency": min(1.0, cpu / summed_latency) if summed_latency else None,
+        "stage_seconds": {
+            "upload_and_polling": waiting,
+            "post_processing": post_processing,
+            **{name: summary["total"] for name, summary in stages.items()},
+        },
+        "mock_service": mock_stats,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endpoint", help="Test a running service at this endpoint instead of starting the mock.")
+    parser.add_argument("--key", default="mock-key", help="The key of the service.")
+    parser.add_argument("--document", help="The file uploaded for every analysis. Defaults to a tiny PDF.")
+    parser.add_argument("--documents", type=int, default=200, help="Number of analyses.")
+    parser.add_argument("--concurrency", type=int, default=16, help="Analyses in flight at a time.")
+    parser.add_argument("--mode", choices=("threads", "async", "batch"), default="threads",
+                        help="Drive the client from threads, an event loop, or analyze_documents.")
+    parser.add_argument("--polling-interval", type=float, default=1.0,
+                        help="Client polling interval when the service sends no Retry-After. Default is 1.")
+    parser.add_argument("--max-polling-delay", type=float, default=None, help="Poll adaptively up to this delay.")
+    parser.add_argument("--columnar", action="store_true", help="Decode results into columnar documents.")
+    parser.add_argument("--no-confidence", action="store_true", help="Skip confidence scores.")
+    parser.add_argument("--cell-confidence", action="store_true", help="Also score table cells.")
+    mock = parser.add_argument_group("mock service")
+    mock.add_argument("--pages", type=int, default=10, help="Pages of the synthetic result.")
+    mock.add_argument("--result", help="Return this saved AnalyzeResult instead of a synthetic one.")
+    mock.add_argument("--latency", type=float, default=1.0, help="Seconds an analysis runs.")
+    mock.add_argument("--latency-per-page", type=float, default=0.0, help="Seconds added per page of the result.")
+    mock.add_argument("--jitter", type=float, default=0.2, help="Relative random variation of the latency.")
+    mock.add_argument("--rate-limit", type=float, default=None, help="Requests per second before the mock answers 429.")
+    mock.add_argument("--poll-retry-after", type=int, default=1, help="Retry-After seconds of running statuses.")
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    args = parser.parse_args(argv)
+
+    document = DEFAULT_DOCUMENT
+    if args.document:
+        with open(args.document, "rb") as f:
+            document = f.read()
+
+    process = None
+    endpoint = args.endpoint
+    if endpoint is None:
+        process, endpoint = start_mock_service(args)
+
+    recorder = StageRecorder()
+    add_stage_listener(recorder)
+    try:
+        run = {"threads": run_threads, "async": run_async, "batch": run_batch}[args.mode]
+        start_wall, start_cpu = time.perf_counter(), time.process_time()
+        latencies, errors = run(args, endpoint, document)
+        wall, cpu = time.perf_counter() - start_wall, time.process_time() - start_cpu
+        mock_stats = _mock_stats(endpoint)
+    finally:
+        remove_stage_listener(recorder)
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    results = report(latencies, errors, wall, cpu, recorder.summary(), mock_stats)
+
+    latency = results["latency"]
+    print(f"{results['documents']} documents, {results['errors']} errors in {wall:.1f} s: "
+          f"{results['documents_per_second']:.1f} documents/s at concurrency {args.concurrency} ({args.mode})")
+    if latencies:
+        print(f"latency p50 {latency['p50']:.2f} s, p90 {latency['p90']:.2f} s, p99 {latency['p99']:.2f} s, max {latency['max']:.2f} s")
+    if results["cpu_share_of_latency"] is not None:
+        print(f"cpu {cpu:.1f} s, {results['cpu_share_of_latency']:.0%} of the summed latency; "
+              f"the rest was spent waiting on the service")
+    for name, seconds in results["stage_seconds"].items():
+        print(f"  {name:<24}{seconds:>10.2f} s")
+    if mock_stats:
+        print(f"mock: {mock_stats['submitted']} submitted, {mock_stats['polls']} polls, {mock_stats['throttled']} throttled")
+    for error in errors[:5]:
+        print(f"error: {error!r}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"python": platform.python_version(), "options": vars(args), "results": results}, f, indent=2)
+
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
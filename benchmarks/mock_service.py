@@ -0,0 +1,289 @@
+# benchmarks/mock_service.py
+"""
+A local stand-in for the Document Intelligence service, for load tests that do not call Azure.
+
+The server implements the analyze and poll protocol used by the SDK: POST .../documentModels/{model}:analyze
+answers 202 with an Operation-Location, and GET .../analyzeResults/{id} reports "running" until the analysis
+latency has elapsed, then "succeeded" with a canned layout result. The result is either a synthetic document
+from benchmarks/synthetic.py or a saved AnalyzeResult JSON file, and is encoded once up front.
+
+Throttling follows the service's model of a request rate per resource: every request takes a token from a
+bucket refilled at --rate-limit requests per second, and requests that find it empty get 429 with a
+Retry-After header. GET /_stats returns the request counters as JSON.
+
+Usage:
+    python benchmarks/mock_service.py [--port 0] [--pages 10] [--result saved.json] [--latency 1.0]
+        [--latency-per-page 0.05] [--jitter 0.2] [--rate-limit 15] [--retry-after 1] [--poll-retry-after 1]
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import generate_analyze_result
+
+ANALYZE_PATH = re.compile(r"/documentModels/([^/:?]+):analyze")
+RESULT_PATH = re.compile(r"/documentModels/([^/:?]+)/analyzeResults/([^/?]+)")
+
+
+class _TokenBucket:
+    """
+    Allows rate requests per second on average, with bursts of up to burst requests.
+    """
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self):
+        """
+        Takes a token, or returns the seconds until one is available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self.rate
+
+
+class MockDocumentIntelligenceService:
+    """
+    A threaded HTTP server answering the analyze and poll requests of the Document Intelligence client.
+
+    Usage:
+        with MockDocumentIntelligenceService(pages=20, latency=0.5, rate_limit=15) as service:
+            client = DocumentIntelligenceClientWrapper(service.endpoint, "key").get_document_intelligence_client()
+
+    Args:
+        result (dict, optional): The AnalyzeResult returned by every analysis. Defaults to a synthetic document.
+        pages (int): The number of pages of the synthetic document. Default is 10.
+        latency (float): The seconds an analysis runs before it succeeds. Default is 1.
+        latency_per_page (float): Seconds added to the latency for every page of the result. Default is 0.
+        jitter (float): The relative random variation of the latency, e.g. 0.2 for +/-20%. Default is 0.
+        rate_limit (float, optional): The requests per second accepted before answering 429. Unlimited by default.
+        burst (int, optional): The requests accepted at once before throttling starts. Defaults to the rate limit.
+        retry_after (int): The Retry-After seconds of 429 responses, at least the wait for the next token. Default is 1.
+        poll_retry_after (int, optional): The Retry-After seconds sent with "running" statuses. Default is 1.
+        host (str): The interface to listen on. Default is 127.0.0.1.
+        port (int): The port to listen on, or 0 to pick a free one. Default is 0.
+        seed (int): The seed of the synthetic document and of the jitter. Default is 0.
+    """
+    def __init__(self, result=None, pages=10, latency=1.0, latency_per_page=0.0, jitter=0.0, rate_limit=None, burst=None,
+                 retry_after=1, poll_retry_after=1, host="127.0.0.1", port=0, seed=0):
+        if result is None:
+            result = generate_analyze_result(pages=pages, seed=seed)
+        self.page_count = len(result.get("pages") or [])
+        self.latency = latency + latency_per_page * self.page_count
+        self.jitter = jitter
+        self.retry_after = retry_after
+        self.poll_retry_after = poll_retry_after
+        self._bucket = _TokenBucket(rate_limit, burst or max(1, int(rate_limit))) if rate_limit else None
+        self._random = random.Random(seed)
+
+        # Encoded once: every succeeded poll returns the same bytes
+        self._succeeded_body = json.dumps({
+            "status": "succeeded",
+            "createdDateTime": "2024-01-01T00:00:00Z",
+            "lastUpdatedDateTime": "2024-01-01T00:00:00Z",
+            "analyzeResult": result,
+        }).encode()
+        self._running_body = json.dumps({
+            "status": "running",
+            "createdDateTime": "2024-01-01T00:00:00Z",
+            "lastUpdatedDateTime": "2024-01-01T00:00:00Z",
+        }).encode()
+
+        self._lock = threading.Lock()
+        self._operations = {}
+        self.stats = {"submitted": 0, "polls": 0, "succeeded": 0, "throttled": 0, "bytes_received": 0}
+
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def endpoint(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-document-intelligence", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_details):
+        self.stop()
+
+    def _count(self, name, value=1):
+        with self._lock:
+            self.stats[name] += value
+
+    def _submit(self):
+        ready_at = time.monotonic() + self.latency * (1 + self.jitter * self._random.uniform(-1, 1))
+        operation_id = uuid.uuid4().hex
+        with self._lock:
+            self._operations[operation_id] = ready_at
+            self.stats["submitted"] += 1
+        return operation_id
+
+    def _poll(self, operation_id):
+        """
+        Returns the body of a status request, or None for an unknown operation.
+        """
+        with self._lock:
+            ready_at = self._operations.get(operation_id)
+            if ready_at is None:
+                return None
+            self.stats["polls"] += 1
+            if time.monotonic() < ready_at:
+                return self._running_body
+            # The client stops polling once it has the result
+            del self._operations[operation_id]
+            self.stats["succeeded"] += 1
+        return self._succeeded_body
+
+    def _handler_class(self):
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status, body=b"", headers=()):
+                self.send_response(status)
+                for name, value in headers:
+                    self.send_header(name, value)
+                if body:
+                    self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _read_body(self):
+                if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                    size = 0
+                    while True:
+                        chunk_size = int(self.rfile.readline().split(b";")[0], 16)
+                        self.rfile.read(chunk_size + 2)
+                        size += chunk_size
+                        if chunk_size == 0:
+                            return size
+                size = int(self.headers.get("Content-Length") or 0)
+                remaining = size
+                while remaining:
+                    remaining -= len(self.rfile.read(min(remaining, 1 << 20)))
+                return size
+
+            def _throttled(self):
+                if service._bucket is None:
+                    return False
+                wait = service._bucket.take()
+                if not wait:
+                    return False
+                service._count("throttled")
+                body = json.dumps({"error": {"code": "429", "message": "Rate limit is exceeded. Try again later."}}).encode()
+                self._send(429, body, [("Retry-After", str(max(service.retry_after, int(wait + 0.999))))])
+                return True
+
+            def do_POST(self):
+                size = self._read_body()
+                match = ANALYZE_PATH.search(self.path)
+                if match is None:
+                    self._send(404)
+                    return
+                if self._throttled():
+                    return
+                service._count("bytes_received", size)
+                operation_id = service._submit()
+                base = self.path.split("/documentModels/")[0]
+                operation_location = (
+                    f"{service.endpoint}{base}/documentModels/{match.group(1)}/analyzeResults/{operation_id}"
+                    f"?api-version=2024-07-31-preview"
+                )
+                self._send(202, headers=[("Operation-Location", operation_location)])
+
+            def do_GET(self):
+                if self.path.startswith("/_stats"):
+                    with service._lock:
+                        body = json.dumps(dict(service.stats, in_flight=len(service._operations))).encode()
+                    self._send(200, body)
+                    return
+                match = RESULT_PATH.search(self.path)
+                if match is None:
+                    self._send(404)
+                    return
+                if self._throttled():
+                    return
+                body = service._poll(match.group(2))
+                if body is None:
+                    self._send(404, json.dumps({"error": {"code": "NotFound", "message": "Operation not found."}}).encode())
+                elif body is service._running_body and service.poll_retry_after is not None:
+                    self._send(200, body, [("Retry-After", str(service.poll_retry_after))])
+                else:
+                    self._send(200, body)
+
+        return Handler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on.")
+    parser.add_argument("--port", type=int, default=0, help="Port to listen on. Default picks a free port.")
+    parser.add_argument("--pages", type=int, default=10, help="Pages of the synthetic result.")
+    parser.add_argument("--result", help="Return this saved AnalyzeResult (.json or .json.gz) instead of a synthetic one.")
+    parser.add_argument("--latency", type=float, default=1.0, help="Seconds an analysis runs.")
+    parser.add_argument("--latency-per-page", type=float, default=0.0, help="Seconds added per page of the result.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Relative random variation of the latency.")
+    parser.add_argument("--rate-limit", type=float, default=None, help="Requests per second before answering 429.")
+    parser.add_argument("--burst", type=int, default=None, help="Requests accepted at once. Defaults to the rate limit.")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds of 429 responses.")
+    parser.add_argument("--poll-retry-after", type=int, default=1, help="Retry-After seconds of running statuses.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic result and the jitter.")
+    args = parser.parse_args(argv)
+
+    result = None
+    if args.result:
+        from document_intelligence_wrapper.extractors.offline_processor import load_analyze_result
+        result = load_analyze_result(args.result)
+
+    service = MockDocumentIntelligenceService(
+        result=result, pages=args.pages, latency=args.latency, latency_per_page=args.latency_per_page, jitter=args.jitter,
+        rate_limit=args.rate_limit, burst=args.burst, retry_after=args.retry_after, poll_retry_after=args.poll_retry_after,
+        host=args.host, port=args.port, seed=args.seed,
+    )
+    # The endpoint is the first line printed, for harnesses that start the service as a subprocess
+    print(service.endpoint, flush=True)
+    try:
+        service._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service._server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+# benchmarks/run_benchmarks.py
+"""
+Benchmarks each stage of the post-processing pipeline on synthetic documents of several sizes.
+
+For every document size and stage, the stage is run a number of times to report its latency percentiles
+and throughput, then once more under tracemalloc to report its peak memory. Everything runs offline on
+documents from benchmarks/synthetic.py.
+
+Results can be saved with --output and compared with a saved baseline with --baseline: the run fails with
+exit code 1 when the median latency of any stage grows by more than --max-regression, which makes it usable
+as a gate for upgrades.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--sizes small medium] [--stages process_document table_markdown]
+        [--repeat N] [--output results.json] [--baseline baseline.json] [--max-regression 1.25]
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import generate_analyze_result
+from document_intelligence_wrapper.extractors.columnar import ColumnarDocument, decode_analyze_result
+from document_intelligence_wrapper.extractors.document_processor import process_document
+from document_intelligence_wrapper.extractors.extract_utils import extract_page_text, table_markdown
+
+# The number of pages of each document size
+SIZES = {
+    "small": 10,
+    "medium": 100,
+    "large": 500,
+}
+
+
+def _stage_process_document(document):
+    return lambda: process_document(document), len(document["pages"]), "pages"
+
+
+def _stage_table_markdown(document):
+    tables = document["tables"]
+    return lambda: [table_markdown(table) for table in tables], len(tables), "tables"
+
+
+def _stage_confidence_engine(document):
+    from document_intelligence_wrapper.extractors.confidence_engine import score_elements
+
+    elements = document["paragraphs"] + [cell for table in document["tables"] for cell in table["cells"]]
+    return lambda: score_elements(elements, document), len(elements), "elements"
+
+
+def _stage_chunks(document):
+    from document_intelligence_wrapper.extractors.chunker import iter_chunks
+
+    all_page_elements = extract_page_text(document, *process_document(document), calculate_confidence=True)[3]
+    return lambda: list(iter_chunks(all_page_elements)), len(all_page_elements), "pages"
+
+
+def _extract_stage(**options):
+    def stage(document):
+        page_section, figure_associations = process_document(document)
+        return (
+            lambda: extract_page_text(document, page_section, figure_associations, **options),
+            len(document["pages"]),
+            "pages",
+        )
+    return stage
+
+
+def _stage_decode_columnar(document):
+    raw = json.dumps({"status": "succeeded", "analyzeResult": document}).encode()
+    return lambda: decode_analyze_result(raw), len(document["pages"]), "pages"
+
+
+def _stage_columnar_pipeline(document):
+    raw = json.dumps({"status": "succeeded", "analyzeResult": document}).encode()
+
+    def run():
+        columnar = decode_analyze_result(raw)
+        page_section, figure_associations = process_document(columnar)
+        extract_page_text(columnar, page_section, figure_associations, calculate_confidence=True)
+
+    return run, len(document["pages"]), "pages"
+
+
+def _columnar_extract_stage(**options):
+    def stage(document):
+        columnar = ColumnarDocument.from_dict(document)
+        page_section, figure_associations = process_document(columnar)
+        return (
+            lambda: extract_page_text(columnar, page_section, figure_associations, **options),
+            len(document["pages"]),
+            "pages",
+        )
+    return stage
+
+
+STAGES = {
+    "process_document": _stage_process_document,
+    "table_markdown": _stage_table_markdown,
+    "confidence_engine": _stage_confidence_engine,
+    "extract_page_text": _extract_stage(calculate_confidence=False),
+    "extract_page_text_confidence": _extract_stage(calculate_confidence=True),
+    "extract_page_text_cells": _extract_stage(calculate_confidence=True, calculate_cell_confidence=True),
+    "extract_page_text_processes": _extract_stage(calculate_confidence=True, execution_mode="processes"),
+    "extract_page_text_spans": _extract_stage(calculate_confidence=False, text_assembly="spans"),
+    "chunks": _stage_chunks,
+    "decode_columnar": _stage_decode_columnar,
+    "extract_page_text_columnar": _columnar_extract_stage(calculate_confidence=True),
+    "columnar_pipeline": _stage_columnar_pipeline,
+}
+
+
+def percentile(values, fraction):
+    """
+    Returns the percentile of the values, interpolating between the closest ranks.
+    """
+    values = sorted(values)
+    position = (len(values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def run_stage(run, repeat):
+    """
+    Runs a stage once to warm up, repeat times to time it, and once under tracemalloc.
+
+    Returns:
+        dict: The latencies in seconds and the peak memory in bytes.
+    """
+    run()
+
+    latencies = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        latencies.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    run()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"latencies": latencies, "peak_bytes": peak_bytes}
+
+
+def compare(results, baseline, max_regression):
+    """
+    Returns the stages whose median latency grew by more than max_regression compared to the baseline.
+    """
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        ratio = result["p50"] / base["p50"]
+        if ratio > max_regression:
+            regressions.append((key, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", nargs="+", choices=SIZES, default=["small", "medium"], help="Document sizes to run.")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES), help="Stages to run.")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed runs per stage.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic documents.")
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", help="Compare the results with this JSON file from an earlier run.")
+    parser.add_argument("--max-regression", type=float, default=1.25,
+                        help="Largest allowed ratio of median latency to the baseline's. Default is 1.25.")
+    args = parser.parse_args(argv)
+
+    results = {}
+    print(f"{'size':<8}{'stage':<32}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'throughput':>18}{'peak MB':>10}")
+
+    for size in args.sizes:
+        document = generate_analyze_result(pages=SIZES[size], seed=args.seed)
+        for stage_name in args.stages:
+            run, items, unit = STAGES[stage_name](document)
+            measurement = run_stage(run, args.repeat)
+            latencies = measurement["latencies"]
+
+            p50 = statistics.median(latencies)
+            result = {
+                "p50": p50,
+                "p90": percentile(latencies, 0.9),
+                "p99": percentile(latencies, 0.99),
+                "throughput": items / p50,
+                "unit": unit,
+                "peak_bytes": measurement["peak_bytes"],
+            }
+            results[f"{size}/{stage_name}"] = result
+
+            print(f"{size:<8}{stage_name:<32}{result['p50'] * 1000:>10.1f}{result['p90'] * 1000:>10.1f}"
+                  f"{result['p99'] * 1000:>10.1f}{result['throughput']:>12.0f} {unit + '/s':<5}"
+                  f"{result['peak_bytes'] / 1e6:>10.1f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"python": platform.python_version(), "results": results}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.max_regression)
+        for key, ratio in regressions:
+            print(f"Regression: {key} is {ratio:.2f}x slower than the baseline")
+        if regressions:
+            return 1
+        print("No regressions against the baseline.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
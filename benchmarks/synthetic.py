@@ -0,0 +1,273 @@
+# benchmarks/synthetic.py
+"""
+Deterministic generator of synthetic prebuilt-layout analysis results.
+
+The generated documents have the structure the post-processing pipeline reads: pages with words, paragraphs,
+tables with merged cells and multi-row headers, figures with captions, and sections referencing every
+element in reading order. Content, spans and polygons are consistent with each other, so every stage of the
+pipeline does the same work it does on real results. The same parameters and seed always produce the same
+document.
+
+Usage:
+    python benchmarks/synthetic.py --pages 100 --output document.json
+"""
+
+import argparse
+import json
+import random
+
+PAGE_WIDTH = 8.5
+PAGE_HEIGHT = 11.0
+MARGIN = 0.5
+
+_WORDS = [
+    "the", "agreement", "party", "shall", "payment", "period", "notice", "total", "amount", "balance",
+    "section", "provided", "interest", "account", "statement", "date", "rate", "terms", "of", "and",
+]
+
+
+def _polygon(x, y, width, height):
+    return [x, y, x + width, y, x + width, y + height, x, y + height]
+
+
+class _DocumentBuilder:
+    """
+    Accumulates the content of the document and the words of the current page.
+    """
+    def __init__(self, rng):
+        self.rng = rng
+        self.content = []
+        self.offset = 0
+        self.words = []
+
+    def append(self, text):
+        span = {"offset": self.offset, "length": len(text)}
+        self.content.append(text)
+        self.offset += len(text)
+        return span
+
+    def separator(self, text="\n\n"):
+        self.content.append(text)
+        self.offset += len(text)
+
+    def text_block(self, word_count, x, y, width, height, numeric=False):
+        """
+        Lays out word_count words on one line of the box and returns their text and span.
+        """
+        word_width = width / max(word_count, 1)
+        start = self.offset
+        texts = []
+        for index in range(word_count):
+            if numeric:
+                text = f"{self.rng.randint(0, 99999) / 100:.2f}"
+            else:
+                text = self.rng.choice(_WORDS)
+            if index:
+                self.separator(" ")
+            self.words.append({
+                "content": text,
+                "polygon": _polygon(x + index * word_width, y + height * 0.1, word_width * 0.9, height * 0.8),
+                "confidence": round(self.rng.uniform(0.6, 1.0), 3),
+                "span": self.append(text),
+            })
+            texts.append(text)
+        return " ".join(texts), {"offset": start, "length": self.offset - start}
+
+
+def generate_analyze_result(pages=10, words_per_page=400, paragraphs_per_page=12, tables_per_page=1, table_rows=12,
+                            table_columns=6, header_rows=2, figures_per_page=1, seed=0):
+    """
+    Generates a synthetic AnalyzeResult as a plain dictionary.
+
+    About two thirds of each page's words go to paragraphs and the rest to table cells. The first header row
+    of every table has a cell spanning two columns, and the body has a cell spanning two rows. Each figure
+    holds a caption paragraph that is referenced from the figure.
+
+    Args:
+        pages (int): The number of pages.
+        words_per_page (int): The approximate number of words on each page. Table words are spread evenly
+            over the cells, with at least one word per cell.
+        paragraphs_per_page (int): The number of paragraphs on each page, not counting figure captions.
+        tables_per_page (int): The number of tables on each page.
+        table_rows (int): The number of rows of each table, header rows included.
+        table_columns (int): The number of columns of each table.
+        header_rows (int): The number of column header rows of each table.
+        figures_per_page (int): The number of figures on each page.
+        seed (int): The seed of the random values.
+
+    Returns:
+        dict: The analysis result, with camelCase keys as returned by the service.
+    """
+    rng = random.Random(seed)
+    builder = _DocumentBuilder(rng)
+    result = {
+        "apiVersion": "2024-07-31-preview",
+        "modelId": "prebuilt-layout",
+        "stringIndexType": "textElements",
+        "contentFormat": "text",
+        "pages": [],
+        "paragraphs": [],
+        "tables": [],
+        "figures": [],
+        "sections": [{"spans": [], "elements": []}],
+    }
+
+    cell_count = tables_per_page * table_rows * table_columns
+    table_words = (words_per_page // 3) if cell_count else 0
+    paragraph_words = words_per_page - table_words
+
+    # Split the page height between the blocks of the page
+    block_count = paragraphs_per_page + tables_per_page * table_rows + figures_per_page * 3
+    line_height = (PAGE_HEIGHT - 2 * MARGIN) / max(block_count, 1)
+    content_width = PAGE_WIDTH - 2 * MARGIN
+
+    for page_number in range(1, pages + 1):
+        if page_number > 1:
+            builder.separator()
+        builder.words = []
+        page_start = builder.offset
+        section_elements = []
+        y = MARGIN
+
+        for index in range(paragraphs_per_page):
+            word_count = max(1, paragraph_words // paragraphs_per_page + (index < paragraph_words % paragraphs_per_page))
+            text, span = builder.text_block(word_count, MARGIN, y, content_width, line_height)
+            builder.separator()
+            section_elements.append(f"/paragraphs/{len(result['paragraphs'])}")
+            result["paragraphs"].append({
+                "spans": [span],
+                "boundingRegions": [{"pageNumber": page_number, "polygon": _polygon(MARGIN, y, content_width, line_height)}],
+                "content": text,
+            })
+            y += line_height
+
+        for _ in range(tables_per_page):
+            table, y = _generate_table(builder, page_number, y, line_height, content_width, table_rows, table_columns,
+                                       header_rows, table_words // max(tables_per_page, 1))
+            builder.separator()
+            section_elements.append(f"/tables/{len(result['tables'])}")
+            result["tables"].append(table)
+
+        for index in range(figures_per_page):
+            figure_height = 3 * line_height
+            caption_text, caption_span = builder.text_block(4, MARGIN, y + 2 * line_height, content_width / 2, line_height)
+            builder.separator()
+            caption_index = len(result["paragraphs"])
+            result["paragraphs"].append({
+                "role": "caption",
+                "spans": [caption_span],
+                "boundingRegions": [{"pageNumber": page_number, "polygon": _polygon(MARGIN, y + 2 * line_height, content_width / 2, line_height)}],
+                "content": caption_text,
+            })
+            section_elements.append(f"/figures/{len(result['figures'])}")
+            result["figures"].append({
+                "id": f"{page_number}.{index + 1}",
+                "boundingRegions": [{"pageNumber": page_number, "polygon": _polygon(MARGIN, y, content_width / 2, figure_height)}],
+                "spans": [caption_span],
+                "elements": [f"/paragraphs/{caption_index}"],
+                "caption": {"content": caption_text, "elements": [f"/paragraphs/{caption_index}"]},
+            })
+            y += figure_height
+
+        page_span = {"offset": page_start, "length": builder.offset - page_start}
+        result["pages"].append({
+            "pageNumber": page_number,
+            "angle": 0,
+            "width": PAGE_WIDTH,
+            "height": PAGE_HEIGHT,
+            "unit": "inch",
+            "words": builder.words,
+            "spans": [page_span],
+        })
+
+        # One section per page, all attached to the root section
+        result["sections"][0]["elements"].append(f"/sections/{len(result['sections'])}")
+        result["sections"].append({"spans": [page_span], "elements": section_elements})
+
+    result["content"] = "".join(builder.content)
+    result["sections"][0]["spans"] = [{"offset": 0, "length": len(result["content"])}]
+    return result
+
+
+def _generate_table(builder, page_number, y, line_height, content_width, rows, columns, header_rows, word_count):
+    """
+    Generates a table starting at y and returns it with the y coordinate below it.
+    """
+    column_width = content_width / columns
+    words_per_cell = max(1, word_count // max(rows * columns, 1))
+    table_start = builder.offset
+    cells = []
+    covered = set()
+
+    for row in range(rows):
+        for column in range(columns):
+            if (row, column) in covered:
+                continue
+
+            row_span = column_span = 1
+            if row == 0 and column == 0 and columns > 1:
+                column_span = 2
+            elif row == header_rows and column == columns - 1 and rows - header_rows > 1:
+                row_span = 2
+            for covered_row in range(row, row + row_span):
+                for covered_column in range(column, column + column_span):
+                    covered.add((covered_row, covered_column))
+
+            x = MARGIN + column * column_width
+            cell_y = y + row * line_height
+            is_header = row < header_rows
+            text, span = builder.text_block(
+                words_per_cell, x, cell_y, column_width * column_span, line_height * row_span,
+                numeric=not is_header and column > 0
+            )
+            builder.separator("\n")
+
+            cell = {
+                "rowIndex": row,
+                "columnIndex": column,
+                "content": text,
+                "boundingRegions": [{"pageNumber": page_number, "polygon": _polygon(x, cell_y, column_width * column_span, line_height * row_span)}],
+                "spans": [span],
+            }
+            if is_header:
+                cell["kind"] = "columnHeader"
+            if row_span > 1:
+                cell["rowSpan"] = row_span
+            if column_span > 1:
+                cell["columnSpan"] = column_span
+            cells.append(cell)
+
+    table = {
+        "rowCount": rows,
+        "columnCount": columns,
+        "cells": cells,
+        "boundingRegions": [{"pageNumber": page_number, "polygon": _polygon(MARGIN, y, content_width, rows * line_height)}],
+        "spans": [{"offset": table_start, "length": builder.offset - table_start}],
+    }
+    return table, y + rows * line_height
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--words-per-page", type=int, default=400)
+    parser.add_argument("--paragraphs-per-page", type=int, default=12)
+    parser.add_argument("--tables-per-page", type=int, default=1)
+    parser.add_argument("--table-rows", type=int, default=12)
+    parser.add_argument("--table-columns", type=int, default=6)
+    parser.add_argument("--header-rows", type=int, default=2)
+    parser.add_argument("--figures-per-page", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", required=True, help="The JSON file to write.")
+    args = parser.parse_args(argv)
+
+    result = generate_analyze_result(
+        args.pages, args.words_per_page, args.paragraphs_per_page, args.tables_per_page, args.table_rows,
+        args.table_columns, args.header_rows, args.figures_per_page, args.seed
+    )
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(result, f)
+
+
+if __name__ == "__main__":
+    main()
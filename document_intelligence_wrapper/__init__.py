@@ -1,5 +1,85 @@
 # document_intelligence_wrapper/__init__.py
 
-from .document_intelligence_client import DocumentIntelligenceClientWrapper
-from .extractors.extract_utils import table_markdown,extract_page_text
-from .extractors.text_extractor import analyze_document_text
+import importlib
+from typing import TYPE_CHECKING
+
+# The public entry points are imported on first access, so importing the package does not pull in
+# the Azure SDK or NumPy until they are actually needed
+_LAZY_ATTRIBUTES = {
+    "DocumentIntelligenceClientWrapper": ".document_intelligence_client",
+    "AsyncDocumentIntelligenceClientWrapper": ".document_intelligence_client",
+    "get_shared_client": ".document_intelligence_client",
+    "close_shared_clients": ".document_intelligence_client",
+    "table_markdown": ".extractors.extract_utils",
+    "extract_page_text": ".extractors.extract_utils",
+    "iter_page_text": ".extractors.extract_utils",
+    "PageResult": ".extractors.extract_utils",
+    "Chunk": ".extractors.chunker",
+    "iter_chunks": ".extractors.chunker",
+    "ParquetExporter": ".extractors.arrow_export",
+    "export_parquet": ".extractors.arrow_export",
+    "page_element_batches": ".extractors.arrow_export",
+    "PageElements": ".extractors.element_model",
+    "dumps_page_elements": ".extractors.element_model",
+    "analyze_document_text": ".extractors.text_extractor",
+    "analyze_document_text_async": ".extractors.text_extractor",
+    "analyze_document_incremental": ".extractors.incremental",
+    "AnalysisHandle": ".extractors.operations",
+    "submit_document": ".extractors.operations",
+    "submit_document_async": ".extractors.operations",
+    "resume_analysis": ".extractors.operations",
+    "get_analysis_status": ".extractors.operations",
+    "collect_document_text": ".extractors.operations",
+    "collect_document_text_async": ".extractors.operations",
+    "AdaptivePolling": ".extractors.polling",
+    "AsyncAdaptivePolling": ".extractors.polling",
+    "JsonResultPolling": ".extractors.polling",
+    "AsyncJsonResultPolling": ".extractors.polling",
+    "ColumnarDocument": ".extractors.columnar",
+    "decode_analyze_result": ".extractors.columnar",
+    "load_columnar_document": ".extractors.columnar",
+    "analyze_documents": ".extractors.batch_extractor",
+    "iter_document_paths": ".extractors.batch_extractor",
+    "BatchResult": ".extractors.batch_extractor",
+    "AnalyzeResultCache": ".extractors.result_cache",
+    "add_stage_listener": ".extractors.instrumentation",
+    "remove_stage_listener": ".extractors.instrumentation",
+    "set_tracer": ".extractors.instrumentation",
+    "StageRecorder": ".extractors.instrumentation",
+    "load_analyze_result": ".extractors.offline_processor",
+    "process_saved_results": ".extractors.offline_processor",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+if TYPE_CHECKING:
+    from .document_intelligence_client import DocumentIntelligenceClientWrapper,AsyncDocumentIntelligenceClientWrapper,get_shared_client,close_shared_clients
+    from .extractors.extract_utils import table_markdown,extract_page_text,iter_page_text,PageResult
+    from .extractors.chunker import Chunk,iter_chunks
+    from .extractors.arrow_export import ParquetExporter,export_parquet,page_element_batches
+    from .extractors.element_model import PageElements,dumps_page_elements
+    from .extractors.text_extractor import analyze_document_text,analyze_document_text_async
+    from .extractors.incremental import analyze_document_incremental
+    from .extractors.operations import AnalysisHandle,submit_document,submit_document_async,resume_analysis,get_analysis_status,collect_document_text,collect_document_text_async
+    from .extractors.polling import AdaptivePolling,AsyncAdaptivePolling,JsonResultPolling,AsyncJsonResultPolling
+    from .extractors.columnar import ColumnarDocument,decode_analyze_result,load_columnar_document
+    from .extractors.batch_extractor import analyze_documents,iter_document_paths,BatchResult
+    from .extractors.result_cache import AnalyzeResultCache
+    from .extractors.instrumentation import add_stage_listener,remove_stage_listener,set_tracer,StageRecorder
+    from .extractors.offline_processor import load_analyze_result,process_saved_results
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+
+    # Cache the attribute so later lookups bypass this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,21 +1,95 @@
 # document_intelligence_wrapper/document_intelligence_client.py
 
+import asyncio
 import logging
+import os
+import threading
+
 from azure.core.credentials import AzureKeyCredential
 from azure.ai.documentintelligence import DocumentIntelligenceClient
+from azure.ai.documentintelligence.aio import DocumentIntelligenceClient as AsyncDocumentIntelligenceClient
+
+
+def _client_options(connection_timeout, read_timeout, retry_total, retry_backoff_factor, retry_backoff_max, polling_interval, client_options):
+    """
+    Returns the keyword arguments of the client, leaving out the settings that keep the SDK's defaults.
+    """
+    options = {
+        "connection_timeout": connection_timeout,
+        "read_timeout": read_timeout,
+        "retry_total": retry_total,
+        "retry_backoff_factor": retry_backoff_factor,
+        "retry_backoff_max": retry_backoff_max,
+        "polling_interval": polling_interval,
+    }
+    options = {name: value for name, value in options.items() if value is not None}
+    options.update(client_options)
+    return options
+
+
+def _requests_transport(pool_connections, pool_maxsize, keep_alive, options):
+    """
+    Returns a requests transport whose connection pool holds up to pool_maxsize connections per host.
+    """
+    import requests
+    from azure.core.pipeline.transport import RequestsTransport
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    # Retries are left to the client's retry policy, as in the SDK's own transport
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=False, redirect=False, raise_on_status=False)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+
+    return RequestsTransport(
+        session=session,
+        session_owner=True,
+        **{name: options.pop(name) for name in ("connection_timeout", "read_timeout") if name in options}
+    )
+
 
 class DocumentIntelligenceClientWrapper:
     """
     A wrapper for the Azure Document Intelligence Client.
-    
+
+    The client is thread-safe: one wrapper can serve concurrent analyses, which then share its pool of
+    connections. See get_shared_client for a process-wide registry of clients.
+
     Attributes:
         endpoint (str): The endpoint for the Azure Document Intelligence API.
         key (str): The key for the Azure Document Intelligence API.
+        pool_connections (int): The number of hosts whose connections are pooled. Default is 10.
+        pool_maxsize (int): The maximum number of connections kept open per host. Size it to the number of
+            concurrent analyses. Default is 10.
+        connection_timeout (float): The timeout for opening a connection, in seconds. Defaults to the SDK's 300.
+        read_timeout (float): The timeout for reading a response, in seconds. Defaults to the SDK's 300.
+        keep_alive (bool): Flag to keep connections open between requests. Default is True.
+        retry_total (int): The maximum number of retries of a failed request. Defaults to the SDK's 10.
+        retry_backoff_factor (float): The backoff factor between retries, in seconds. Defaults to the SDK's 0.8.
+        retry_backoff_max (float): The maximum backoff between retries, in seconds. Defaults to the SDK's 120.
+        polling_interval (float): The delay between status requests of an analysis when the service does not
+            return a Retry-After header, in seconds. Defaults to the SDK's 30.
+        client_options (dict): Any other keyword arguments of DocumentIntelligenceClient.
     """
-    def __init__(self, endpoint: str, key: str):
+    def __init__(self, endpoint: str, key: str, pool_connections: int = 10, pool_maxsize: int = 10,
+                 connection_timeout: float = None, read_timeout: float = None, keep_alive: bool = True,
+                 retry_total: int = None, retry_backoff_factor: float = None, retry_backoff_max: float = None,
+                 polling_interval: float = None, **client_options):
         self.client = None
         self.endpoint = endpoint
         self.key = key
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.client_options = _client_options(
+            connection_timeout, read_timeout, retry_total, retry_backoff_factor, retry_backoff_max, polling_interval, client_options
+        )
         self.initialize_document_intelligence_client()
 
     def initialize_document_intelligence_client(self):
@@ -23,9 +97,13 @@ class DocumentIntelligenceClientWrapper:
         Initialize the Document Intelligence Client with the given endpoint and key.
         """
         try:
+            options = dict(self.client_options)
+            if "transport" not in options:
+                options["transport"] = _requests_transport(self.pool_connections, self.pool_maxsize, self.keep_alive, options)
             self.client = DocumentIntelligenceClient(
                 endpoint=self.endpoint,
-                credential=AzureKeyCredential(self.key)
+                credential=AzureKeyCredential(self.key),
+                **options
             )
         except Exception as e:
             logging.error("Exception while initializing DocumentIntelligenceClient: %s", e)
@@ -36,3 +114,168 @@ class DocumentIntelligenceClientWrapper:
         Returns the initialized Document Intelligence Client.
         """
         return self.client
+
+    def close(self):
+        """
+        Closes the client and its underlying connections.
+        """
+        self.client.close()
+
+    def __enter__(self):
+        self.client.__enter__()
+        return self
+
+    def __exit__(self, *exc_details):
+        self.client.__exit__(*exc_details)
+
+
+# Clients shared by the threads of this process, keyed by endpoint, key and options
+_shared_clients = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _forget_shared_clients():
+    # A forked child must not use the parent's connections, so it starts with an empty registry
+    global _shared_clients_lock
+    _shared_clients.clear()
+    _shared_clients_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_shared_clients)
+
+
+def get_shared_client(endpoint: str, key: str, **options) -> DocumentIntelligenceClientWrapper:
+    """
+    Returns the process-wide client for an endpoint, key and options, creating it on first use.
+
+    Every call with the same arguments returns the same wrapper, so concurrent analyses in a process reuse
+    its pooled connections instead of each opening new TLS sessions. Child processes get clients of their own.
+
+    Args:
+        endpoint (str): The endpoint for the Azure Document Intelligence API.
+        key (str): The key for the Azure Document Intelligence API.
+        **options: The transport and client options of DocumentIntelligenceClientWrapper.
+
+    Returns:
+        DocumentIntelligenceClientWrapper: The shared wrapper.
+    """
+    registry_key = (endpoint, key, tuple(sorted((name, repr(value)) for name, value in options.items())))
+
+    with _shared_clients_lock:
+        wrapper = _shared_clients.get(registry_key)
+        if wrapper is None:
+            wrapper = DocumentIntelligenceClientWrapper(endpoint, key, **options)
+            _shared_clients[registry_key] = wrapper
+        return wrapper
+
+
+def close_shared_clients():
+    """
+    Closes and forgets every client created by get_shared_client in this process.
+    """
+    with _shared_clients_lock:
+        wrappers = list(_shared_clients.values())
+        _shared_clients.clear()
+
+    for wrapper in wrappers:
+        wrapper.close()
+
+
+def _aiohttp_transport(pool_maxsize, keep_alive, options):
+    """
+    Returns an aiohttp transport whose connection pool holds up to pool_maxsize connections.
+
+    The transport owns its session and closes it with the client. aiohttp binds a session to the running
+    event loop, so this must be called from a coroutine.
+    """
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError(
+            "The asynchronous client needs aiohttp: pip install document-intelligence-wrapper[async]"
+        ) from None
+    from azure.core.pipeline.transport import AioHttpTransport
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        raise RuntimeError("AsyncDocumentIntelligenceClientWrapper must be created inside a coroutine") from None
+
+    # The same session settings as the SDK's own transport, with a connection pool of the requested size
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=pool_maxsize, force_close=not keep_alive),
+        trust_env=options.get("use_env_settings", True),
+        cookie_jar=aiohttp.DummyCookieJar(),
+        auto_decompress=False,
+    )
+    return AioHttpTransport(
+        session=session,
+        session_owner=True,
+        **{name: options.pop(name) for name in ("connection_timeout", "read_timeout") if name in options}
+    )
+
+
+class AsyncDocumentIntelligenceClientWrapper:
+    """
+    A wrapper for the asynchronous Azure Document Intelligence Client.
+
+    The wrapper can be used as an async context manager, which closes the client's connections on exit.
+    The wrapper must be created inside a coroutine, and its client is bound to that event loop. It needs aiohttp,
+    installed with the async extra.
+
+    Attributes:
+        endpoint (str): The endpoint for the Azure Document Intelligence API.
+        key (str): The key for the Azure Document Intelligence API.
+        pool_maxsize (int): The maximum number of connections kept open. Default is 100, as in aiohttp.
+        The other options are those of DocumentIntelligenceClientWrapper.
+    """
+    def __init__(self, endpoint: str, key: str, pool_maxsize: int = 100,
+                 connection_timeout: float = None, read_timeout: float = None, keep_alive: bool = True,
+                 retry_total: int = None, retry_backoff_factor: float = None, retry_backoff_max: float = None,
+                 polling_interval: float = None, **client_options):
+        self.client = None
+        self.endpoint = endpoint
+        self.key = key
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.client_options = _client_options(
+            connection_timeout, read_timeout, retry_total, retry_backoff_factor, retry_backoff_max, polling_interval, client_options
+        )
+        self.initialize_document_intelligence_client()
+
+    def initialize_document_intelligence_client(self):
+        """
+        Initialize the asynchronous Document Intelligence Client with the given endpoint and key.
+        """
+        try:
+            options = dict(self.client_options)
+            if "transport" not in options:
+                options["transport"] = _aiohttp_transport(self.pool_maxsize, self.keep_alive, options)
+            self.client = AsyncDocumentIntelligenceClient(
+                endpoint=self.endpoint,
+                credential=AzureKeyCredential(self.key),
+                **options
+            )
+        except Exception as e:
+            logging.error("Exception while initializing async DocumentIntelligenceClient: %s", e)
+            raise
+
+    def get_document_intelligence_client(self):
+        """
+        Returns the initialized asynchronous Document Intelligence Client.
+        """
+        return self.client
+
+    async def close(self):
+        """
+        Closes the client and its underlying connections.
+        """
+        await self.client.close()
+
+    async def __aenter__(self):
+        await self.client.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_details):
+        await self.client.__aexit__(*exc_details)
@@ -0,0 +1,285 @@
+# document_intelligence_wrapper/extractors/arrow_export.py
+
+import os
+import uuid
+from array import array
+
+import numpy as np
+
+from document_intelligence_wrapper.extractors.element_model import page_entry
+
+# pyarrow is only needed to export the page elements
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("Exporting to Arrow or Parquet needs pyarrow: pip install document-intelligence-wrapper[arrow]")
+
+
+def _schemas():
+    polygon = pa.list_(pa.float64())
+    return {
+        "elements": pa.schema([
+            ("document_id", pa.string()),
+            ("page_number", pa.int32()),
+            ("element_index", pa.int32()),
+            ("element_name", pa.string()),
+            ("content", pa.string()),
+            ("polygon", polygon),
+            ("confidence_average", pa.float64()),
+            ("confidence_weighted", pa.float64()),
+        ]),
+        "tables": pa.schema([
+            ("document_id", pa.string()),
+            ("table_index", pa.int32()),
+            ("page_number", pa.int32()),
+            ("element_index", pa.int32()),
+            ("row_count", pa.int32()),
+            ("column_count", pa.int32()),
+            ("cell_count", pa.int32()),
+            ("markdown", pa.string()),
+        ]),
+        "cells": pa.schema([
+            ("document_id", pa.string()),
+            ("table_index", pa.int32()),
+            ("page_number", pa.int32()),
+            ("row_index", pa.int32()),
+            ("column_index", pa.int32()),
+            ("row_span", pa.int32()),
+            ("column_span", pa.int32()),
+            ("content", pa.string()),
+            ("polygon", polygon),
+            ("confidence_average", pa.float64()),
+            ("confidence_weighted", pa.float64()),
+        ]),
+    }
+
+
+class _ColumnBuffer:
+    """
+    Collects the rows of one dataset. Rows are tuples of the schema's columns other than polygon, and are
+    turned into columns once per batch. Polygons are kept as one flat array of coordinates with offsets,
+    which become an Arrow list column without building a Python list per row.
+    """
+    def __init__(self, schema):
+        self.schema = schema
+        self.reset()
+
+    def reset(self):
+        self.rows = []
+        self.polygon_values = array("d")
+        self.polygon_offsets = array("i", [0])
+
+    def append(self, row, polygon=None):
+        self.rows.append(row)
+        if polygon is not None:
+            self.polygon_values.extend(polygon)
+            self.polygon_offsets.append(len(self.polygon_values))
+
+    def take_batch(self):
+        """
+        Returns the collected rows as a RecordBatch and empties the buffer.
+        """
+        columns = iter(zip(*self.rows)) if self.rows else None
+        arrays = []
+        for field in self.schema:
+            if field.name == "polygon":
+                arrays.append(pa.ListArray.from_arrays(
+                    pa.array(np.frombuffer(self.polygon_offsets, dtype=np.int32)),
+                    pa.array(np.frombuffer(self.polygon_values, dtype=np.float64)),
+                ))
+            else:
+                arrays.append(pa.array(next(columns) if columns is not None else [], type=field.type))
+        batch = pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+        self.reset()
+        return batch
+
+
+def _element_values(element):
+    """
+    Returns the name, content, polygon, confidences and cells of an element dictionary or Element.
+    """
+    if isinstance(element, dict):
+        confidence = element["confidence_score"]
+        return (element["element_name"], element["content"], element["bounding_box"],
+                confidence["average"], confidence["weighted"], element.get("cells"))
+    return element.element_name, element.content, element.bounding_box, element.average, element.weighted, element.cells
+
+
+def _cell_values(cell):
+    """
+    Returns the indexes, spans, content, polygon and confidences of a cell dictionary or Cell.
+    """
+    if isinstance(cell, dict):
+        confidence = cell["confidence_score"]
+        return (cell["rowIndex"], cell["columnIndex"], cell.get("rowSpan", 1), cell.get("columnSpan", 1),
+                cell["content"], cell["bounding_box"], confidence["average"], confidence["weighted"])
+    return (cell.row_index, cell.column_index, cell.row_span, cell.column_span,
+            cell.content, cell.bounding_box, cell.average, cell.weighted)
+
+
+def _append_document(buffers, document_id, pages):
+    """
+    Adds the rows of one document to the buffers of the three datasets.
+    """
+    elements, tables, cells = buffers["elements"], buffers["tables"], buffers["cells"]
+
+    # Tables are numbered across the document as in table_text
+    table_index = 0
+    for page in pages:
+        page_number, page_elements = page_entry(page)
+        for element_index, element in enumerate(page_elements):
+            element_name, content, polygon, average, weighted, element_cells = _element_values(element)
+            elements.append((document_id, page_number, element_index, element_name, content, average, weighted), polygon or ())
+            if element_name != "table":
+                continue
+
+            table_index += 1
+            row_count = column_count = None
+            for cell in element_cells or ():
+                row_index, column_index, row_span, column_span, cell_content, cell_polygon, cell_average, cell_weighted = _cell_values(cell)
+                cells.append(
+                    (document_id, table_index, page_number, row_index, column_index, row_span, column_span,
+                     cell_content, cell_average, cell_weighted),
+                    cell_polygon or ()
+                )
+                row_count = max(row_count or 0, row_index + row_span)
+                column_count = max(column_count or 0, column_index + column_span)
+            cell_count = None if element_cells is None else len(element_cells)
+            tables.append((document_id, table_index, page_number, element_index, row_count, column_count, cell_count, content))
+
+
+def page_element_batches(document_id, pages):
+    """
+    Converts the page elements of one document into Arrow record batches.
+
+    Args:
+        document_id (str): The identifier stored in the document_id column of every row.
+        pages (iterable): The entries of all_page_elements (dictionaries or PageElements), or the PageResult
+            objects yielded by iter_page_text.
+
+    Returns:
+        dict: The "elements", "tables" and "cells" RecordBatches of the document.
+    """
+    _require_pyarrow()
+    buffers = {name: _ColumnBuffer(schema) for name, schema in _schemas().items()}
+    _append_document(buffers, document_id, pages)
+    return {name: buffer.take_batch() for name, buffer in buffers.items()}
+
+
+class ParquetExporter:
+    """
+    Writes the elements, tables and table cells of a batch of documents to Parquet files.
+
+    Rows are collected column by column and written as a row group whenever a dataset reaches batch_rows rows,
+    so memory stays bounded however many documents are added. Each dataset is written to its own directory
+    (output_dir/elements, output_dir/tables and output_dir/cells) as one part file per exporter, so later runs
+    add files next to the earlier ones and the directories can be read as Parquet datasets.
+
+    The rows of each dataset are:
+        - elements: every paragraph, table and figure, with its page, position in the page, content, polygon
+          and confidence scores.
+        - tables: every table, numbered across its document as in table_text, with its Markdown and, when cell
+          details were extracted, its row, column and cell counts.
+        - cells: every table cell, with its row and column index and span, content, polygon and confidence
+          scores. Cells are only available when the pages were extracted with calculate_cell_confidence=True.
+
+    Example:
+        with ParquetExporter("warehouse/layout") as exporter:
+            for batch_result in analyze_documents(client, paths, calculate_cell_confidence=True):
+                if batch_result.error is None:
+                    exporter.add(str(batch_result.source), batch_result.result[3])
+
+    Args:
+        output_dir (str): The directory the datasets are written to.
+        batch_rows (int): The number of rows of a dataset collected before they are written. Default is 65536.
+        compression (str): The Parquet compression codec. Default is "zstd".
+        part_name (str, optional): The file name of the parts written, without extension. Defaults to a random name.
+    """
+    def __init__(self, output_dir, batch_rows=65536, compression="zstd", part_name=None):
+        _require_pyarrow()
+        self.output_dir = output_dir
+        self.batch_rows = batch_rows
+        self.compression = compression
+        self.part_name = part_name or f"part-{uuid.uuid4().hex}"
+        self._buffers = {name: _ColumnBuffer(schema) for name, schema in _schemas().items()}
+        self._writers = {}
+
+    def add(self, document_id, pages):
+        """
+        Adds the page elements of one document, writing the datasets that reached batch_rows.
+
+        Args:
+            document_id (str): The identifier stored in the document_id column of every row.
+            pages (iterable): The entries of all_page_elements, or the PageResult objects of iter_page_text.
+        """
+        _append_document(self._buffers, document_id, pages)
+        for name, buffer in self._buffers.items():
+            if len(buffer.rows) >= self.batch_rows:
+                self._write(name)
+
+    def _write(self, name):
+        buffer = self._buffers[name]
+        writer = self._writers.get(name)
+        if writer is None:
+            dataset_dir = os.path.join(self.output_dir, name)
+            os.makedirs(dataset_dir, exist_ok=True)
+            writer = self._writers[name] = pq.ParquetWriter(
+                os.path.join(dataset_dir, self.part_name + ".parquet"), buffer.schema, compression=self.compression
+            )
+        writer.write_batch(buffer.take_batch())
+
+    def flush(self):
+        """
+        Writes the rows collected so far.
+        """
+        for name, buffer in self._buffers.items():
+            if buffer.rows:
+                self._write(name)
+
+    def close(self):
+        """
+        Writes the remaining rows and closes the files. Datasets that received no rows are not created.
+
+        Returns:
+            list: The paths of the written files.
+        """
+        self.flush()
+        paths = []
+        for writer in self._writers.values():
+            writer.close()
+            paths.append(writer.where)
+        self._writers = {}
+        return paths
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def export_parquet(documents, output_dir, batch_rows=65536, compression="zstd"):
+    """
+    Writes the page elements of a batch of documents to Parquet datasets with a ParquetExporter.
+
+    Args:
+        documents (iterable): (document_id, pages) pairs, where pages are the entries of all_page_elements.
+        output_dir (str): The directory the datasets are written to.
+        batch_rows (int): The number of rows of a dataset collected before they are written. Default is 65536.
+        compression (str): The Parquet compression codec. Default is "zstd".
+
+    Returns:
+        list: The paths of the written files.
+    """
+    exporter = ParquetExporter(output_dir, batch_rows=batch_rows, compression=compression)
+    try:
+        for document_id, pages in documents:
+            exporter.add(document_id, pages)
+    finally:
+        paths = exporter.close()
+    return paths
@@ -0,0 +1,202 @@
+# document_intelligence_wrapper/extractors/batch_extractor.py
+
+import collections
+import concurrent.futures
+import itertools
+import os
+import random
+import threading
+import time
+from typing import Any, NamedTuple
+
+from azure.core.exceptions import HttpResponseError
+
+from document_intelligence_wrapper.extractors.polling import retry_after_seconds
+from document_intelligence_wrapper.extractors.text_extractor import analyze_document_text
+
+# File extensions accepted by the prebuilt-layout model
+SUPPORTED_EXTENSIONS = (".pdf", ".jpeg", ".jpg", ".png", ".bmp", ".tif", ".tiff", ".heif", ".heic", ".docx")
+
+
+class BatchResult(NamedTuple):
+    """
+    The outcome of analyzing one document of a batch.
+
+    Attributes:
+        source: The path or stream the document was read from, as passed in, or None when the error was raised
+            while reading the sources.
+        result (tuple): The tuple returned by analyze_document_text, or None if the analysis failed.
+        error (Exception): The exception raised by the last attempt, or None on success.
+        attempts (int): The number of analysis attempts, including retries after throttling.
+    """
+    source: Any
+    result: Any
+    error: Any
+    attempts: int
+
+
+class _Throttle:
+    """
+    Holds back every worker of a batch until a Retry-After delay returned by the service has elapsed.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def defer(self, delay):
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + delay)
+
+    def wait(self):
+        while True:
+            with self._lock:
+                remaining = self._resume_at - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(remaining)
+
+
+def _analyze_with_retry(client, source, throttle, max_retries, backoff_base, backoff_max, **analyze_options):
+    """
+    Analyzes one document, retrying when the service answers with HTTP 429.
+
+    Returns:
+        BatchResult: The result of the analysis.
+    """
+    try:
+        # Remember where a stream starts so it can be rewound before a retry. Streams that cannot seek,
+        # such as pipes, cannot be sent again once read.
+        seekable = getattr(source, "seekable", None)
+        rewindable = seekable is None or seekable()
+        start_position = source.tell() if seekable is not None and rewindable else None
+    except Exception as e:
+        return BatchResult(source, None, e, 0)
+
+    for attempt in itertools.count(1):
+        throttle.wait()
+        try:
+            result = analyze_document_text(client, source, **analyze_options)
+            return BatchResult(source, result, None, attempt)
+        except HttpResponseError as e:
+            if e.status_code != 429 or attempt > max_retries or not rewindable:
+                return BatchResult(source, None, e, attempt)
+
+            delay = retry_after_seconds(e.response)
+            if delay is None:
+                # Exponential backoff with jitter when the service does not say how long to wait
+                delay = min(backoff_max, backoff_base * 2 ** (attempt - 1)) * random.uniform(0.5, 1)
+            throttle.defer(delay)
+
+            if start_position is not None:
+                source.seek(start_position)
+        except Exception as e:
+            return BatchResult(source, None, e, attempt)
+
+
+def analyze_documents(client, sources, max_concurrency=4, calculate_confidence=True, calculate_cell_confidence=False,
+                      max_retries=5, backoff_base=1.0, backoff_max=60.0, cache=None):
+    """
+    Analyzes a stream of documents with a bounded number of analyses in flight.
+
+    Results are yielded as the analyses finish, not in input order. Sources are only pulled from the iterable
+    as slots free up. A finished analysis keeps its slot until its result is handed back, and only then is a new
+    analysis submitted in its place, so that the service stays busy while the consumer handles the result.
+    At most max_concurrency analyses are therefore running or finished and waiting, on top of the result the
+    consumer is handling and any earlier results it keeps.
+
+    A failure only affects its own document: it is reported through the error attribute of the yielded result.
+    An exception raised while reading the sources is reported the same way, in a result whose source is None
+    and attempts 0, and no further sources are read.
+    Throttled requests (HTTP 429) that the client's own retry policy gives up on are retried here. The
+    delay from the Retry-After header holds back every worker of the batch, not just the throttled one.
+    Streams that cannot seek, such as pipes, are analyzed once and not retried.
+
+    Args:
+        client (DocumentIntelligenceClient): The Azure Document Intelligence client.
+        sources (iterable): File paths, in-memory documents (bytes-like objects or memory-mapped files) or binary
+            file-like objects to analyze.
+        max_concurrency (int): The maximum number of analyses in flight. Default is 4.
+        calculate_confidence (bool): Flag to calculate confidence scores for paragraphs, tables, and figures. Default is True.
+        calculate_cell_confidence (bool): Flag to calculate confidence scores for individual table cells. Default is False.
+        max_retries (int): The maximum number of retries per document after throttling. Default is 5.
+        backoff_base (float): The first backoff delay, in seconds, when no Retry-After header is returned. Default is 1.
+        backoff_max (float): The upper bound of the backoff delay, in seconds. Default is 60.
+        cache (AnalyzeResultCache, optional): A cache of raw analysis results shared by the whole batch.
+
+    Yields:
+        BatchResult: The outcome of each document, as soon as it is available.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    throttle = _Throttle()
+    sources = iter(sources)
+    in_flight = {}
+    # Finished analyses waiting to be handed back, which count against max_concurrency like those in flight
+    ready = collections.deque()
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency)
+
+    def submit_next():
+        nonlocal sources
+        if sources is None:
+            return
+        try:
+            source = next(sources)
+        except StopIteration:
+            sources = None
+            return
+        except Exception as e:
+            # An iterator that raised cannot be relied on to resume, so the batch ends after the analyses in flight
+            sources = None
+            failed = concurrent.futures.Future()
+            failed.set_result(BatchResult(None, None, e, 0))
+            ready.append(failed)
+            return
+
+        future = executor.submit(
+            _analyze_with_retry, client, source, throttle, max_retries, backoff_base, backoff_max,
+            calculate_confidence=calculate_confidence, calculate_cell_confidence=calculate_cell_confidence, cache=cache
+        )
+        in_flight[future] = source
+
+    try:
+        for _ in range(max_concurrency):
+            submit_next()
+
+        while in_flight or ready:
+            if not ready:
+                done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    del in_flight[future]
+                    ready.append(future)
+            future = ready.popleft()
+            # Keep the service busy while the consumer handles this result
+            submit_next()
+            yield future.result()
+    finally:
+        # Stop submitting if the consumer stops early; analyses already running are left to finish
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def iter_document_paths(directory, recursive=True, extensions=SUPPORTED_EXTENSIONS):
+    """
+    Lazily lists the documents of a directory, for use as the sources of analyze_documents.
+
+    Args:
+        directory (str): The directory to scan.
+        recursive (bool): Flag to also scan subdirectories. Default is True.
+        extensions (tuple): The file extensions to include, compared case-insensitively.
+
+    Yields:
+        str: The path of each matching file, in directory order.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    yield from iter_document_paths(entry.path, recursive, extensions)
+            elif entry.name.lower().endswith(extensions):
+                yield entry.path
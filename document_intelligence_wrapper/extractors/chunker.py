@@ -0,0 +1,136 @@
+# document_intelligence_wrapper/extractors/chunker.py
+
+from typing import Any, NamedTuple
+
+from document_intelligence_wrapper.extractors.element_model import page_entry
+
+
+class Chunk(NamedTuple):
+    """
+    A size-bounded run of consecutive elements, as yielded by iter_chunks.
+
+    Attributes:
+        text (str): The text of the elements, joined by the separator.
+        page_numbers (tuple): The pages the elements are on, in order of appearance.
+        elements (tuple): The (page number, element index) of each element, where the index is the element's
+            position in its page's elements. An element split across chunks appears in each of them.
+        bounding_boxes (tuple): The bounding box of each element, in the same order as elements.
+        confidence (float): The weighted confidence of the elements, averaged by text length. It is 0 when the
+            elements were extracted without confidence scores.
+    """
+    text: str
+    page_numbers: tuple
+    elements: tuple
+    bounding_boxes: tuple
+    confidence: Any
+
+
+def _element_fields(element):
+    """
+    Returns the name, content, bounding box and weighted confidence of an element dictionary or Element.
+    """
+    if isinstance(element, dict):
+        return element["element_name"], element["content"], element["bounding_box"], element["confidence_score"]["weighted"]
+    return element.element_name, element.content, element.bounding_box, element.weighted
+
+
+def _split_text(text, max_chars):
+    """
+    Splits text into pieces of at most max_chars characters, at whitespace where possible.
+    """
+    pieces = []
+    start = 0
+    while len(text) - start > max_chars:
+        end = text.rfind(" ", start + 1, start + max_chars + 1)
+        if end <= start:
+            # A single word longer than max_chars is cut where it must be
+            end = start + max_chars
+        pieces.append(text[start:end])
+        start = end + 1 if text[end:end + 1] == " " else end
+    if start < len(text):
+        pieces.append(text[start:])
+    return pieces
+
+
+class _ChunkBuilder:
+    """
+    Accumulates the pieces of the current chunk.
+    """
+    def __init__(self, separator):
+        self.separator = separator
+        self.reset()
+
+    def reset(self):
+        self.texts = []
+        self.size = 0
+        self.page_numbers = {}
+        self.elements = []
+        self.bounding_boxes = []
+        self.confidence_total = 0
+        self.weight = 0
+
+    def size_with(self, text):
+        return self.size + len(self.separator) + len(text) if self.texts else len(text)
+
+    def add(self, text, page_number, element_index, bounding_box, confidence):
+        self.size = self.size_with(text)
+        self.texts.append(text)
+        self.page_numbers[page_number] = None
+        self.elements.append((page_number, element_index))
+        self.bounding_boxes.append(bounding_box)
+        self.confidence_total += (confidence or 0) * len(text)
+        self.weight += len(text)
+
+    def build(self):
+        chunk = Chunk(
+            self.separator.join(self.texts),
+            tuple(self.page_numbers),
+            tuple(self.elements),
+            tuple(self.bounding_boxes),
+            self.confidence_total / self.weight if self.weight else 0,
+        )
+        self.reset()
+        return chunk
+
+
+def iter_chunks(pages, max_chars=2000, separator="\n\n"):
+    """
+    Packs the elements of the pages into chunks of at most max_chars characters, for retrieval or embedding.
+
+    The elements are read in a single pass in page and reading order, and each chunk is yielded as soon as the
+    next element no longer fits in it, so chunking can run on the pages of iter_page_text as they are ready.
+    Paragraphs and figures longer than max_chars are split at whitespace. Tables are never split: a table that
+    does not fit in the current chunk starts a new one, and a table longer than max_chars gets a chunk of its own.
+    Elements without text are skipped.
+
+    Args:
+        pages (iterable): The pages, as the entries of all_page_elements (dictionaries or PageElements) or the
+            PageResult objects yielded by iter_page_text.
+        max_chars (int): The largest size of a chunk's text, in characters. Default is 2000.
+        separator (str): The text placed between the elements of a chunk. Default is a blank line.
+
+    Yields:
+        Chunk: The text of each chunk, with the pages, element positions, bounding boxes and confidence of its elements.
+    """
+    if max_chars < 1:
+        raise ValueError(f"max_chars must be positive, got {max_chars!r}")
+
+    builder = _ChunkBuilder(separator)
+
+    for page in pages:
+        page_number, elements = page_entry(page)
+        for element_index, element in enumerate(elements):
+            element_name, content, bounding_box, confidence = _element_fields(element)
+            if not content:
+                continue
+            if not isinstance(bounding_box, list):
+                bounding_box = bounding_box.tolist()
+
+            pieces = [content] if element_name == "table" or len(content) <= max_chars else _split_text(content, max_chars)
+            for piece in pieces:
+                if builder.texts and builder.size_with(piece) > max_chars:
+                    yield builder.build()
+                builder.add(piece, page_number, element_index, bounding_box, confidence)
+
+    if builder.texts:
+        yield builder.build()
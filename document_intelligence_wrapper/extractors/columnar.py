@@ -0,0 +1,352 @@
+# document_intelligence_wrapper/extractors/columnar.py
+
+import gzip
+import json
+from array import array
+from typing import NamedTuple
+
+# orjson decodes the service's JSON several times faster than the standard library when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ElementColumns:
+    """
+    The content, bounding regions and spans of one type of element, stored column by column.
+
+    The bounding regions of element i are regions region_offsets[i] to region_offsets[i + 1], and the polygon
+    of region r is polygons[polygon_offsets[r]:polygon_offsets[r + 1]]. Spans are indexed the same way through
+    span_offsets. All offsets and coordinates are held in flat arrays rather than one dictionary per element.
+
+    Attributes:
+        content (list): The content of every element.
+        region_pages (array): The page number of every bounding region.
+        polygons (array): The coordinates of every bounding region polygon, one after the other.
+        span_starts (array): The offset of every span in the document content.
+        span_lengths (array): The length of every span.
+    """
+    __slots__ = ("content", "region_offsets", "region_pages", "polygon_offsets", "polygons", "span_offsets", "span_starts", "span_lengths")
+
+    def __init__(self):
+        self.content = []
+        self.region_offsets = array("q", [0])
+        self.region_pages = array("q")
+        self.polygon_offsets = array("q", [0])
+        self.polygons = array("d")
+        self.span_offsets = array("q", [0])
+        self.span_starts = array("q")
+        self.span_lengths = array("q")
+
+    def append(self, element):
+        """
+        Adds an element in the service's JSON form.
+        """
+        self.content.append(element.get("content"))
+
+        for region in element.get("boundingRegions") or ():
+            # The service always numbers the regions; page 1 is assumed otherwise, as for figures
+            self.region_pages.append(region.get("pageNumber") or 1)
+            self.polygons.extend(region.get("polygon") or ())
+            self.polygon_offsets.append(len(self.polygons))
+        self.region_offsets.append(len(self.region_pages))
+
+        for span in element.get("spans") or ():
+            self.span_starts.append(span["offset"])
+            self.span_lengths.append(span["length"])
+        self.span_offsets.append(len(self.span_starts))
+
+    def __len__(self):
+        return len(self.content)
+
+    def pages(self, index):
+        """
+        Returns the page numbers of the bounding regions of an element.
+        """
+        return self.region_pages[self.region_offsets[index]:self.region_offsets[index + 1]]
+
+    def first_page(self, index):
+        """
+        Returns the page number of the first bounding region of an element, or None if it has none.
+        """
+        region = self.region_offsets[index]
+        return self.region_pages[region] if region < self.region_offsets[index + 1] else None
+
+    def region_count(self, index):
+        return self.region_offsets[index + 1] - self.region_offsets[index]
+
+    def polygon(self, index, region=0):
+        """
+        Returns the polygon of a bounding region of an element as a flat list of x, y coordinates.
+        """
+        region += self.region_offsets[index]
+        return self.polygons[self.polygon_offsets[region]:self.polygon_offsets[region + 1]].tolist()
+
+    def bounding_regions(self, index):
+        """
+        Returns the bounding regions of an element in the service's JSON form.
+        """
+        return [
+            {"pageNumber": self.region_pages[self.region_offsets[index] + region], "polygon": self.polygon(index, region)}
+            for region in range(self.region_count(index))
+        ]
+
+    def spans(self, index):
+        """
+        Returns the spans of an element as (offset, length) pairs.
+        """
+        start, end = self.span_offsets[index], self.span_offsets[index + 1]
+        return list(zip(self.span_starts[start:end], self.span_lengths[start:end]))
+
+
+class PageWords(NamedTuple):
+    """
+    The words of one page, as used for confidence scoring.
+
+    Attributes:
+        page_number (int): The page number.
+        bounds (array or memoryview): The min_x, min_y, max_x, max_y bounds of every word, one after the other.
+        confidences (array or memoryview): The confidence of every word.
+        lengths (array or memoryview): The content length of every word.
+    """
+    page_number: int
+    bounds: array
+    confidences: array
+    lengths: array
+
+
+class ColumnarDocument:
+    """
+    A compact, columnar representation of an AnalyzeResult.
+
+    Words are reduced to their bounding box, confidence and content length, grouped by page in flat arrays.
+    Paragraphs, tables, table cells and figures are stored in ElementColumns. process_document,
+    extract_page_text and the confidence helpers read these columns directly, without going through
+    dictionaries or the SDK's models; NumPy views over the word arrays are used for scoring without copies.
+
+    Polygon coordinates are stored as floats, so they come back as floats in the outputs even when the
+    service wrote them as integers.
+
+    Attributes:
+        content (str): The content of the document.
+        page_numbers (list): The number of every page, in document order.
+        word_bounds, word_confidences, word_lengths (array): The words of all pages, one after the other.
+        paragraphs (ElementColumns): The paragraphs, with their roles in paragraph_roles.
+        tables (ElementColumns): The tables, with their row and column counts in table_row_counts and
+            table_column_counts. The cells of table i are cells table_cell_offsets[i] to table_cell_offsets[i + 1].
+        cells (ElementColumns): The table cells, with their indexes, spans and kinds in the cell_* columns.
+        figures (ElementColumns): The figures, with their ids and element references in figure_ids and figure_elements.
+        section_elements (list): The element references of every section.
+    """
+    def __init__(self):
+        self.content = ""
+        self.page_numbers = []
+        self.page_word_offsets = array("q", [0])
+        self.word_bounds = array("d")
+        self.word_confidences = array("d")
+        self.word_lengths = array("d")
+
+        self.paragraphs = ElementColumns()
+        self.paragraph_roles = []
+
+        self.tables = ElementColumns()
+        self.table_row_counts = array("q")
+        self.table_column_counts = array("q")
+        self.table_cell_offsets = array("q", [0])
+
+        self.cells = ElementColumns()
+        self.cell_row_indexes = array("q")
+        self.cell_column_indexes = array("q")
+        self.cell_row_spans = array("q")
+        self.cell_column_spans = array("q")
+        self.cell_kinds = []
+
+        self.figures = ElementColumns()
+        self.figure_ids = []
+        self.figure_elements = []
+
+        self.section_elements = []
+
+    @classmethod
+    def from_dict(cls, result):
+        """
+        Builds the columnar document from an AnalyzeResult or its JSON dictionary.
+        """
+        if hasattr(result, "as_dict"):
+            result = result.as_dict()
+
+        document = cls()
+        document.content = result.get("content") or ""
+
+        word_bounds = document.word_bounds
+        word_confidences = document.word_confidences
+        word_lengths = document.word_lengths
+        for page in result.get("pages") or ():
+            document.page_numbers.append(page.get("pageNumber"))
+            for word in page.get("words") or ():
+                polygon = word["polygon"]
+                x_coords = polygon[0::2]
+                y_coords = polygon[1::2]
+                word_bounds.extend((min(x_coords), min(y_coords), max(x_coords), max(y_coords)))
+                word_confidences.append(word["confidence"])
+                word_lengths.append(len(word["content"]))
+            document.page_word_offsets.append(len(word_confidences))
+
+        for paragraph in result.get("paragraphs") or ():
+            document.paragraphs.append(paragraph)
+            document.paragraph_roles.append(paragraph.get("role"))
+
+        for table in result.get("tables") or ():
+            document.tables.append(table)
+            document.table_row_counts.append(table.get("rowCount") or 0)
+            document.table_column_counts.append(table.get("columnCount") or 0)
+            for cell in table.get("cells") or ():
+                document.cells.append(cell)
+                document.cell_row_indexes.append(cell["rowIndex"])
+                document.cell_column_indexes.append(cell["columnIndex"])
+                document.cell_row_spans.append(cell.get("rowSpan") or 1)
+                document.cell_column_spans.append(cell.get("columnSpan") or 1)
+                document.cell_kinds.append(cell.get("kind"))
+            document.table_cell_offsets.append(len(document.cells))
+
+        for figure in result.get("figures") or ():
+            document.figures.append(figure)
+            document.figure_ids.append(figure.get("id"))
+            document.figure_elements.append(figure.get("elements") or [])
+
+        document.section_elements = [section.get("elements") or [] for section in result.get("sections") or ()]
+        return document
+
+    def page_words(self, page_index, copy=False):
+        """
+        Returns the words of the page at a position in page_numbers.
+
+        Args:
+            page_index (int): The position of the page.
+            copy (bool): Flag to return arrays of their own, which can be pickled, instead of memoryviews
+                over the document's arrays. Default is False.
+        """
+        start, end = self.page_word_offsets[page_index], self.page_word_offsets[page_index + 1]
+        columns = (
+            memoryview(self.word_bounds)[4 * start:4 * end],
+            memoryview(self.word_confidences)[start:end],
+            memoryview(self.word_lengths)[start:end],
+        )
+        if copy:
+            columns = tuple(array("d", column.tobytes()) for column in columns)
+        return PageWords(self.page_numbers[page_index], *columns)
+
+    def paragraph(self, index):
+        """
+        Returns a paragraph in the service's JSON form.
+        """
+        paragraph = {
+            "content": self.paragraphs.content[index],
+            "boundingRegions": self.paragraphs.bounding_regions(index),
+            "spans": [{"offset": offset, "length": length} for offset, length in self.paragraphs.spans(index)],
+        }
+        if self.paragraph_roles[index] is not None:
+            paragraph["role"] = self.paragraph_roles[index]
+        return paragraph
+
+    def table(self, index, cell_regions=True):
+        """
+        Returns a table in the service's JSON form, as read by table_markdown.
+
+        Args:
+            index (int): The index of the table.
+            cell_regions (bool): Flag to include the bounding regions and spans of the cells. Default is True.
+        """
+        cells = []
+        for cell_index in range(self.table_cell_offsets[index], self.table_cell_offsets[index + 1]):
+            cell = {
+                "rowIndex": self.cell_row_indexes[cell_index],
+                "columnIndex": self.cell_column_indexes[cell_index],
+                "content": self.cells.content[cell_index],
+            }
+            if self.cell_kinds[cell_index] is not None:
+                cell["kind"] = self.cell_kinds[cell_index]
+            if self.cell_row_spans[cell_index] > 1:
+                cell["rowSpan"] = self.cell_row_spans[cell_index]
+            if self.cell_column_spans[cell_index] > 1:
+                cell["columnSpan"] = self.cell_column_spans[cell_index]
+            if cell_regions:
+                cell["boundingRegions"] = self.cells.bounding_regions(cell_index)
+                cell["spans"] = [{"offset": offset, "length": length} for offset, length in self.cells.spans(cell_index)]
+            cells.append(cell)
+
+        return {
+            "rowCount": self.table_row_counts[index],
+            "columnCount": self.table_column_counts[index],
+            "cells": cells,
+            "boundingRegions": self.tables.bounding_regions(index),
+            "spans": [{"offset": offset, "length": length} for offset, length in self.tables.spans(index)],
+        }
+
+    def table_cells(self, index):
+        """
+        Returns the range of the cells of a table in the cell columns.
+        """
+        return range(self.table_cell_offsets[index], self.table_cell_offsets[index + 1])
+
+
+def loads_json(raw):
+    """
+    Decodes JSON text or bytes, with orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def decode_analyze_result(raw):
+    """
+    Decodes the raw JSON of an analysis result straight into a ColumnarDocument.
+
+    Both the bare AnalyzeResult and the service's full operation response (with an "analyzeResult" member)
+    are accepted. The decoded dictionaries are dropped once the columns are built.
+
+    Args:
+        raw (bytes or str): The JSON of the result.
+
+    Returns:
+        ColumnarDocument: The columnar document.
+    """
+    return ColumnarDocument.from_dict(_unwrap_analyze_result(loads_json(raw)))
+
+
+def _unwrap_analyze_result(result):
+    """
+    Returns the AnalyzeResult of a decoded result, which may be the service's full operation response.
+    """
+    if "analyzeResult" in result:
+        result = result["analyzeResult"]
+    return result
+
+
+def read_analyze_result(path):
+    """
+    Reads a saved analysis result from a JSON file, optionally gzip-compressed, as a plain dictionary.
+
+    The file is read, and decompressed, in full before it is decoded in one call, with orjson when it is
+    installed. Both the bare AnalyzeResult and the service's full operation response (with an "analyzeResult"
+    member) are accepted.
+
+    Args:
+        path (str): The path to the .json or .json.gz file.
+
+    Returns:
+        dict: The AnalyzeResult as a plain dictionary.
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as f:
+        raw = f.read()
+    return _unwrap_analyze_result(loads_json(raw))
+
+
+def load_columnar_document(path):
+    """
+    Loads a saved analysis result from a JSON file, optionally gzip-compressed, into a ColumnarDocument.
+    """
+    return ColumnarDocument.from_dict(read_analyze_result(path))
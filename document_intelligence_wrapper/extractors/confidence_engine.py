@@ -0,0 +1,204 @@
+# document_intelligence_wrapper/extractors/confidence_engine.py
+
+import numpy as np
+
+from document_intelligence_wrapper.extractors.columnar import ColumnarDocument, PageWords
+
+# Upper bound on the number of (element, word) pairs compared at once, to keep the containment mask small
+MAX_MASK_SIZE = 4_000_000
+
+
+def polygon_bounds_array(polygons):
+    """
+    Converts a list of polygons into an array of their bounding boxes.
+
+    Args:
+        polygons (list): A list of flat x, y coordinate lists.
+
+    Returns:
+        np.ndarray: An (n, 4) array with the min_x, min_y, max_x, max_y bounds of every polygon.
+    """
+    if not polygons:
+        return np.empty((0, 4), dtype=np.float64)
+
+    try:
+        points = np.asarray(polygons, dtype=np.float64)
+    except ValueError:
+        # Polygons with different numbers of points cannot be stacked, so reduce them one by one
+        return np.array(
+            [(min(p[0::2]), min(p[1::2]), max(p[0::2]), max(p[1::2])) for p in polygons],
+            dtype=np.float64
+        )
+
+    x_coords = points[:, 0::2]
+    y_coords = points[:, 1::2]
+    return np.column_stack((x_coords.min(axis=1), y_coords.min(axis=1), x_coords.max(axis=1), y_coords.max(axis=1)))
+
+
+class PageConfidenceEngine:
+    """
+    Scores many elements of a single page against the page's words in one vectorized pass.
+
+    Attributes:
+        boxes (np.ndarray): An (n, 4) array with the min_x, min_y, max_x, max_y bounds of every word.
+        confidences (np.ndarray): The confidence of every word.
+        lengths (np.ndarray): The content length of every word.
+    """
+    def __init__(self, boxes, confidences, lengths):
+        self.boxes = boxes
+        self.confidences = confidences
+        self.lengths = lengths
+        self.weighted_confidences = confidences * lengths
+
+    @classmethod
+    def from_words(cls, words):
+        """
+        Builds the engine from the words of a page.
+        """
+        return cls(
+            polygon_bounds_array([word['polygon'] for word in words]),
+            np.fromiter((word['confidence'] for word in words), dtype=np.float64, count=len(words)),
+            np.fromiter((len(word['content']) for word in words), dtype=np.float64, count=len(words))
+        )
+
+    @classmethod
+    def from_page_words(cls, page_words):
+        """
+        Builds the engine from the word columns of a page, as returned by ColumnarDocument.page_words,
+        using views over the arrays instead of copies.
+        """
+        return cls(
+            _float_array(page_words.bounds).reshape(-1, 4),
+            _float_array(page_words.confidences),
+            _float_array(page_words.lengths)
+        )
+
+    def score(self, polygons):
+        """
+        Calculates the simple and weighted average confidence of the words inside each polygon.
+
+        Args:
+            polygons (list): A list of flat x, y coordinate lists, one per element.
+
+        Returns:
+            list: A (simple average confidence, weighted average confidence) tuple per polygon.
+        """
+        bounds = polygon_bounds_array(polygons)
+        word_count = len(self.confidences)
+        if not len(bounds):
+            return []
+        if not word_count:
+            return [(0, 0)] * len(bounds)
+
+        counts = np.empty(len(bounds), dtype=np.int64)
+        confidence_sums = np.empty(len(bounds), dtype=np.float64)
+        weighted_sums = np.empty(len(bounds), dtype=np.float64)
+        weights = np.empty(len(bounds), dtype=np.float64)
+
+        # Compare the elements in chunks so the (elements x words) mask stays bounded on dense pages
+        chunk_size = max(1, MAX_MASK_SIZE // word_count)
+        for start in range(0, len(bounds), chunk_size):
+            chunk = bounds[start:start + chunk_size]
+            inside = (
+                (chunk[:, 0, None] <= self.boxes[:, 0]) & (chunk[:, 2, None] >= self.boxes[:, 2]) &
+                (chunk[:, 1, None] <= self.boxes[:, 1]) & (chunk[:, 3, None] >= self.boxes[:, 3])
+            ).astype(np.float64)
+
+            end = start + len(chunk)
+            counts[start:end] = inside.sum(axis=1)
+            confidence_sums[start:end] = inside @ self.confidences
+            weighted_sums[start:end] = inside @ self.weighted_confidences
+            weights[start:end] = inside @ self.lengths
+
+        # Ensure confidence scores do not exceed 1
+        simple = np.minimum(confidence_sums / np.maximum(counts, 1), 1)
+        weighted = np.minimum(weighted_sums / np.where(weights > 0, weights, 1), 1)
+
+        # Elements without words keep the default of zero confidence
+        return [
+            (simple_confidence if count else 0, weighted_confidence if weight > 0 else 0)
+            for simple_confidence, weighted_confidence, count, weight
+            in zip(simple.tolist(), weighted.tolist(), counts.tolist(), weights.tolist())
+        ]
+
+
+def _float_array(values):
+    # Arrays of doubles are wrapped without copying; an empty buffer cannot be
+    if not len(values):
+        return np.empty(0, dtype=np.float64)
+    return np.frombuffer(values, dtype=np.float64)
+
+
+def build_confidence_engines(data, page_numbers=None):
+    """
+    Builds a confidence engine for the pages of the document.
+
+    Args:
+        data (dict or ColumnarDocument): The dictionary containing all document data. Its pages may also be
+            PageWords, as in the page slices of extract_page_text.
+        page_numbers (set, optional): Restricts the engines to these page numbers. Defaults to every page.
+
+    Returns:
+        dict: A mapping of page numbers to their PageConfidenceEngine.
+    """
+    engines = {}
+
+    if isinstance(data, ColumnarDocument):
+        for page_index, page_number in enumerate(data.page_numbers):
+            if page_numbers is None or page_number in page_numbers:
+                engines[page_number] = PageConfidenceEngine.from_page_words(data.page_words(page_index))
+        return engines
+
+    for page in data.get('pages') or []:
+        if isinstance(page, PageWords):
+            if page_numbers is None or page.page_number in page_numbers:
+                engines[page.page_number] = PageConfidenceEngine.from_page_words(page)
+            continue
+        page_number = page.get('pageNumber')
+        if page_numbers is None or page_number in page_numbers:
+            engines[page_number] = PageConfidenceEngine.from_words(page.get('words') or [])
+    return engines
+
+
+def score_elements(elements, data, engines=None):
+    """
+    Scores a batch of elements, grouping them by the page of their first bounding region.
+
+    Args:
+        elements (list): Paragraph, table or cell dictionaries with boundingRegions.
+        data (dict or ColumnarDocument): The dictionary containing all document data.
+        engines (dict, optional): Prebuilt engines by page number. Engines for the pages the elements
+            sit on are built on the fly when omitted.
+
+    Returns:
+        list: A (simple average confidence, weighted average confidence) tuple per element, in input order.
+    """
+    regions = []
+    for element in elements:
+        region = element['boundingRegions'][0]
+        regions.append((region.get('pageNumber'), region['polygon']))
+    return score_regions(regions, data, engines)
+
+
+def score_regions(regions, data, engines=None):
+    """
+    Scores a batch of regions given as (page number, polygon) pairs, as score_elements does for elements.
+    """
+    polygons_by_page = {}
+    for position, (page_number, polygon) in enumerate(regions):
+        positions, polygons = polygons_by_page.setdefault(page_number, ([], []))
+        positions.append(position)
+        polygons.append(polygon)
+
+    if engines is None:
+        engines = build_confidence_engines(data, set(polygons_by_page))
+
+    scores = [(0, 0)] * len(regions)
+    for page_number, (positions, polygons) in polygons_by_page.items():
+        engine = engines.get(page_number)
+        if engine is None:
+            continue
+        for position, element_score in zip(positions, engine.score(polygons)):
+            scores[position] = element_score
+
+    return scores
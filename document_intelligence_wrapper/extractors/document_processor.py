@@ -1,69 +1,64 @@
 # document_intelligence_wrapper/extractors/document_processor.py
 
+from document_intelligence_wrapper.extractors.columnar import ColumnarDocument
+from document_intelligence_wrapper.extractors.instrumentation import stage
+
+
 def process_document(data):
     """
     Processes the document data to organize paragraphs and tables by page number 
     and track elements referenced in sections in order.
 
     Args:
-        data (dict): The structured document data containing paragraphs, tables, figures and sections.
+        data (dict or ColumnarDocument): The structured document data containing paragraphs, tables, figures and sections.
 
     Returns:
         dict: A dictionary where keys are page numbers and values are lists of element identifiers in order.
     """
-    # Create a dictionary to keep track of elements by page number
-    pages = {}
-    
-    # Create a dictionary to keep track of figure associations with paragraphs
-    figure_associations = {}
+    with stage("process_document") as current_stage:
+        pages_ordered, figure_associations = _organize_elements(data)
 
-    # Process paragraphs and store them by page
-    for i, para in enumerate(data.get("paragraphs", [])):
-        for region in para.get("boundingRegions", []):
-            page = region.get("pageNumber")
-            if page not in pages:
-                pages[page] = []
-            pages[page].append(f"paragraphs {i}")  # Track paragraphs by index
-
-    # Process tables and store them by page
-    for j, table in enumerate(data.get("tables", [])):
-        for region in table.get("boundingRegions", []):
-            page = region.get("pageNumber")
-            if page not in pages:
-                pages[page] = []
-            pages[page].append(f"tables {j}")  # Track tables by index
-        
-    # Process figures and store them by page, also capture associated paragraphs
-    for k, figure in enumerate(data.get("figures", [])):
-        polygons = []  # List to store all polygons for the current figure
-        for region in figure.get("boundingRegions", []):
-            page = region.get("pageNumber", 1)  # Default to page 1 if not present
-            if page not in pages:
-                pages[page] = []
-            polygons.append(region.get("polygon", []))  # Capture the polygon
-            
-            # Find associated paragraph numbers from the elements list
-            associated_paragraphs = []
-            for element in figure.get("elements", []):
-                if element.startswith("/paragraphs/"):
-                    para_index = element.split("/")[2]
-                    associated_paragraphs.append(int(para_index))
-            
-            # Store figure and associated paragraphs along with polygons in the figure_associations dictionary
-            figure_associations[f"figures {k}"] = {
-                "associated_paragraphs": associated_paragraphs,
-                "polygons": polygons
-            }
-            
-            pages[page].append(f"figures {k}")
-    
-    print("pages",pages)
-
-    # Track elements that are referenced in sections in order
+        # The counts are only gathered when someone is listening
+        if current_stage.recording and isinstance(data, ColumnarDocument):
+            current_stage.set("pages", len(data.page_numbers))
+            current_stage.set("words", len(data.word_confidences))
+            current_stage.set("paragraphs", len(data.paragraphs))
+            current_stage.set("tables", len(data.tables))
+            current_stage.set("cells", len(data.cells))
+            current_stage.set("figures", len(figure_associations))
+        elif current_stage.recording:
+            pages = data.get("pages") or []
+            tables = data.get("tables") or []
+            current_stage.set("pages", len(pages))
+            current_stage.set("words", sum(len(page.get("words") or []) for page in pages))
+            current_stage.set("paragraphs", len(data.get("paragraphs") or []))
+            current_stage.set("tables", len(tables))
+            current_stage.set("cells", sum(len(table.get("cells") or []) for table in tables))
+            current_stage.set("figures", len(figure_associations))
+
+    return pages_ordered, figure_associations
+
+
+def _organize_elements(data):
+    """
+    Maps each page to its elements in section order, and each figure to its associated paragraphs.
+    """
+    if isinstance(data, ColumnarDocument):
+        page_order, element_pages, figure_associations = _columnar_element_pages(data)
+        sections = data.section_elements
+    else:
+        page_order, element_pages, figure_associations = _element_pages(data)
+        sections = (section.get("elements") or [] for section in data.get("sections") or [])
+
+    # Freeze the page lists, ordered by first appearance of each page
+    for element_id, pages in element_pages.items():
+        element_pages[element_id] = sorted(pages, key=page_order.__getitem__) if len(pages) > 1 else list(pages)
+
+    # Track elements that are referenced in sections in order (dicts are used as ordered sets)
     section_elements_by_page = {}
 
-    for section in data.get("sections", []):
-        for element in section.get("elements", []):
+    for section_elements in sections:
+        for element in section_elements:
             # Check if element is a list or a string
             if isinstance(element, list):
                 _, element_type, element_index = element
@@ -71,21 +66,98 @@ def process_document(data):
                 _, element_type, element_index = element.split('/')
             else:
                 continue
-            
-            element_index = int(element_index)
-            element_id = f"{element_type} {element_index}"
-            
-            # Add element to the appropriate page if it exists there
-            for page, elements in pages.items():
-                if element_id in elements:
-                    if page not in section_elements_by_page:
-                        section_elements_by_page[page] = []
-                    if element_id not in section_elements_by_page[page]:
-                        section_elements_by_page[page].append(element_id)
+
+            element_id = f"{element_type} {int(element_index)}"
+
+            # Add element to every page it appears on
+            for page in element_pages.get(element_id, ()):
+                section_elements_by_page.setdefault(page, {})[element_id] = None
 
     # Replace the pages dict with ordered elements from sections
-    pages_ordered = {}
-    for page, elements in section_elements_by_page.items():
-        pages_ordered[page] = elements
+    pages_ordered = {page: list(elements) for page, elements in section_elements_by_page.items()}
 
     return pages_ordered, figure_associations
+
+
+def _associated_paragraphs(figure_elements):
+    # Find associated paragraph numbers from the elements list
+    return [
+        int(element.split("/")[2])
+        for element in figure_elements
+        if element.startswith("/paragraphs/")
+    ]
+
+
+def _element_pages(data):
+    """
+    Returns the order in which pages are first seen, the pages of each element and the figure associations.
+    """
+    # Keep the order in which pages are first seen, so elements spanning several pages are listed consistently
+    page_order = {}
+
+    # Map each element identifier to the pages it appears on (a dict is used as an ordered set)
+    element_pages = {}
+
+    # Create a dictionary to keep track of figure associations with paragraphs
+    figure_associations = {}
+
+    # Process paragraphs and tables and record the pages they appear on
+    for element_type in ("paragraphs", "tables"):
+        for i, element in enumerate(data.get(element_type) or []):
+            regions = element.get("boundingRegions") or []
+            if not regions:
+                continue
+            pages = element_pages.setdefault(f"{element_type} {i}", {})  # Track elements by index
+            for region in regions:
+                page = region.get("pageNumber")
+                page_order.setdefault(page, len(page_order))
+                pages[page] = None
+
+    # Process figures and record their pages, also capture associated paragraphs
+    for k, figure in enumerate(data.get("figures") or []):
+        regions = figure.get("boundingRegions") or []
+        if not regions:
+            continue
+
+        pages = element_pages.setdefault(f"figures {k}", {})
+        for region in regions:
+            page = region.get("pageNumber", 1)  # Default to page 1 if not present
+            page_order.setdefault(page, len(page_order))
+            pages[page] = None
+
+        associated_paragraphs = _associated_paragraphs(figure.get("elements") or [])
+
+        # Store figure and associated paragraphs along with all of its polygons in the figure_associations dictionary
+        figure_associations[f"figures {k}"] = {
+            "associated_paragraphs": associated_paragraphs,
+            "polygons": [region.get("polygon", []) for region in regions]
+        }
+
+    return page_order, element_pages, figure_associations
+
+
+def _columnar_element_pages(document):
+    """
+    Returns the same as _element_pages, reading the region columns of a ColumnarDocument.
+    """
+    page_order = {}
+    element_pages = {}
+    figure_associations = {}
+
+    for element_type, columns in (("paragraphs", document.paragraphs), ("tables", document.tables), ("figures", document.figures)):
+        for i in range(len(columns)):
+            region_pages = columns.pages(i)
+            if not region_pages:
+                continue
+            pages = element_pages.setdefault(f"{element_type} {i}", {})
+            for page in region_pages:
+                page_order.setdefault(page, len(page_order))
+                pages[page] = None
+
+            if element_type == "figures":
+                figure_associations[f"figures {i}"] = {
+                    "associated_paragraphs": _associated_paragraphs(document.figure_elements[i]),
+                    "polygons": [columns.polygon(i, region) for region in range(len(region_pages))]
+                }
+
+    return page_order, element_pages, figure_associations
@@ -0,0 +1,180 @@
+# document_intelligence_wrapper/extractors/document_source.py
+
+import contextlib
+import io
+import mmap
+import os
+
+# The in-memory document types, read in place rather than copied into a stream
+BUFFER_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+
+
+def is_buffer(source):
+    """
+    Returns whether a document is held in memory as a bytes-like object or a memory-mapped file.
+    """
+    return isinstance(source, BUFFER_TYPES)
+
+
+class BufferReader(io.RawIOBase):
+    """
+    A read-only, seekable binary stream over a bytes-like object or a memory-mapped file.
+
+    The buffer is read in place: only the blocks requested by read() are copied, so a document can be
+    streamed to the service, hashed or parsed without a second copy of it in memory. Closing the reader
+    releases the buffer, after which a memory-mapped file can be closed.
+
+    Args:
+        buffer (bytes, bytearray, memoryview or mmap.mmap): The document.
+    """
+    def __init__(self, buffer):
+        super().__init__()
+        self._view = memoryview(buffer).cast("B")
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def __len__(self):
+        return len(self._view)
+
+    def readinto(self, b):
+        end = min(self._position + len(b), len(self._view))
+        size = end - self._position
+        memoryview(b).cast("B")[:size] = self._view[self._position:end]
+        self._position = end
+        return size
+
+    def read(self, size=-1):
+        end = len(self._view) if size is None or size < 0 else min(self._position + size, len(self._view))
+        data = self._view[self._position:end].tobytes()
+        self._position = max(end, self._position)
+        return data
+
+    def readall(self):
+        return self.read()
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset}")
+        self._position = offset
+        return offset
+
+    def tell(self):
+        return self._position
+
+    def getbuffer(self):
+        """
+        Returns a memoryview of the whole document, without copying it.
+        """
+        return self._view
+
+    def close(self):
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+@contextlib.contextmanager
+def open_document(source):
+    """
+    Yields a seekable binary stream for a document.
+
+    Args:
+        source (str, os.PathLike, bytes-like, mmap.mmap or file-like): The document. Paths are opened and closed
+            here, in-memory documents are wrapped in a BufferReader, and streams passed in are yielded as they are,
+            left open for the caller to close.
+    """
+    if hasattr(source, "read") and not isinstance(source, mmap.mmap):
+        yield source
+    elif is_buffer(source):
+        with BufferReader(source) as reader:
+            yield reader
+    else:
+        with open(source, "rb") as f:
+            yield f
+
+
+class UploadStream(io.RawIOBase):
+    """
+    A stream over a document that stays readable after it is closed, for the body of an asynchronous request.
+
+    aiohttp closes the body of a request once it has sent it, but the client's retry policy rewinds the same
+    body and sends it again, so close() is ignored here. The document itself is closed by open_upload.
+
+    Args:
+        stream (file-like): A seekable binary stream of the document.
+    """
+    def __init__(self, stream):
+        super().__init__()
+        self._stream = stream
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return self._stream.seekable()
+
+    def readinto(self, b):
+        data = self._stream.read(len(b))
+        memoryview(b).cast("B")[:len(data)] = data
+        return len(data)
+
+    def read(self, size=-1):
+        return self._stream.read(size)
+
+    def readall(self):
+        return self._stream.read()
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        return self._stream.seek(offset, whence)
+
+    def tell(self):
+        return self._stream.tell()
+
+    def close(self):
+        pass
+
+
+@contextlib.contextmanager
+def open_upload(source):
+    """
+    Yields an UploadStream for a document sent with the asynchronous client, which can be read again when the
+    upload is retried. The document is opened and closed as by open_document.
+    """
+    with open_document(source) as f:
+        yield UploadStream(f)
+
+
+def document_length(source):
+    """
+    Returns the size in bytes of a document, from its current position for streams.
+    """
+    if is_buffer(source):
+        return memoryview(source).nbytes
+    if hasattr(source, "seek"):
+        position = source.tell()
+        size = source.seek(0, os.SEEK_END) - position
+        source.seek(position)
+        return size
+    return os.path.getsize(source)
+
+
+def content_length_headers(stream):
+    """
+    Returns the Content-Length header of an upload from a seekable stream.
+
+    aiohttp only sizes files and BytesIO objects itself and sends other streams with chunked encoding, so the
+    asynchronous client is given the length explicitly.
+    """
+    seekable = getattr(stream, "seekable", None)
+    if seekable is None or not seekable():
+        return {}
+    return {"Content-Length": str(document_length(stream))}
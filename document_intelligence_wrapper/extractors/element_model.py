@@ -0,0 +1,183 @@
+# document_intelligence_wrapper/extractors/element_model.py
+
+import json
+from array import array
+from dataclasses import dataclass
+from typing import Any, Optional
+
+# orjson serializes several times faster than the json module; it is used when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _polygon(values):
+    # Polygons are stored as a flat array of doubles: 8 bytes per coordinate instead of a float object each
+    return array('d', values or ())
+
+
+@dataclass(slots=True)
+class Cell:
+    """
+    The details of one table cell, as a compact alternative to the cell dictionaries of the element details.
+
+    Attributes:
+        row_index (int): The row of the cell.
+        column_index (int): The column of the cell.
+        content (str): The text of the cell.
+        bounding_box (array): The polygon of the cell as a flat array of coordinates.
+        average (float): The average confidence of the words in the cell.
+        weighted (float): The confidence of the words in the cell, weighted by their length.
+        row_span (int): The number of rows the cell spans.
+        column_span (int): The number of columns the cell spans.
+    """
+    row_index: int
+    column_index: int
+    content: str
+    bounding_box: array
+    average: Any
+    weighted: Any
+    row_span: int = 1
+    column_span: int = 1
+
+    @classmethod
+    def from_dict(cls, cell_details):
+        return cls(
+            cell_details["rowIndex"],
+            cell_details["columnIndex"],
+            cell_details["content"],
+            _polygon(cell_details["bounding_box"]),
+            cell_details["confidence_score"]["average"],
+            cell_details["confidence_score"]["weighted"],
+            cell_details.get("rowSpan", 1),
+            cell_details.get("columnSpan", 1),
+        )
+
+    def to_dict(self):
+        """
+        Returns the cell in the dictionary form produced by process_page. Coordinates come back as floats.
+        """
+        return {
+            "rowIndex": self.row_index,
+            "columnIndex": self.column_index,
+            "rowSpan": self.row_span,
+            "columnSpan": self.column_span,
+            "content": self.content,
+            "bounding_box": self.bounding_box.tolist(),
+            "confidence_score": {
+                "average": self.average,
+                "weighted": self.weighted
+            }
+        }
+
+
+@dataclass(slots=True)
+class Element:
+    """
+    The details of one paragraph, table or figure, as a compact alternative to the element dictionaries.
+
+    Attributes:
+        element_name (str): "paragraph", "table" or "figure".
+        content (str): The text of the element; the Markdown of a table.
+        bounding_box (array): The polygon of the element as a flat array of coordinates.
+        average (float): The average confidence of the words in the element.
+        weighted (float): The confidence of the words in the element, weighted by their length.
+        cells (tuple): The cells of a table when cell confidence was calculated, otherwise None.
+    """
+    element_name: str
+    content: str
+    bounding_box: array
+    average: Any
+    weighted: Any
+    cells: Optional[tuple] = None
+
+    @classmethod
+    def from_dict(cls, element_details):
+        cells = element_details.get("cells")
+        return cls(
+            element_details["element_name"],
+            element_details["content"],
+            _polygon(element_details["bounding_box"]),
+            element_details["confidence_score"]["average"],
+            element_details["confidence_score"]["weighted"],
+            None if cells is None else tuple(Cell.from_dict(cell) for cell in cells),
+        )
+
+    def to_dict(self):
+        """
+        Returns the element in the dictionary form produced by process_page. Coordinates come back as floats.
+        """
+        element_details = {
+            "element_name": self.element_name,
+            "content": self.content,
+            "bounding_box": self.bounding_box.tolist(),
+            "confidence_score": {
+                "average": self.average,
+                "weighted": self.weighted
+            }
+        }
+        if self.cells is not None:
+            element_details["cells"] = [cell.to_dict() for cell in self.cells]
+        return element_details
+
+
+@dataclass(slots=True)
+class PageElements:
+    """
+    The elements of one page, as a compact alternative to the entries of all_page_elements.
+
+    Attributes:
+        page_number (int): The page number.
+        elements (tuple): The Element of each paragraph, table and figure on the page, in reading order.
+    """
+    page_number: Any
+    elements: tuple
+
+    @classmethod
+    def from_dict(cls, page):
+        return cls(page["page_number"], tuple(Element.from_dict(element) for element in page["elements"]))
+
+    def to_dict(self):
+        """
+        Returns the page in the dictionary form of the entries of all_page_elements.
+        """
+        return {"page_number": self.page_number, "elements": [element.to_dict() for element in self.elements]}
+
+
+def page_entry(page):
+    """
+    Returns the page number and elements of an entry of all_page_elements.
+
+    Args:
+        page (dict, PageElements or PageResult): The page, as a dictionary entry or an object with page_number
+            and elements attributes.
+
+    Returns:
+        tuple: The page number and the page's elements.
+    """
+    if isinstance(page, dict):
+        return page["page_number"], page["elements"]
+    return page.page_number, page.elements
+
+
+def dumps_page_elements(pages):
+    """
+    Serializes all_page_elements to UTF-8 encoded JSON, in the same layout as its dictionary form.
+
+    Pages are serialized one at a time, so only one page is ever held in dictionary form. Both compact
+    PageElements and dictionary entries are accepted.
+
+    Args:
+        pages (list): The entries of all_page_elements.
+
+    Returns:
+        bytes: The JSON document.
+    """
+    if orjson is not None:
+        dumps = orjson.dumps
+    else:
+        def dumps(value):
+            return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    return b"[" + b",".join(dumps(page.to_dict() if isinstance(page, PageElements) else page) for page in pages) + b"]"
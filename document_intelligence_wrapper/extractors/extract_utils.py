@@ -1,11 +1,22 @@
 # document_intelligence_wrapper/extractors/extract_utils.py
 
-import re
-import pandas as pd
+import collections
 import concurrent.futures
-import threading
+import itertools
+import os
+import re
+from typing import Any, NamedTuple
+
+from document_intelligence_wrapper.extractors.columnar import ColumnarDocument
+from document_intelligence_wrapper.extractors.instrumentation import stage
+from document_intelligence_wrapper.extractors.markdown_renderer import render_markdown_table
+
+# The ways extract_page_text can process the pages of a document
+EXECUTION_MODES = ("threads", "processes", "serial")
 
-from document_intelligence_wrapper.extractors.helpers import calculate_cell_confidence_score,calculate_confidence_score
+# The ways the text of paragraphs, tables and figures is produced: rendered from the elements, or sliced from
+# the document's Markdown content by the elements' spans
+TEXT_ASSEMBLY_MODES = ("render", "spans")
 
 def table_markdown(table):
     """
@@ -17,10 +28,6 @@ def table_markdown(table):
     Returns:
         str: The Markdown string of the table.
     """
-    # Initialize an empty list to hold column headers and rows
-    headers = []
-    rows = []
-
     # Determine the number of rows and columns
     max_row = table['rowCount']
     max_col = table['columnCount']
@@ -28,29 +35,29 @@ def table_markdown(table):
     # Create a matrix to hold cell content
     cell_matrix = [[''] * max_col for _ in range(max_row)]
 
+    # Track the rows holding column headers while populating the matrix
+    header_row_indexes = set()
+
     # Populate the matrix with cell content based on row and column indices
     for cell in table['cells']:
         row_idx = cell['rowIndex']
         col_idx = cell['columnIndex']
         content = cell['content'].replace("\n", "")
-        
-        # Handle column span
-        if 'columnSpan' in cell and cell['columnSpan'] > 1:
+        is_column_header = 'kind' in cell and cell['kind'] == 'columnHeader'
+
+        if is_column_header:
+            header_row_indexes.add(row_idx)
+
+        # Handle column span: column headers are repeated over every spanned column
+        if is_column_header and 'columnSpan' in cell and cell['columnSpan'] > 1:
             for span in range(cell['columnSpan']):
-                if 'kind' in cell and cell['kind'] == 'columnHeader':
-                    cell_matrix[row_idx][col_idx + span] = content
-                else:
-                    cell_matrix[row_idx][col_idx + span] = content
-                    break
+                cell_matrix[row_idx][col_idx + span] = content
         else:
             cell_matrix[row_idx][col_idx] = content
 
-    # Use the provided logic to determine column headers and data rows
-    for row_idx, row in enumerate(cell_matrix):
-        if any('kind' in cell and cell['kind'] == 'columnHeader' for cell in table['cells'] if cell['rowIndex'] == row_idx):
-            headers.append(row)
-        else:
-            rows.append(row)
+    # Split the matrix into column header rows and data rows
+    headers = [row for row_idx, row in enumerate(cell_matrix) if row_idx in header_row_indexes]
+    rows = [row for row_idx, row in enumerate(cell_matrix) if row_idx not in header_row_indexes]
 
     # Flatten the headers list and remove empty strings
     final_headers = []
@@ -81,43 +88,131 @@ def table_markdown(table):
         merged_headers.append(header)
 
         # Merge the data from the merged columns
-        for row_idx in range(len(rows)):
-            merged_value = ''
-            for col in merged_cols:
-                if rows[row_idx][col].strip() != '':
-                    merged_value += rows[row_idx][col].strip() + ' '
-            merged_data[row_idx].append(merged_value.strip())
+        for row_idx, row in enumerate(rows):
+            merged_data[row_idx].append(' '.join(row[col].strip() for col in merged_cols if row[col].strip()))
 
         col_idx = merged_cols[-1] + 1
 
-    # Create a DataFrame with the headers and rows
-    merged_df = pd.DataFrame(merged_data, columns=merged_headers)
+    # Convert the headers and rows to markdown format
+    return render_markdown_table(merged_headers, merged_data)
 
-    # Remove any rows that are still empty (can happen if there are row spans or empty rows)
-    merged_df = merged_df.dropna(how='all').reset_index(drop=True)
+def score_page_elements(elements, data, calculate_cell_confidence, confidence_engines=None):
+    """
+    Calculates the confidence scores of the paragraphs and tables of a page, and optionally of their cells,
+    in a single batched pass.
 
-    # Convert the DataFrame to markdown format
-    markdown_text = merged_df.to_markdown(index=False)
-    
-    return markdown_text
+    Parameters:
+        elements (list): A list of elements (paragraphs, tables, figures) on the current page.
+        data (dict or ColumnarDocument): The dictionary containing all document data.
+        calculate_cell_confidence (bool): Flag to also score the cells of each table.
+        confidence_engines (dict, optional): A mapping of page numbers to confidence engines.
+
+    Returns:
+        tuple: A dictionary of (average, weighted) scores keyed by element, and a dictionary of per-cell
+            score lists, in the table's cell order, keyed by table element.
+    """
+    # NumPy is only loaded once confidence scores are requested
+    from document_intelligence_wrapper.extractors.confidence_engine import score_regions
+
+    columnar = isinstance(data, ColumnarDocument)
+    element_positions = {}
+    to_score = []  # The (page number, polygon) of the first bounding region of every element scored
+    cell_ranges = {}
+
+    for element in elements:
+        element_type, element_index = element.split(' ')
+        if element_type not in ('paragraphs', 'tables'):
+            continue
+        element_index = int(element_index)
+        element_positions[element] = len(to_score)
+
+        if columnar:
+            columns = data.paragraphs if element_type == 'paragraphs' else data.tables
+            to_score.append((columns.first_page(element_index), columns.polygon(element_index)))
+            if element_type == 'tables' and calculate_cell_confidence:
+                cell_indexes = data.table_cells(element_index)
+                cell_ranges[element] = (len(to_score), len(to_score) + len(cell_indexes))
+                to_score.extend((data.cells.first_page(cell), data.cells.polygon(cell)) for cell in cell_indexes)
+            continue
+
+        source = data[element_type][element_index]
+        to_score.append(_first_region(source))
+
+        if element_type == 'tables' and calculate_cell_confidence:
+            cells = source['cells']
+            cell_ranges[element] = (len(to_score), len(to_score) + len(cells))
+            to_score.extend(_first_region(cell) for cell in cells)
+
+    with stage("confidence_scoring", elements=len(element_positions), cells=len(to_score) - len(element_positions)):
+        scores = score_regions(to_score, data, confidence_engines)
+
+    element_scores = {element: scores[position] for element, position in element_positions.items()}
+    cell_scores = {element: scores[start:end] for element, (start, end) in cell_ranges.items()}
+
+    return element_scores, cell_scores
+
+def _first_region(element):
+    region = element['boundingRegions'][0]
+    return region.get('pageNumber'), region['polygon']
+
+def span_text(data, element_type, index):
+    """
+    Returns the text of an element sliced from the document content by its spans.
+
+    Parameters:
+        data (dict or ColumnarDocument): The dictionary containing all document data.
+        element_type (str): "paragraphs", "tables" or "figures".
+        index (int): The index of the element.
 
-def process_page(page_num, elements, data, figure_associations, table_text_dict, table_counter, calculate_confidence, calculate_cell_confidence):
+    Returns:
+        str: The content covered by the element's spans, joined by newlines when there are several, or None when
+            the element has no spans or the document has no content.
+    """
+    if isinstance(data, ColumnarDocument):
+        content = data.content
+        spans = getattr(data, element_type).spans(index) if content else ()
+    else:
+        content = data.get('content')
+        spans = [(span['offset'], span['length']) for span in data[element_type][index].get('spans') or ()] if content else ()
+
+    if not spans:
+        return None
+    if len(spans) == 1:
+        offset, length = spans[0]
+        return content[offset:offset + length]
+    return '\n'.join(content[offset:offset + length] for offset, length in spans)
+
+def process_page(page_num, elements, data, figure_associations, table_text_dict, table_counter, calculate_confidence, calculate_cell_confidence, confidence_engines=None,
+                 compact_elements=False, text_assembly="render"):
     """
     Processes the elements of a given page and extracts their details.
 
     Parameters:
         page_num (int): The page number being processed.
         elements (list): A list of elements (paragraphs, tables, figures) on the current page.
-        data (dict): The dictionary containing all document data.
+        data (dict or ColumnarDocument): The dictionary containing all document data.
         figure_associations (dict): A mapping of figures to associated paragraphs.
         table_text_dict (dict): A dictionary to store table content.
         table_counter (list): A list containing a single integer to give unique IDs to tables (used as a counter).
         calculate_confidence (bool): Flag to control calculation of confidence scores for elements.
         calculate_cell_confidence (bool): Flag to control calculation of confidence scores for table cells.
+        confidence_engines (dict, optional): A mapping of page numbers to confidence engines, as built by
+            build_confidence_engines. When omitted, engines for the pages in use are built on the fly.
+        compact_elements (bool): Flag to return the element details as slotted Element objects instead of dictionaries.
+        text_assembly (str): "render" (default) to build the text of tables with table_markdown and of figures from
+            their associated paragraphs, or "spans" to slice the text of every element from the document content
+            by its spans. Elements without spans are rendered.
 
     Returns:
         tuple: Contains the page number, the concatenated text of the page, and a list of element details.
     """
+    if compact_elements:
+        from document_intelligence_wrapper.extractors.element_model import Element
+
+    # Columnar documents are read through their columns; tables are rebuilt one at a time for rendering
+    columnar = isinstance(data, ColumnarDocument)
+    use_spans = text_assembly == "spans"
+
     # Initialize a list to store text for the current page
     page_text = []
     page_elements = []  # List to store JSON objects for the current page
@@ -125,6 +220,11 @@ def process_page(page_num, elements, data, figure_associations, table_text_dict,
     # Initialize a counter for tables in the current page
     local_table_counter = 0
 
+    # Score all paragraphs, tables and cells of the page in one batched pass
+    element_scores, cell_scores = {}, {}
+    if calculate_confidence:
+        element_scores, cell_scores = score_page_elements(elements, data, calculate_cell_confidence, confidence_engines)
+
     # Iterate through each element in the current page
     for element in elements:
         # Initialize a dictionary to store element details
@@ -142,14 +242,21 @@ def process_page(page_num, elements, data, figure_associations, table_text_dict,
         if 'paragraphs' in element:
             # Extract the paragraph number from the element string
             para_num = int(element.split(' ')[1])
-            # Get the paragraph content
-            para_content = data['paragraphs'][para_num]['content']
-            # Get the bounding box of the paragraph
-            para_bounding_box = data['paragraphs'][para_num]['boundingRegions'][0]['polygon']
+            para_content = span_text(data, 'paragraphs', para_num) if use_spans else None
+            if columnar:
+                if para_content is None:
+                    para_content = data.paragraphs.content[para_num]
+                para_bounding_box = data.paragraphs.polygon(para_num)
+            else:
+                # Get the paragraph content
+                if para_content is None:
+                    para_content = data['paragraphs'][para_num]['content']
+                # Get the bounding box of the paragraph
+                para_bounding_box = data['paragraphs'][para_num]['boundingRegions'][0]['polygon']
 
             # Calculate confidence if the flag is set to True
             if calculate_confidence:
-                average_confidence, weighted_confidence = calculate_confidence_score(data['paragraphs'][para_num], data)
+                average_confidence, weighted_confidence = element_scores[element]
                 element_details["confidence_score"]["average"] = average_confidence
                 element_details["confidence_score"]["weighted"] = weighted_confidence
 
@@ -165,51 +272,60 @@ def process_page(page_num, elements, data, figure_associations, table_text_dict,
         elif 'tables' in element:
             # Extract the table number from the element string
             table_num = int(element.split(' ')[1])
-            # Get the table content using a table_markdown function
-            table_content = table_markdown(data['tables'][table_num])
-            # Get the bounding box of the table
-            table_bounding_box = data['tables'][table_num]['boundingRegions'][0]['polygon']
+            # Slice the table's Markdown from the document content, or render it with table_markdown
+            table_content = span_text(data, 'tables', table_num) if use_spans else None
+            if columnar and table_content is not None and not (calculate_confidence and calculate_cell_confidence):
+                # Only the bounding box is needed, so the table is not rebuilt from its columns
+                table = None
+                table_bounding_box = data.tables.polygon(table_num)
+            else:
+                if columnar:
+                    table = data.table(table_num, cell_regions=calculate_confidence and calculate_cell_confidence)
+                else:
+                    table = data['tables'][table_num]
+                # Get the bounding box of the table
+                table_bounding_box = table['boundingRegions'][0]['polygon']
+            if table_content is None:
+                with stage("table_markdown", rows=table['rowCount'], cells=len(table['cells'])):
+                    table_content = table_markdown(table)
 
             # Calculate confidence if the flag is set to True
             if calculate_confidence:
-                average_confidence, weighted_confidence = calculate_confidence_score(data['tables'][table_num], data)
+                average_confidence, weighted_confidence = element_scores[element]
                 element_details["confidence_score"]["average"] = average_confidence
                 element_details["confidence_score"]["weighted"] = weighted_confidence
 
-                # Store table content in table_text_dict with a unique key
-                with threading.Lock():
-                    table_key = f"{page_num}_{local_table_counter}"
-                    table_text_dict[table_key] = table_content
-                    local_table_counter += 1
+                # Store table content in table_text_dict with a unique key. The key includes the page number,
+                # so workers never write the same entry and no lock is needed
+                table_key = f"{page_num}_{local_table_counter}"
+                table_text_dict[table_key] = table_content
+                local_table_counter += 1
 
                 # Add detailed cell information for the table if the cell confidence flag is set to True
                 if calculate_cell_confidence:
-                    element_details["cells"] = []
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        cell_futures = [
-                            executor.submit(calculate_cell_confidence_score, cell, data) 
-                            for cell in data['tables'][table_num]['cells']
-                        ]
-                        cell_results = []
-                        for future in concurrent.futures.as_completed(cell_futures):
-                            cell_avg_confidence, cell_weighted_confidence = future.result()
-                            cell = data['tables'][table_num]['cells'][cell_futures.index(future)]
-                            cell_details = {
-                                "rowIndex": cell["rowIndex"],
-                                "columnIndex": cell["columnIndex"],
-                                "content": cell["content"],
-                                "bounding_box": cell["boundingRegions"][0]["polygon"],
-                                "confidence_score": {
-                                    "average": cell_avg_confidence,
-                                    "weighted": cell_weighted_confidence
-                                }
+                    row_count = max([table.get('rowCount') or 0] + [cell["rowIndex"] + 1 for cell in table['cells']])
+                    column_count = max([table.get('columnCount') or 0] + [cell["columnIndex"] + 1 for cell in table['cells']])
+
+                    # Place each cell in its row-major slot, so the cells come out ordered by row and column
+                    # without sorting them afterward
+                    cell_slots = [[] for _ in range(row_count * column_count)]
+                    for cell, (cell_avg_confidence, cell_weighted_confidence) in zip(table['cells'], cell_scores[element]):
+                        cell_details = {
+                            "rowIndex": cell["rowIndex"],
+                            "columnIndex": cell["columnIndex"],
+                            "rowSpan": cell.get("rowSpan") or 1,
+                            "columnSpan": cell.get("columnSpan") or 1,
+                            "content": cell["content"],
+                            "bounding_box": cell["boundingRegions"][0]["polygon"],
+                            "confidence_score": {
+                                "average": cell_avg_confidence,
+                                "weighted": cell_weighted_confidence
                             }
-                            cell_results.append(cell_details)
-                        
-                        # Sort cells based on rowIndex and columnIndex
-                        sorted_cells = sorted(cell_results, key=lambda x: (x["rowIndex"], x["columnIndex"]))
-                        element_details["cells"].extend(sorted_cells)
-            
+                        }
+                        cell_slots[cell["rowIndex"] * column_count + cell["columnIndex"]].append(cell_details)
+
+                    element_details["cells"] = [cell_details for slot in cell_slots for cell_details in slot]
+
             # Append table content to page text
             page_text.append(table_content)
             element_details["element_name"] = "table"
@@ -224,11 +340,18 @@ def process_page(page_num, elements, data, figure_associations, table_text_dict,
             associated_paragraphs = associated_data.get('associated_paragraphs', [])
             polygons = associated_data.get('polygons', [])
 
+            figure_text = span_text(data, 'figures', int(element.split(' ')[1])) if use_spans else None
+            if figure_text is not None:
+                # The figure's Markdown from the document content, including its caption
+                fig_content = figure_text
             # Check if there are any associated paragraphs
-            if associated_paragraphs:
+            elif associated_paragraphs:
                 # If associated paragraphs are present, use the content of the first one
                 for para_index in associated_paragraphs:
-                    fig_content += data['paragraphs'][para_index]['content'] + " "
+                    if columnar:
+                        fig_content += data.paragraphs.content[para_index] + " "
+                    else:
+                        fig_content += data['paragraphs'][para_index]['content'] + " "
             else:
                 # If no associated paragraphs, use empty text
                 fig_content = ""
@@ -249,62 +372,318 @@ def process_page(page_num, elements, data, figure_associations, table_text_dict,
             page_text.append(fig_content)
 
         # Add element details to the page elements list
-        page_elements.append(element_details)
+        page_elements.append(Element.from_dict(element_details) if compact_elements else element_details)
 
     # Join the list items with a newline character
     return page_num, '\n\n'.join(page_text), page_elements
 
 
-def extract_page_text(ocr_json, page_section, figure_associations, calculate_confidence=True, calculate_cell_confidence=False):
+def page_data_slice(data, elements, figure_associations, pages_by_number, calculate_cell_confidence=False, text_assembly="render"):
+    """
+    Returns the part of the document data needed to process the elements of one page.
+
+    The slice holds only the paragraphs and tables referenced by the elements (including the paragraphs
+    associated with figures) and the pages whose words are needed for confidence scoring, converted to plain
+    dictionaries so that it can be sent to another process cheaply.
+
+    Parameters:
+        data (dict or ColumnarDocument): The dictionary containing all document data. The elements of a columnar
+            document are converted back to dictionaries, and its pages are sent as PageWords.
+        elements (list): A list of elements (paragraphs, tables, figures) on the page.
+        figure_associations (dict): A mapping of figures to associated paragraphs.
+        pages_by_number (dict): A mapping of page numbers to the document's page entries.
+        calculate_cell_confidence (bool): Flag to also include the pages the table cells sit on.
+        text_assembly (str): With "spans", the slice also holds the figures of the page and a "content" made of
+            only the spans of its elements, with their span offsets rebased onto it.
+
+    Returns:
+        dict: A document-like dictionary with "paragraphs", "tables" and "figures" keyed by their index, and "pages".
+    """
+    paragraphs = {}
+    tables = {}
+    figures = {}
+    page_numbers = set()
+
+    if isinstance(data, ColumnarDocument):
+        paragraph, table = data.paragraph, data.table
+    else:
+        paragraph = lambda index: _as_plain_dict(data['paragraphs'][index])
+        table = lambda index: _as_plain_dict(data['tables'][index])
+
+    for element in elements:
+        element_type, element_index = element.split(' ')
+        element_index = int(element_index)
+
+        if element_type == 'paragraphs':
+            source = paragraphs[element_index] = paragraph(element_index)
+        elif element_type == 'tables':
+            source = tables[element_index] = table(element_index)
+            if calculate_cell_confidence:
+                page_numbers.update(cell['boundingRegions'][0].get('pageNumber') for cell in source['cells'])
+        else:
+            for para_index in figure_associations.get(element, {}).get('associated_paragraphs', []):
+                paragraphs[para_index] = paragraph(para_index)
+            if text_assembly == "spans":
+                if isinstance(data, ColumnarDocument):
+                    spans = [{'offset': offset, 'length': length} for offset, length in data.figures.spans(element_index)]
+                else:
+                    spans = [_as_plain_dict(span) for span in data['figures'][element_index].get('spans') or ()]
+                figures[element_index] = {'spans': spans}
+            continue
+
+        page_numbers.add(source['boundingRegions'][0].get('pageNumber'))
+
+    pages = [_as_plain_dict(pages_by_number[page]) for page in page_numbers if page in pages_by_number]
+
+    page_slice = {'paragraphs': paragraphs, 'tables': tables, 'figures': figures, 'pages': pages}
+    if text_assembly == "spans":
+        content = data.content if isinstance(data, ColumnarDocument) else data.get('content')
+        if content:
+            page_slice['content'] = _rebase_spans(content, (paragraphs, tables, figures))
+    return page_slice
+
+
+def _rebase_spans(content, element_groups):
+    """
+    Returns the content covered by the spans of the elements, rewriting their spans to point into it.
+
+    The elements are given new span lists, so the dictionaries of the document itself are left untouched.
+    """
+    pieces = []
+    position = 0
+    for elements in element_groups:
+        for index, element in elements.items():
+            spans = []
+            for span in element.get('spans') or ():
+                offset, length = span['offset'], span['length']
+                pieces.append(content[offset:offset + length])
+                spans.append({'offset': position, 'length': length})
+                position += length
+            elements[index] = dict(element, spans=spans)
+    return ''.join(pieces)
+
+
+def _as_plain_dict(value):
+    # Azure SDK models expose their underlying JSON through as_dict()
+    return value.as_dict() if hasattr(value, 'as_dict') else value
+
+
+def process_page_task(page_num, elements, data, figure_associations, calculate_confidence, calculate_cell_confidence, confidence_engines=None,
+                       compact_elements=False, text_assembly="render"):
     """
-    Extracts text from each page of the document and processes elements using multi-threading.
+    Runs process_page with a table dictionary of its own, so that pages can be processed in any executor.
+
+    The arguments are those of process_page, without the table dictionary and counter. The tables of the page
+    are keyed by their order on the page; number_page_tables numbers them across the document.
+
+    Returns:
+        tuple: The page number, the page text, the page elements and the tables of the page.
+    """
+    page_tables = {}
+    with stage("process_page", page_number=page_num, elements=len(elements)):
+        page_num, page_text, page_elements = process_page(
+            page_num, elements, data, figure_associations, page_tables, [1],
+            calculate_confidence, calculate_cell_confidence, confidence_engines, compact_elements, text_assembly
+        )
+    return page_num, page_text, page_elements, page_tables
+
+
+class PageResult(NamedTuple):
+    """
+    The output of one page, as yielded by iter_page_text.
+
+    Attributes:
+        page_number (int): The page number.
+        text (str): The text of the page.
+        tables (dict): The Markdown of the page's tables, keyed by their document-wide number ("1", "2", ...).
+        elements (list): The details of each element on the page.
+    """
+    page_number: Any
+    text: str
+    tables: dict
+    elements: list
+
+
+def iter_page_text(ocr_json, page_section, figure_associations, calculate_confidence=True, calculate_cell_confidence=False,
+                   execution_mode="threads", max_workers=None, executor=None, compact_elements=False, text_assembly="render"):
+    """
+    Processes the pages of the document and yields each page's output in page order as soon as it is ready.
+
+    A page is yielded once it and every page before it have been processed, so downstream work can start on
+    the first pages while later ones are still running. At most twice as many pages as there are workers are
+    processed or waiting to be consumed at a time, which keeps memory flat for long documents.
 
     Parameters:
-        ocr_json (dict): The dictionary containing all document data.
+        ocr_json (dict or ColumnarDocument): The dictionary containing all document data, or its columnar form
+            (see columnar.decode_analyze_result).
         page_section (dict): A dictionary mapping each page number to its list of elements.
         figure_associations (dict): A mapping of figures to associated paragraphs.
         calculate_confidence (bool): Flag to control calculation of confidence scores for elements.
         calculate_cell_confidence (bool): Flag to control calculation of confidence scores for table cells.
+        execution_mode (str): How pages are processed:
+            - "threads" (default): in a thread pool sharing the document data.
+            - "processes": in a process pool. Each task is sent only its page's slice of the data (see
+              page_data_slice), so page processing scales with CPU cores.
+            - "serial": one page after the other in the calling thread, as the pages are consumed.
+        max_workers (int, optional): The number of workers of the pool created for "threads" or "processes".
+        executor (concurrent.futures.Executor, optional): An existing executor to run the pages on instead of
+            creating a pool, for example to reuse one process pool across documents. Page slices are sent to
+            it when execution_mode is "processes".
+        compact_elements (bool): Flag to return the element details as slotted Element objects (see
+            element_model) instead of dictionaries, which takes several times less memory. Default is False.
+        text_assembly (str): How the text of the elements is produced:
+            - "render" (default): tables are rendered with table_markdown and figures are given the text of
+              their associated paragraphs.
+            - "spans": the text of every paragraph, table and figure is sliced from the document's Markdown
+              content by the element's spans, which skips rendering the tables. Tables keep the service's
+              Markdown, and figures get their whole Markdown including the caption. Elements without spans,
+              or documents without content, fall back to rendering.
+
+    Yields:
+        PageResult: The text, tables and element details of each page.
+    """
+    if execution_mode not in EXECUTION_MODES:
+        raise ValueError(f"execution_mode must be one of {EXECUTION_MODES}, got {execution_mode!r}")
+    if text_assembly not in TEXT_ASSEMBLY_MODES:
+        raise ValueError(f"text_assembly must be one of {TEXT_ASSEMBLY_MODES}, got {text_assembly!r}")
+
+    page_numbers = sorted(page_section)
+
+    if execution_mode == "processes":
+        # Each worker builds the confidence engines of its own pages from its slice
+        if isinstance(ocr_json, ColumnarDocument):
+            pages_by_number = {
+                page_number: ocr_json.page_words(page_index, copy=True) for page_index, page_number in enumerate(ocr_json.page_numbers)
+            }
+        else:
+            pages_by_number = {page.get('pageNumber'): page for page in ocr_json.get('pages') or []}
+        tasks = (
+            (page_num, page_section[page_num],
+             page_data_slice(ocr_json, page_section[page_num], figure_associations, pages_by_number, calculate_confidence and calculate_cell_confidence,
+                             text_assembly),
+             {element: figure_associations[element] for element in page_section[page_num] if element in figure_associations},
+             calculate_confidence, calculate_cell_confidence, None, compact_elements, text_assembly)
+            for page_num in page_numbers
+        )
+    else:
+        # Convert each page's words into arrays once so every page can be scored in a vectorized pass
+        confidence_engines = None
+        if calculate_confidence:
+            from document_intelligence_wrapper.extractors.confidence_engine import build_confidence_engines
+            confidence_engines = build_confidence_engines(ocr_json)
+
+        tasks = (
+            (page_num, page_section[page_num], ocr_json, figure_associations, calculate_confidence, calculate_cell_confidence, confidence_engines,
+             compact_elements, text_assembly)
+            for page_num in page_numbers
+        )
+
+    max_in_flight = 2 * (max_workers or os.cpu_count() or 1)
+
+    if execution_mode == "serial" and executor is None:
+        yield from number_page_tables(process_page_task(*task) for task in tasks)
+    elif executor is not None:
+        yield from number_page_tables(_ordered_page_results(executor, tasks, max_in_flight))
+    else:
+        pool_class = concurrent.futures.ProcessPoolExecutor if execution_mode == "processes" else concurrent.futures.ThreadPoolExecutor
+        with pool_class(max_workers=max_workers) as pool:
+            yield from number_page_tables(_ordered_page_results(pool, tasks, max_in_flight))
+
+
+def _ordered_page_results(executor, tasks, max_in_flight):
+    """
+    Runs the page tasks with at most max_in_flight of them submitted at a time, yielding their results in task order.
+    """
+    tasks = iter(tasks)
+    pending = collections.deque(executor.submit(process_page_task, *task) for task in itertools.islice(tasks, max_in_flight))
+
+    try:
+        while pending:
+            result = pending.popleft().result()
+            # Keep the workers busy while the consumer handles this page
+            for task in itertools.islice(tasks, 1):
+                pending.append(executor.submit(process_page_task, *task))
+            yield result
+    finally:
+        # Stop the remaining pages if the consumer stops early
+        for future in pending:
+            future.cancel()
+
+
+def number_page_tables(results):
+    """
+    Renames the tables of the page results, in page order, with a document-wide sequence.
+
+    Args:
+        results (iterable): The (page number, page text, page elements, page tables) tuples of process_page_task,
+            in page order.
+
+    Yields:
+        PageResult: The output of each page, with its tables keyed "1", "2", ... across the document.
+    """
+    table_counter = 0
+    for page_num, page_text, page_elements, page_tables in results:
+        tables = {}
+        for key in sorted(page_tables, key=lambda x: int(x.split('_')[1])):
+            table_counter += 1
+            tables[str(table_counter)] = page_tables[key]
+        yield PageResult(page_num, page_text, tables, page_elements)
+
+
+def extract_page_text(ocr_json, page_section, figure_associations, calculate_confidence=True, calculate_cell_confidence=False,
+                      execution_mode="threads", max_workers=None, executor=None, include_full_text=True, compact_elements=False,
+                      text_assembly="render"):
+    """
+    Extracts text from each page of the document and processes elements in parallel.
+
+    This collects the output of iter_page_text for the whole document; use iter_page_text directly to
+    consume pages as they are ready.
+
+    Parameters:
+        ocr_json (dict or ColumnarDocument): The dictionary containing all document data, or its columnar form.
+        page_section (dict): A dictionary mapping each page number to its list of elements.
+        figure_associations (dict): A mapping of figures to associated paragraphs.
+        calculate_confidence (bool): Flag to control calculation of confidence scores for elements.
+        calculate_cell_confidence (bool): Flag to control calculation of confidence scores for table cells.
+        execution_mode (str): "threads" (default), "processes" or "serial", as for iter_page_text.
+        max_workers (int, optional): The number of workers of the pool created for "threads" or "processes".
+        executor (concurrent.futures.Executor, optional): An existing executor to run the pages on.
+        include_full_text (bool): Flag to build the combined full document text. When False, None is
+            returned in its place. Default is True.
+        compact_elements (bool): Flag to return all_page_elements as a list of slotted PageElements objects
+            (see element_model) instead of dictionaries. Their to_dict() gives back the dictionary form.
+        text_assembly (str): "render" (default) or "spans", as for iter_page_text.
 
     Returns:
         tuple: Contains dictionaries of page text and table text, the combined full document text, and a list of all page elements.
     """
+    if compact_elements:
+        from document_intelligence_wrapper.extractors.element_model import PageElements
+
     # Initialize dictionaries and variables to store the text of each page, tables, and full document
     page_text_dict = {}
     table_text_dict = {}
     all_page_elements = []  # List to store JSON objects for all pages
 
-    # Table counter to give unique IDs to tables
-    table_counter = [1]  # Using a list to mutate the counter across threads
-
-    # Use ThreadPoolExecutor to process each page in parallel
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        # Pass arguments to the process_page function using a list of futures
-        future_to_page = {
-            executor.submit(process_page, page_num, elements, ocr_json, figure_associations, table_text_dict, table_counter, calculate_confidence, calculate_cell_confidence): page_num 
-            for page_num, elements in page_section.items()
-        }
-
-        # Process the results as they complete
-        for future in concurrent.futures.as_completed(future_to_page):
-            page_num, page_text, page_elements = future.result()
-            page_text_dict[page_num] = page_text
-            all_page_elements.append({"page_number": page_num, "elements": page_elements})
-
-    # Sort page_text_dict by page number
-    sorted_page_text_dict = dict(sorted(page_text_dict.items()))
-
-    # Renaming tables with a simple sequence
-    sorted_table_text_dict = {}
-    global_table_counter = 1  # Initialize a global table counter
-    for key in sorted(table_text_dict.keys(), key=lambda x: (int(x.split('_')[0]), int(x.split('_')[1]))):
-        sorted_table_text_dict[str(global_table_counter)] = table_text_dict[key]
-        global_table_counter += 1
+    # Pages come out in page order, with their tables already numbered across the document
+    with stage("extract_page_text", execution_mode=execution_mode) as current_stage:
+        for page in iter_page_text(ocr_json, page_section, figure_associations, calculate_confidence, calculate_cell_confidence,
+                                   execution_mode=execution_mode, max_workers=max_workers, executor=executor,
+                                   compact_elements=compact_elements, text_assembly=text_assembly):
+            page_text_dict[page.page_number] = page.text
+            table_text_dict.update(page.tables)
+            if compact_elements:
+                all_page_elements.append(PageElements(page.page_number, tuple(page.elements)))
+            else:
+                all_page_elements.append({"page_number": page.page_number, "elements": page.elements})
 
-    # Create full_doc_text_combined from the sorted page_text_dict
-    full_doc_text_combined = '\n\n'.join(f"Page Number {page_number}\n{text}" for page_number, text in sorted(sorted_page_text_dict.items()))
+        current_stage.set("pages", len(page_text_dict))
+        current_stage.set("tables", len(table_text_dict))
 
-    # Sort all_page_elements by page_number
-    all_page_elements_sorted = sorted(all_page_elements, key=lambda x: x["page_number"])
+    # Create full_doc_text_combined from the page text, if requested
+    full_doc_text_combined = None
+    if include_full_text:
+        with stage("assembly", pages=len(page_text_dict)):
+            full_doc_text_combined = '\n\n'.join(f"Page Number {page_number}\n{text}" for page_number, text in page_text_dict.items())
 
-    return sorted_page_text_dict, sorted_table_text_dict, full_doc_text_combined, all_page_elements_sorted
+    return page_text_dict, table_text_dict, full_doc_text_combined, all_page_elements
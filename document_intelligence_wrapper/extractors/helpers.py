@@ -1,26 +1,64 @@
 
 # document_intelligence_wrapper/extractors/helpers.py
 
-def calculate_confidence_score(paragraph, data):
+from document_intelligence_wrapper.extractors.columnar import ColumnarDocument
+
+
+def polygon_bounds(polygon):
     """
-    Calculate both the simple average and weighted average confidence scores for a given paragraph.
-    
-    :param paragraph: A dictionary containing the paragraph's content and boundingRegions.
-    :param data: A dictionary containing data including words and other paragraphs.
-    :return: A tuple of (simple average confidence, weighted average confidence).
+    Returns the (min_x, min_y, max_x, max_y) bounding box of a flat list of x, y coordinates.
     """
-    # Get the polygon of the current paragraph
-    para_polygon = paragraph['boundingRegions'][0]['polygon']
-    words_in_paragraph = []
+    x_coords = polygon[0::2]
+    y_coords = polygon[1::2]
+    return min(x_coords), min(y_coords), max(x_coords), max(y_coords)
 
-    # Iterate over each word in the data to check if it belongs to the current paragraph
+
+def _words_in_region(element, data):
+    """
+    Returns the (confidence, content length) pairs of the words inside the element's first bounding region.
+
+    Only the words of the page the region lies on are considered.
+    """
+    region = element['boundingRegions'][0]
+    element_polygon = region['polygon']
+    page_number = region.get('pageNumber')
+    words_in_element = []
+
+    if isinstance(data, ColumnarDocument):
+        if page_number not in data.page_numbers:
+            return words_in_element
+        page_words = data.page_words(data.page_numbers.index(page_number))
+        min_x, min_y, max_x, max_y = polygon_bounds(element_polygon)
+        bounds = page_words.bounds
+        for word_idx, (confidence, length) in enumerate(zip(page_words.confidences, page_words.lengths)):
+            if (min_x <= bounds[4 * word_idx] and max_x >= bounds[4 * word_idx + 2] and
+                    min_y <= bounds[4 * word_idx + 1] and max_y >= bounds[4 * word_idx + 3]):
+                words_in_element.append((confidence, int(length)))
+        return words_in_element
+
+    # Iterate over the words of the element's page to check if they belong to the current element
     for page in data['pages']:
-        for word in page['words']:
+        if page.get('pageNumber') != page_number:
+            continue
+        for word in page.get('words') or []:
             word_polygon = word['polygon']
 
-            # Check if word polygon is within paragraph polygon
-            if is_polygon_inside(para_polygon, word_polygon):
-                words_in_paragraph.append((word['confidence'], len(word['content'])))
+            # Check if word polygon is within element polygon
+            if is_polygon_inside(element_polygon, word_polygon):
+                words_in_element.append((word['confidence'], len(word['content'])))
+
+    return words_in_element
+
+
+def calculate_confidence_score(paragraph, data):
+    """
+    Calculate both the simple average and weighted average confidence scores for a given paragraph.
+    
+    :param paragraph: A dictionary containing the paragraph's content and boundingRegions, such as ColumnarDocument.paragraph returns.
+    :param data: A dictionary containing data including words and other paragraphs, or a ColumnarDocument.
+    :return: A tuple of (simple average confidence, weighted average confidence).
+    """
+    words_in_paragraph = _words_in_region(paragraph, data)
 
     # Calculate the simple average confidence score
     if words_in_paragraph:
@@ -66,20 +104,10 @@ def calculate_cell_confidence_score(cell, data):
     Calculate both the simple average and weighted average confidence scores for a given cell.
     
     :param cell: A dictionary containing the cell's content and boundingRegions.
-    :param data: A dictionary containing data including words and other paragraphs.
+    :param data: A dictionary containing data including words and other paragraphs, or a ColumnarDocument.
     :return: A tuple of (simple average confidence, weighted average confidence).
     """
-    cell_polygon = cell['boundingRegions'][0]['polygon']
-    words_in_cell = []
-
-    # Iterate over each word in the data to check if it belongs to the current cell
-    for page in data['pages']:
-        for word in page['words']:
-            word_polygon = word['polygon']
-
-            # Check if word polygon is within cell polygon
-            if is_polygon_inside(cell_polygon, word_polygon):
-                words_in_cell.append((word['confidence'], len(word['content'])))
+    words_in_cell = _words_in_region(cell, data)
 
     # Calculate the simple average confidence score
     if words_in_cell:
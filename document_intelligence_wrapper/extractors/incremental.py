@@ -0,0 +1,243 @@
+# document_intelligence_wrapper/extractors/incremental.py
+
+import concurrent.futures
+import hashlib
+import io
+import logging
+
+from document_intelligence_wrapper.extractors.document_processor import process_document
+from document_intelligence_wrapper.extractors.document_source import open_document
+from document_intelligence_wrapper.extractors.extract_utils import number_page_tables, process_page_task
+from document_intelligence_wrapper.extractors.page_ranges import merge_analyze_results
+from document_intelligence_wrapper.extractors.text_extractor import MODEL_ID, analyze_range
+
+# pypdf is needed to fingerprint and split the pages of a document
+try:
+    from pypdf import PdfReader, PdfWriter
+    from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject, StreamObject
+except ImportError:
+    PdfReader = None
+
+# Page attributes that may be inherited from the page tree
+_INHERITABLE_ATTRIBUTES = ("/Resources", "/MediaBox", "/CropBox", "/Rotate")
+
+# Entries that point back into the document or depend on the position of the page, rather than on its content
+_POSITIONAL_KEYS = {"/Parent", "/P", "/StructParent", "/StructParents", "/Length", "/Filter", "/DecodeParms"}
+
+
+def _require_pypdf():
+    if PdfReader is None:
+        raise ImportError("Incremental processing needs pypdf to fingerprint and split pages: pip install document-intelligence-wrapper[pdf]")
+
+
+def page_fingerprints(source):
+    """
+    Returns a content fingerprint for every page of a PDF document.
+
+    A fingerprint covers everything that is drawn on the page: its content streams, resources (fonts, images,
+    forms) and geometry. It does not depend on where the page is in the document, so a page keeps its
+    fingerprint when pages are inserted or removed before it.
+
+    Args:
+        source (str, bytes-like, mmap or file-like): The file path to the PDF, the PDF in memory, or a seekable
+            binary file-like object.
+
+    Returns:
+        list: The SHA-256 hex digest of each page, in page order.
+    """
+    _require_pypdf()
+
+    with open_document(source) as f:
+        reader = PdfReader(f)
+        # Resources are usually shared between pages, so each object is only hashed once
+        memo = {}
+        return [_page_fingerprint(page, memo) for page in reader.pages]
+
+
+def _page_fingerprint(page, memo):
+    digest = hashlib.sha256()
+    for key in _INHERITABLE_ATTRIBUTES:
+        digest.update(key.encode())
+        _update_digest(_inherited_attribute(page, key), digest, memo, set())
+    _update_digest(page, digest, memo, set(), is_page=True)
+    return digest.hexdigest()
+
+
+def _inherited_attribute(page, key):
+    node = page
+    while node is not None:
+        if key in node:
+            return node[key]
+        parent = node.get("/Parent")
+        node = parent.get_object() if parent is not None else None
+    return None
+
+
+def _update_digest(value, digest, memo, in_progress, is_page=False):
+    """
+    Feeds a PDF object into the digest, resolving indirect references without depending on object numbers.
+    """
+    if isinstance(value, IndirectObject):
+        reference = (value.idnum, value.generation)
+        if reference in in_progress:
+            digest.update(b"<cycle>")
+            return
+        if reference not in memo:
+            in_progress.add(reference)
+            object_digest = hashlib.sha256()
+            _update_digest(value.get_object(), object_digest, memo, in_progress)
+            in_progress.discard(reference)
+            memo[reference] = object_digest.digest()
+        digest.update(memo[reference])
+        return
+
+    if isinstance(value, DictionaryObject):
+        if not is_page and value.get("/Type") == "/Page":
+            # Links and outlines may point to other pages, whose content is not part of this page
+            digest.update(b"<page>")
+            return
+        digest.update(b"<<")
+        for key in sorted(value):
+            if key in _POSITIONAL_KEYS:
+                continue
+            digest.update(key.encode())
+            _update_digest(value.raw_get(key), digest, memo, in_progress)
+        digest.update(b">>")
+        if isinstance(value, StreamObject):
+            digest.update(value.get_data())
+        return
+
+    if isinstance(value, ArrayObject):
+        digest.update(b"[")
+        for item in value:
+            _update_digest(item, digest, memo, in_progress)
+        digest.update(b"]")
+        return
+
+    digest.update(type(value).__name__.encode() + repr(value).encode())
+
+
+def _single_page_pdf(reader, page_index):
+    """
+    Returns a PDF document holding only the given page.
+    """
+    writer = PdfWriter()
+    writer.add_page(reader.pages[page_index])
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
+def _page_keys(cache, fingerprint, calculate_confidence, calculate_cell_confidence):
+    """
+    Returns the cache keys of a page's analysis result and of its processed output.
+    """
+    from azure.ai.documentintelligence.models import ContentFormat
+
+    result_key = cache.make_key(fingerprint, MODEL_ID, ContentFormat.MARKDOWN, scope="page")
+    output_key = cache.make_key(
+        fingerprint, MODEL_ID, ContentFormat.MARKDOWN, scope="page_output",
+        calculate_confidence=calculate_confidence, calculate_cell_confidence=calculate_cell_confidence
+    )
+    return result_key, output_key
+
+
+def _process_single_page(page_result, calculate_confidence, calculate_cell_confidence):
+    """
+    Runs the post-processing on the analysis result of a single page.
+
+    Returns:
+        list: The page text, the page elements and the page tables, or None if the page has no elements.
+    """
+    page_section, figure_associations = process_document(page_result)
+    if not page_section:
+        return None
+
+    (page_num, elements), = page_section.items()
+    _, page_text, page_elements, page_tables = process_page_task(
+        page_num, elements, page_result, figure_associations, calculate_confidence, calculate_cell_confidence
+    )
+    # Table keys only need to keep their order on the page
+    return [page_text, page_elements, {f"0_{key.split('_')[1]}": value for key, value in page_tables.items()}]
+
+
+def analyze_document_incremental(client, file_path, cache, calculate_confidence: bool = True, calculate_cell_confidence: bool = False,
+                                 max_concurrency: int = 4) -> tuple:
+    """
+    Analyzes a PDF document page by page, reusing the cached results of pages that did not change.
+
+    Every page is fingerprinted from its content (see page_fingerprints). Both the analysis result and the
+    processed output of each page are cached under its fingerprint, so when a revised version of a document is
+    analyzed, only the new or changed pages are sent to the service and post-processed. The pages are then
+    stitched back into the usual outputs.
+
+    Each page is sent to the service as a single-page PDF, so every page is analyzed on its own: a table that
+    continues over a page break comes out as one table per page.
+
+    Args:
+        client (DocumentIntelligenceClient): The Azure Document Intelligence client.
+        file_path (str, bytes-like, mmap or file-like): The file path to the PDF, the PDF in memory, or a seekable
+            binary file-like object.
+        cache (AnalyzeResultCache): The cache holding the per-page results.
+        calculate_confidence (bool): Flag to calculate confidence scores for paragraphs, tables, and figures. Default is True.
+        calculate_cell_confidence (bool): Flag to calculate confidence scores for individual table cells. Default is False.
+        max_concurrency (int): The maximum number of pages analyzed at a time. Default is 4.
+
+    Returns:
+        tuple: The same tuple as analyze_document_text. The OCR result is the merge of the per-page results.
+    """
+    from azure.ai.documentintelligence.models import AnalyzeResult
+
+    _require_pypdf()
+
+    fingerprints = page_fingerprints(file_path)
+    keys = [_page_keys(cache, fingerprint, calculate_confidence, calculate_cell_confidence) for fingerprint in fingerprints]
+
+    page_results = [cache.get(result_key) for result_key, _ in keys]
+    changed_pages = [page_index for page_index, page_result in enumerate(page_results) if page_result is None]
+    logging.info("Analyzing %d of %d pages", len(changed_pages), len(fingerprints))
+
+    if changed_pages:
+        with open_document(file_path) as f:
+            reader = PdfReader(f)
+            page_documents = {page_index: _single_page_pdf(reader, page_index) for page_index in changed_pages}
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_concurrency, len(changed_pages))) as executor:
+            futures = {
+                executor.submit(analyze_range, client, page_documents.pop(page_index)): page_index
+                for page_index in changed_pages
+            }
+            for future in concurrent.futures.as_completed(futures):
+                page_index = futures[future]
+                page_results[page_index] = future.result().as_dict()
+                cache.put(keys[page_index][0], page_results[page_index])
+
+    # Post-process the pages whose output is not cached yet
+    page_outputs = []
+    for page_result, (_, output_key) in zip(page_results, keys):
+        cached = cache.get(output_key)
+        if cached is None:
+            cached = {"output": _process_single_page(page_result, calculate_confidence, calculate_cell_confidence)}
+            cache.put(output_key, cached)
+        page_outputs.append(cached["output"])
+
+    # Stitch the pages together, numbering them by their position in this version of the document
+    stitched_pages = number_page_tables(
+        (page_number, output[0], output[1], output[2])
+        for page_number, output in enumerate(page_outputs, start=1)
+        if output is not None
+    )
+
+    page_text = {}
+    table_text = {}
+    all_page_elements = []
+    for page in stitched_pages:
+        page_text[page.page_number] = page.text
+        table_text.update(page.tables)
+        all_page_elements.append({"page_number": page.page_number, "elements": page.elements})
+
+    doc_text = '\n\n'.join(f"Page Number {page_number}\n{text}" for page_number, text in page_text.items())
+
+    ocr_result = AnalyzeResult(merge_analyze_results(page_results, first_page_numbers=list(range(1, len(page_results) + 1))))
+
+    return page_text, table_text, doc_text, all_page_elements, ocr_result
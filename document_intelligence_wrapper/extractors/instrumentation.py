@@ -0,0 +1,192 @@
+# document_intelligence_wrapper/extractors/instrumentation.py
+
+import logging
+import threading
+import time
+
+# The callbacks notified at the end of every stage; the list is replaced, never modified, so it can be
+# read without a lock
+_listeners = ()
+_tracer = None
+_lock = threading.Lock()
+
+# The stage attributes that are counts, totalled by StageRecorder
+COUNT_ATTRIBUTES = ("pages", "words", "paragraphs", "tables", "cells", "figures", "elements", "rows")
+
+
+def add_stage_listener(callback):
+    """
+    Registers a callback notified at the end of every instrumented stage.
+
+    The stages reported are:
+        - "upload": sending the document to the service.
+        - "polling": waiting for the analysis to complete.
+        - "columnar": building the ColumnarDocument of a result decoded with columnar=True.
+        - "process_document": organizing the elements by page, with counts of pages, words, paragraphs,
+          tables, cells and figures.
+        - "extract_page_text": processing all pages, with counts of pages and tables.
+        - "process_page": processing one page, with the page number and its number of elements.
+        - "confidence_scoring": scoring the elements of one page, with the number of elements and cells scored.
+        - "table_markdown": rendering one table, with its number of rows and cells.
+        - "assembly": combining the page texts into the full document text.
+
+    Pages processed in other processes (execution_mode="processes") only report their stages to the
+    listeners registered in those processes.
+
+    Args:
+        callback (callable): Called as callback(name, seconds, attributes) from the thread that ran the stage.
+            Exceptions raised by the callback are logged and ignored.
+    """
+    global _listeners
+    with _lock:
+        _listeners = _listeners + (callback,)
+
+
+def remove_stage_listener(callback):
+    """
+    Unregisters a callback added with add_stage_listener.
+    """
+    global _listeners
+    with _lock:
+        _listeners = tuple(listener for listener in _listeners if listener is not callback)
+
+
+def set_tracer(tracer):
+    """
+    Reports every stage as a span of an OpenTelemetry tracer, or stops doing so when tracer is None.
+
+    Args:
+        tracer: An object with a start_as_current_span(name) method, such as opentelemetry.trace.get_tracer(__name__).
+            The stage attributes are set on the span.
+    """
+    global _tracer
+    _tracer = tracer
+
+
+class _Stage:
+    """
+    Times a stage and reports it to the listeners and the tracer.
+    """
+    __slots__ = ("name", "attributes", "_start", "_span_manager", "_span")
+
+    recording = True
+
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = attributes
+        self._span_manager = None
+        self._span = None
+
+    def set(self, key, value):
+        self.attributes[key] = value
+
+    def __enter__(self):
+        if _tracer is not None:
+            self._span_manager = _tracer.start_as_current_span(self.name)
+            self._span = self._span_manager.__enter__()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        seconds = time.perf_counter() - self._start
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+
+        if self._span_manager is not None:
+            for key, value in self.attributes.items():
+                self._span.set_attribute(key, value)
+            self._span_manager.__exit__(exc_type, exc_value, traceback)
+
+        for listener in _listeners:
+            try:
+                listener(self.name, seconds, self.attributes)
+            except Exception:
+                logging.exception("Stage listener failed for stage %s", self.name)
+
+        return False
+
+
+class _NoopStage:
+    """
+    Stands in for a stage when nothing is listening.
+    """
+    __slots__ = ()
+
+    recording = False
+
+    def set(self, key, value):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NOOP_STAGE = _NoopStage()
+
+
+def stage(name, **attributes):
+    """
+    Returns a context manager timing a stage of the pipeline.
+
+    When no listener or tracer is registered, a shared no-op object is returned, so an instrumented stage
+    costs a single check. Attributes that are expensive to compute should only be set when the stage's
+    recording attribute is True.
+
+    Args:
+        name (str): The name of the stage.
+        **attributes: Attributes reported with the stage; more can be added with set(key, value).
+    """
+    if not _listeners and _tracer is None:
+        return _NOOP_STAGE
+    return _Stage(name, attributes)
+
+
+class StageRecorder:
+    """
+    A stage listener that collects the durations of each stage, for example to find where latency goes.
+
+    Usage:
+        recorder = StageRecorder()
+        add_stage_listener(recorder)
+        ...
+        print(recorder.summary())
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._durations = {}
+        self._counts = {}
+
+    def __call__(self, name, seconds, attributes):
+        with self._lock:
+            self._durations.setdefault(name, []).append(seconds)
+            counts = self._counts.setdefault(name, {})
+            for key in COUNT_ATTRIBUTES:
+                value = attributes.get(key)
+                if isinstance(value, int):
+                    counts[key] = counts.get(key, 0) + value
+
+    def summary(self):
+        """
+        Returns the number of runs, total, median and 99th percentile duration (in seconds) of each stage,
+        and the totals of its count attributes.
+        """
+        with self._lock:
+            summary = {}
+            for name, durations in self._durations.items():
+                durations = sorted(durations)
+                summary[name] = {
+                    "count": len(durations),
+                    "total": sum(durations),
+                    "p50": durations[(len(durations) - 1) // 2],
+                    "p99": durations[min(len(durations) - 1, int(len(durations) * 0.99))],
+                    **self._counts.get(name, {}),
+                }
+            return summary
+
+    def reset(self):
+        with self._lock:
+            self._durations.clear()
+            self._counts.clear()
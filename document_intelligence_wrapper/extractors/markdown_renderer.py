@@ -0,0 +1,184 @@
+# document_intelligence_wrapper/extractors/markdown_renderer.py
+
+import math
+import re
+
+# Cell widths follow the terminal width of wide characters when wcwidth is installed, like tabulate does
+try:
+    from wcwidth import wcswidth as _line_width
+except ImportError:
+    _line_width = len
+
+# Padding added around the header when sizing a column
+MIN_PADDING = 2
+
+_multiline_codes = re.compile(r"\r|\n|\r\n")
+
+
+def _is_int(value):
+    try:
+        int(value)
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+def _is_number(value):
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        return False
+    if math.isinf(number) or math.isnan(number):
+        return value.lower() in ("inf", "-inf", "nan")
+    return True
+
+
+def _column_type(values):
+    """
+    Returns the least generic of bool, int, float and str that all values of a column parse as.
+    """
+    column_type = bool
+    for value in values:
+        if value in ("True", "False"):
+            continue
+        elif _is_int(value):
+            if column_type is bool:
+                column_type = int
+        elif _is_number(value):
+            column_type = float
+        else:
+            return str
+    return column_type
+
+
+def _format_value(value, column_type):
+    """
+    Formats a value of a float column with the "g" format, leaving every other value untouched.
+    """
+    if column_type is float:
+        try:
+            return format(float(value), "g")
+        except ValueError:
+            # A "True"/"False" value in a float column is kept as it is
+            return value
+    return value
+
+
+def _decimals(value):
+    """
+    Returns the number of characters after the decimal point (or exponent) of a number, -1 if there are none.
+    """
+    if not _is_number(value) or _is_int(value):
+        return -1
+    position = value.rfind(".")
+    if position < 0:
+        position = value.lower().rfind("e")
+    return len(value) - position - 1 if position >= 0 else -1
+
+
+def _align(value, width, align_right):
+    """
+    Pads a single line to the given display width.
+    """
+    # Correct for characters whose display width differs from their length
+    width -= _line_width(value) - len(value)
+    return value.rjust(width) if align_right else value.ljust(width)
+
+
+def render_markdown_table(headers, rows):
+    """
+    Renders headers and rows of strings as a Markdown pipe table.
+
+    The output is identical to pandas.DataFrame.to_markdown(index=False), which renders through tabulate's
+    "pipe" format: numeric columns are right-aligned on the decimal point, other columns are left-aligned,
+    and multi-line headers are laid out over several lines.
+
+    Args:
+        headers (list): The column headers.
+        rows (list): The data rows, each a list with one string per column.
+
+    Returns:
+        str: The Markdown string of the table.
+    """
+    if not headers:
+        return ""
+
+    columns = [list(column) for column in zip(*rows)]
+    is_multiline = any(
+        "\n" in value or "\r" in value
+        for value in headers + [value for column in columns for value in column]
+    )
+
+    def width_of(value):
+        if is_multiline:
+            return max(_line_width(line) for line in re.split("[\r\n]", value))
+        return _line_width(value)
+
+    # Format and align each column, sizing it to fit both its header and its values
+    aligned_columns = []
+    column_widths = []
+    right_aligned = []
+    for header, values in zip(headers, columns):
+        column_type = _column_type(values)
+        align_right = column_type in (int, float)
+
+        values = [_format_value(value, column_type) for value in values]
+        if align_right:
+            # Pad the values so that their decimal points line up
+            decimals = [_decimals(value) for value in values]
+            max_decimals = max(decimals)
+            values = [value + " " * (max_decimals - value_decimals) for value, value_decimals in zip(values, decimals)]
+        else:
+            values = [value.strip() for value in values]
+
+        width = max(max(width_of(value) for value in values), width_of(header) + MIN_PADDING)
+        if is_multiline:
+            values = ["\n".join(_align(line, width, align_right) for line in value.splitlines()) for value in values]
+        else:
+            values = [_align(value, width, align_right) for value in values]
+
+        aligned_columns.append(values)
+        column_widths.append(width)
+        right_aligned.append(align_right)
+
+    if not columns:
+        # A table without data rows has left-aligned headers and no alignment markers
+        column_widths = [width_of(header) + MIN_PADDING for header in headers]
+        right_aligned = [False] * len(headers)
+
+    aligned_headers = [
+        "\n".join(_align(line, width, align_right) for line in _multiline_codes.split(header))
+        for header, width, align_right in zip(headers, column_widths, right_aligned)
+    ]
+
+    lines = []
+
+    def append_row(cells):
+        if not is_multiline:
+            lines.append("| " + " | ".join(cells) + " |")
+            return
+        # Lay out multi-line cells over several lines, filling shorter cells with blank lines
+        cells_lines = [cell.splitlines() for cell in cells]
+        line_count = max(len(cell_lines) for cell_lines in cells_lines)
+        for line_idx in range(line_count):
+            lines.append("| " + " | ".join(
+                cell_lines[line_idx] if line_idx < len(cell_lines) else " " * width
+                for cell_lines, width in zip(cells_lines, column_widths)
+            ) + " |")
+
+    append_row(aligned_headers)
+
+    # The line below the header marks the alignment of each column
+    if columns:
+        segments = [
+            "-" * (width + 1) + ":" if align_right else ":" + "-" * (width + 1)
+            for width, align_right in zip(column_widths, right_aligned)
+        ]
+    else:
+        segments = ["-" * (width + 2) for width in column_widths]
+    lines.append("|" + "|".join(segments) + "|")
+
+    for row in zip(*aligned_columns):
+        append_row(row)
+
+    return "\n".join(lines)
@@ -0,0 +1,226 @@
+# document_intelligence_wrapper/extractors/offline_processor.py
+
+import argparse
+import concurrent.futures
+import itertools
+import json
+import logging
+import os
+import sys
+
+from document_intelligence_wrapper.extractors.columnar import load_columnar_document, read_analyze_result
+from document_intelligence_wrapper.extractors.document_processor import process_document
+from document_intelligence_wrapper.extractors.extract_utils import TEXT_ASSEMBLY_MODES, extract_page_text
+
+# File suffixes of saved analysis results, as written by json.dump or by AnalyzeResultCache
+RESULT_SUFFIXES = (".json.gz", ".json")
+
+
+def load_analyze_result(path):
+    """
+    Loads a saved analysis result from a JSON file, optionally gzip-compressed.
+
+    The file is read as by columnar.read_analyze_result: decompressed in full, then decoded in one call. Both
+    the bare AnalyzeResult and the service's full operation response (with an "analyzeResult" member) are
+    accepted.
+
+    Args:
+        path (str): The path to the .json or .json.gz file.
+
+    Returns:
+        dict: The AnalyzeResult as a plain dictionary.
+    """
+    return read_analyze_result(path)
+
+
+def _output_stem(path):
+    for suffix in RESULT_SUFFIXES:
+        if path.endswith(suffix):
+            return path[:-len(suffix)]
+    return os.path.splitext(path)[0]
+
+
+def _unique_output_stem(relative_path, used_stems):
+    """
+    Returns the output stem of a saved result, with a numeric suffix ("-2", "-3", ...) when an earlier result
+    already took it, so that inputs with the same name do not overwrite each other's outputs.
+    """
+    stem = _output_stem(relative_path)
+    unique_stem = stem
+    number = 1
+    # Compared as the file system would, so the suffix also applies on case-insensitive file systems
+    while os.path.normcase(unique_stem).lower() in used_stems:
+        number += 1
+        unique_stem = f"{stem}-{number}"
+    used_stems.add(os.path.normcase(unique_stem).lower())
+    return unique_stem
+
+
+def process_saved_result(path, output_prefix, calculate_confidence=True, calculate_cell_confidence=False, columnar=False,
+                         text_assembly="render"):
+    """
+    Runs the post-processing pipeline on a saved analysis result and writes its outputs.
+
+    The outputs are written next to each other using output_prefix as the common file name prefix:
+        - <prefix>.page_text.json: The text of each page, keyed by page number.
+        - <prefix>.tables.md: The Markdown of every table, in document order.
+        - <prefix>.elements.json: The details of each element on each page.
+        - <prefix>.txt: The full text of the document.
+
+    Args:
+        path (str): The path to the saved result.
+        output_prefix (str): The path prefix of the output files.
+        calculate_confidence (bool): Flag to calculate confidence scores for paragraphs, tables, and figures. Default is True.
+        calculate_cell_confidence (bool): Flag to calculate confidence scores for individual table cells. Default is False.
+        columnar (bool): Flag to load the result into a ColumnarDocument, which decodes and processes large results
+            faster. Polygon coordinates are then written as floats. Default is False.
+        text_assembly (str): "render" (default) or "spans", as for extract_page_text.
+
+    Returns:
+        list: The paths of the written files.
+    """
+    ocr_json = load_columnar_document(path) if columnar else load_analyze_result(path)
+
+    page_section, figure_associations = process_document(ocr_json)
+    page_text, table_text, doc_text, all_page_elements = extract_page_text(
+        ocr_json,
+        page_section,
+        figure_associations,
+        calculate_confidence=calculate_confidence,
+        calculate_cell_confidence=calculate_cell_confidence,
+        text_assembly=text_assembly
+    )
+
+    output_dir = os.path.dirname(output_prefix)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    output_paths = [
+        output_prefix + ".page_text.json",
+        output_prefix + ".tables.md",
+        output_prefix + ".elements.json",
+        output_prefix + ".txt",
+    ]
+
+    with open(output_paths[0], "w", encoding="utf-8") as f:
+        json.dump(page_text, f, ensure_ascii=False)
+    with open(output_paths[1], "w", encoding="utf-8") as f:
+        f.write("\n\n".join(f"Table {table_id}\n\n{markdown}" for table_id, markdown in table_text.items()))
+    with open(output_paths[2], "w", encoding="utf-8") as f:
+        json.dump(all_page_elements, f, ensure_ascii=False)
+    with open(output_paths[3], "w", encoding="utf-8") as f:
+        f.write(doc_text)
+
+    return output_paths
+
+
+def iter_saved_results(paths):
+    """
+    Lazily lists saved results, expanding directories recursively.
+
+    Args:
+        paths (iterable): Paths to saved result files or to directories containing them.
+
+    Yields:
+        tuple: The path to each saved result and its path relative to the input it was found under.
+    """
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path, os.path.basename(path)
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                if name.endswith(RESULT_SUFFIXES):
+                    file_path = os.path.join(root, name)
+                    yield file_path, os.path.relpath(file_path, path)
+
+
+def process_saved_results(paths, output_dir, max_workers=None, calculate_confidence=True, calculate_cell_confidence=False, columnar=False,
+                          text_assembly="render"):
+    """
+    Post-processes saved results across a pool of processes.
+
+    Results are loaded and processed inside the worker processes, so only file paths are sent to them.
+    At most twice as many results as there are workers are queued at a time, and outcomes are yielded
+    as they finish.
+
+    Args:
+        paths (iterable): Paths to saved result files or to directories containing them.
+        output_dir (str): The directory the outputs are written to, mirroring the layout of input directories.
+            Files are named after their input; when two inputs would get the same name, such as a/x.json and
+            b/x.json, or x.json and x.json.gz, the later one is written as x-2, then x-3 and so on.
+        max_workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+        calculate_confidence (bool): Flag to calculate confidence scores for paragraphs, tables, and figures. Default is True.
+        calculate_cell_confidence (bool): Flag to calculate confidence scores for individual table cells. Default is False.
+        columnar (bool): Flag to load the results into ColumnarDocuments, as in process_saved_result. Default is False.
+        text_assembly (str): "render" (default) or "spans", as for extract_page_text.
+
+    Yields:
+        tuple: The input path, the list of written files (None on failure) and the exception raised (None on success).
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    saved_results = iter_saved_results(paths)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        in_flight = {}
+        used_stems = set()
+
+        def submit(count):
+            for path, relative_path in itertools.islice(saved_results, count):
+                output_prefix = os.path.join(output_dir, _unique_output_stem(relative_path, used_stems))
+                future = executor.submit(process_saved_result, path, output_prefix, calculate_confidence, calculate_cell_confidence, columnar,
+                                         text_assembly)
+                in_flight[future] = path
+
+        submit(2 * max_workers)
+        while in_flight:
+            done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+            submit(len(done))
+            for future in done:
+                path = in_flight.pop(future)
+                try:
+                    yield path, future.result(), None
+                except Exception as e:
+                    yield path, None, e
+
+
+def main(argv=None):
+    """
+    Command line entry point: post-processes saved analysis results without calling the service.
+    """
+    parser = argparse.ArgumentParser(
+        description="Run the document post-processing pipeline on saved AnalyzeResult JSON files."
+    )
+    parser.add_argument("inputs", nargs="+", help="Saved result files (.json or .json.gz) or directories containing them.")
+    parser.add_argument("-o", "--output-dir", required=True, help="Directory the outputs are written to.")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Number of worker processes. Defaults to the number of CPUs.")
+    parser.add_argument("--no-confidence", action="store_true", help="Skip confidence scores for paragraphs and tables.")
+    parser.add_argument("--cell-confidence", action="store_true", help="Also calculate confidence scores for table cells.")
+    parser.add_argument("--columnar", action="store_true", help="Load the results into columnar documents, which is faster for large results.")
+    parser.add_argument("--text-assembly", choices=TEXT_ASSEMBLY_MODES, default="render",
+                        help="Render tables with table_markdown (render), or slice element text from the result's Markdown content (spans).")
+    args = parser.parse_args(argv)
+
+    processed = failed = 0
+    for path, _, error in process_saved_results(
+        args.inputs,
+        args.output_dir,
+        max_workers=args.workers,
+        calculate_confidence=not args.no_confidence,
+        calculate_cell_confidence=args.cell_confidence,
+        columnar=args.columnar,
+        text_assembly=args.text_assembly
+    ):
+        if error is None:
+            processed += 1
+        else:
+            failed += 1
+            logging.error("Failed to process %s: %s", path, error)
+
+    print(f"Processed {processed} result(s), {failed} failed.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
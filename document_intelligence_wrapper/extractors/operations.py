@@ -0,0 +1,200 @@
+# document_intelligence_wrapper/extractors/operations.py
+
+import asyncio
+import functools
+import re
+from typing import NamedTuple, Optional
+
+from azure.core.polling.async_base_polling import AsyncLROBasePolling
+from azure.core.polling.base_polling import LROBasePolling
+
+from document_intelligence_wrapper.extractors.document_source import content_length_headers, open_document, open_upload
+from document_intelligence_wrapper.extractors.instrumentation import stage
+from document_intelligence_wrapper.extractors.polling import DEFAULT_MAX_POLLING_DELAY, AdaptivePolling, AsyncAdaptivePolling, document_size
+from document_intelligence_wrapper.extractors.text_extractor import MODEL_ID, post_process_result
+
+_operation_id_pattern = re.compile(r"/analyzeResults/([^/?]+)")
+
+
+class _SubmitOnlyPolling(LROBasePolling):
+    """
+    A polling method that never polls, so that submitting a document does not wait for its analysis.
+    """
+    def run(self):
+        pass
+
+
+class _AsyncSubmitOnlyPolling(AsyncLROBasePolling):
+    async def run(self):
+        pass
+
+
+class AnalysisHandle(NamedTuple):
+    """
+    A submitted analysis, from which its result can be collected later, from any process.
+
+    All fields are JSON-serializable, so a handle can be stored with handle._asdict() and rebuilt with
+    AnalysisHandle(**fields).
+
+    Attributes:
+        operation_id (str): The id of the analysis operation in the service.
+        continuation_token (str): The token the poller is resumed from.
+        page_count (int): The number of pages submitted, if known, used to pace the polling.
+        file_size (int): The size of the document in bytes, used to pace the polling.
+    """
+    operation_id: Optional[str]
+    continuation_token: str
+    page_count: Optional[int]
+    file_size: Optional[int]
+
+
+def _analyze_options(source, pages, operation_locations):
+    from azure.ai.documentintelligence.models import ContentFormat
+
+    def record_operation_location(response):
+        # Only the response to the analyze request itself carries the operation's location
+        location = response.http_response.headers.get("Operation-Location")
+        if location and not operation_locations:
+            operation_locations.append(location)
+
+    return dict(
+        model_id=MODEL_ID,
+        analyze_request=source,
+        pages=pages,
+        output_content_format=ContentFormat.MARKDOWN,
+        content_type="application/octet-stream",
+        raw_response_hook=record_operation_location,
+    )
+
+
+def _handle(poller, operation_locations, page_count, file_size):
+    operation_id = None
+    if operation_locations:
+        match = _operation_id_pattern.search(operation_locations[0])
+        operation_id = match.group(1) if match else None
+    return AnalysisHandle(operation_id, poller.continuation_token(), page_count, file_size)
+
+
+def submit_document(client, file_path, pages: str = None) -> AnalysisHandle:
+    """
+    Uploads a document for analysis and returns without waiting for the analysis to complete.
+
+    Args:
+        client (DocumentIntelligenceClient): The Azure Document Intelligence client.
+        file_path (str, bytes-like, mmap or file-like): The document, as in analyze_document_text.
+        pages (str, optional): The pages to analyze, such as "1-3,5". Defaults to every page.
+
+    Returns:
+        AnalysisHandle: The handle to collect the result with.
+    """
+    page_count, file_size = document_size(file_path, pages)
+    operation_locations = []
+
+    with open_document(file_path) as f, stage("upload", pages=pages or "all"):
+        poller = client.begin_analyze_document(polling=_SubmitOnlyPolling(), **_analyze_options(f, pages, operation_locations))
+
+    return _handle(poller, operation_locations, page_count, file_size)
+
+
+def resume_analysis(client, handle: AnalysisHandle, max_polling_delay: float = DEFAULT_MAX_POLLING_DELAY):
+    """
+    Returns a poller for a submitted analysis that polls at an adaptive pace.
+
+    The poller polls in the background: its result() blocks until the analysis completes, done() tells
+    whether it has, and add_done_callback(callback) calls back with the AnalyzeResult on completion.
+
+    Args:
+        client (DocumentIntelligenceClient): The Azure Document Intelligence client; it does not need to be
+            the one the document was submitted with.
+        handle (AnalysisHandle): The handle returned by submit_document.
+        max_polling_delay (float): The ceiling of the delay between two status requests, in seconds. Default is 10.
+
+    Returns:
+        LROPoller: The poller of the analysis.
+    """
+    return client.begin_analyze_document(
+        MODEL_ID,
+        continuation_token=handle.continuation_token,
+        polling=AdaptivePolling(handle.page_count, handle.file_size, max_polling_delay),
+    )
+
+
+def collect_document_text(client, handle: AnalysisHandle, calculate_confidence: bool = True, calculate_cell_confidence: bool = False,
+                          max_polling_delay: float = DEFAULT_MAX_POLLING_DELAY) -> tuple:
+    """
+    Waits for a submitted analysis to complete and processes its result.
+
+    Args:
+        client (DocumentIntelligenceClient): The Azure Document Intelligence client.
+        handle (AnalysisHandle): The handle returned by submit_document.
+        calculate_confidence (bool): Flag to calculate confidence scores for paragraphs, tables, and figures. Default is True.
+        calculate_cell_confidence (bool): Flag to calculate confidence scores for individual table cells. Default is False.
+        max_polling_delay (float): The ceiling of the delay between two status requests, in seconds. Default is 10.
+
+    Returns:
+        tuple: The same tuple as analyze_document_text.
+    """
+    poller = resume_analysis(client, handle, max_polling_delay)
+    with stage("polling", pages=handle.page_count or "all"):
+        ocr_result = poller.result()
+    return post_process_result(ocr_result, calculate_confidence, calculate_cell_confidence)
+
+
+def get_analysis_status(client, handle: AnalysisHandle) -> str:
+    """
+    Returns the current status of a submitted analysis, such as "running", "succeeded" or "failed",
+    with a single status request.
+    """
+    poller = client.begin_analyze_document(MODEL_ID, continuation_token=handle.continuation_token, polling=_SubmitOnlyPolling())
+    polling_method = poller.polling_method()
+    polling_method.update_status()
+    return polling_method.status().lower()
+
+
+async def submit_document_async(client, file_path, pages: str = None, executor=None) -> AnalysisHandle:
+    """
+    Uploads a document for analysis with the asynchronous client, without waiting for the analysis.
+
+    Args:
+        client (azure.ai.documentintelligence.aio.DocumentIntelligenceClient): The asynchronous client.
+        file_path (str, bytes-like, mmap or file-like): The document, as in analyze_document_text.
+        pages (str, optional): The pages to analyze, such as "1-3,5". Defaults to every page.
+        executor (concurrent.futures.Executor, optional): The executor sizing the document. Defaults to the
+            event loop's default executor.
+
+    Returns:
+        AnalysisHandle: The handle to collect the result with, from this or any other process.
+    """
+    loop = asyncio.get_running_loop()
+    page_count, file_size = await loop.run_in_executor(executor, document_size, file_path, pages)
+    operation_locations = []
+
+    with open_upload(file_path) as f, stage("upload", pages=pages or "all"):
+        poller = await client.begin_analyze_document(
+            polling=_AsyncSubmitOnlyPolling(), headers=content_length_headers(f), **_analyze_options(f, pages, operation_locations)
+        )
+
+    return _handle(poller, operation_locations, page_count, file_size)
+
+
+async def collect_document_text_async(client, handle: AnalysisHandle, calculate_confidence: bool = True, calculate_cell_confidence: bool = False,
+                                      max_polling_delay: float = DEFAULT_MAX_POLLING_DELAY, executor=None) -> tuple:
+    """
+    Awaits a submitted analysis with adaptive polling and processes its result in an executor.
+
+    Returns:
+        tuple: The same tuple as analyze_document_text.
+    """
+    poller = await client.begin_analyze_document(
+        MODEL_ID,
+        continuation_token=handle.continuation_token,
+        polling=AsyncAdaptivePolling(handle.page_count, handle.file_size, max_polling_delay),
+    )
+    with stage("polling", pages=handle.page_count or "all"):
+        ocr_result = await poller.result()
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor,
+        functools.partial(post_process_result, ocr_result, calculate_confidence, calculate_cell_confidence)
+    )
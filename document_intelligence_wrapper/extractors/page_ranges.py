@@ -0,0 +1,208 @@
+# document_intelligence_wrapper/extractors/page_ranges.py
+
+import re
+
+from document_intelligence_wrapper.extractors.document_source import open_document
+
+# The separator the service puts between pages in Markdown content
+PAGE_BREAK = "\n<!-- PageBreak -->\n"
+
+_element_reference_pattern = re.compile(r"^/(\w+)/(\d+)")
+_figure_id_pattern = re.compile(r"^(\d+)\.(\d+)$")
+
+
+def _pdf_reader_class():
+    """
+    Returns pypdf's PdfReader, or None if pypdf is not installed.
+
+    pypdf is only needed to count the pages of PDFs, and importing it takes longer than importing the rest of
+    the package, so it is imported on first use rather than with this module.
+    """
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        return None
+    return PdfReader
+
+
+def count_pdf_pages(source):
+    """
+    Returns the number of pages of a PDF document, or None if the document is not a PDF, cannot be read, or
+    pypdf is not installed.
+
+    The count is the /Count of the document's root page tree, as pypdf reads it through the cross-reference
+    table, so only the objects it needs are read rather than the whole file. Rewritten page objects of
+    incrementally updated files and the /Count entries of outlines are not counted.
+
+    Args:
+        source (str, bytes-like, mmap or file-like): The file path to the document, the document in memory, or
+            a seekable binary file-like object. A stream is rewound to where it started.
+
+    Returns:
+        int: The number of pages.
+    """
+    PdfReader = _pdf_reader_class()
+    if PdfReader is None:
+        return None
+
+    with open_document(source) as f:
+        start_position = f.tell()
+        try:
+            if f.read(5) != b"%PDF-":
+                return None
+            f.seek(start_position)
+            return len(PdfReader(f).pages)
+        except Exception:
+            return None
+        finally:
+            f.seek(start_position)
+
+
+def pdf_page_ranges(source, pages_per_range):
+    """
+    Returns the page ranges to analyze a document in, or an empty list when it is not a PDF or cannot be read.
+
+    Args:
+        source (str, bytes-like, mmap or file-like): The document, as for count_pdf_pages.
+        pages_per_range (int): The maximum number of pages of each range.
+
+    Returns:
+        list: The ranges, as returned by split_page_ranges.
+
+    Raises:
+        ImportError: If pypdf is not installed.
+    """
+    if _pdf_reader_class() is None:
+        raise ImportError("Splitting PDFs into page ranges needs pypdf to count their pages: pip install document-intelligence-wrapper[pdf]")
+    page_count = count_pdf_pages(source)
+    if page_count is None:
+        return []
+    return split_page_ranges(page_count, pages_per_range)
+
+
+def split_page_ranges(page_count, pages_per_range):
+    """
+    Splits the pages of a document into consecutive ranges in the format of the service's pages parameter.
+
+    Args:
+        page_count (int): The number of pages of the document.
+        pages_per_range (int): The maximum number of pages of each range.
+
+    Returns:
+        list: The ranges, such as ["1-100", "101-200", "201-250"].
+    """
+    if pages_per_range < 1:
+        raise ValueError("pages_per_range must be at least 1")
+
+    ranges = []
+    for first_page in range(1, page_count + 1, pages_per_range):
+        last_page = min(first_page + pages_per_range - 1, page_count)
+        ranges.append(f"{first_page}-{last_page}" if last_page > first_page else str(first_page))
+    return ranges
+
+
+def merge_analyze_results(results, first_page_numbers=None):
+    """
+    Merges the analysis results of consecutive page ranges of a document into a single result.
+
+    The content of the results is joined with page breaks, and every reference that depends on a result's
+    position in the document is rebased so that the merged result reads like one analysis of the whole document:
+        - Span offsets are shifted by the length of the content before them.
+        - Element references such as "/paragraphs/12" or "/tables/3/cells/4" are shifted by the number of
+          elements of that kind in the earlier results.
+        - Page numbers and figure ids are shifted when a result numbers its pages from 1 although its range
+          starts further into the document, as happens for documents split locally before analysis.
+
+    The root sections of the later results are attached to the root section of the first one.
+
+    Args:
+        results (list): The results as plain dictionaries (see AnalyzeResult.as_dict()), in page order.
+        first_page_numbers (list, optional): The first page number of each result's range in the whole
+            document. When omitted, the page numbers of the results are kept as they are.
+
+    Returns:
+        dict: The merged result.
+    """
+    if not results:
+        raise ValueError("There are no results to merge")
+
+    merged = {}
+    contents = []
+    content_offset = 0
+    element_offsets = {}
+    root_sections = []
+
+    for result_index, result in enumerate(results):
+        page_offset = 0
+        if first_page_numbers is not None:
+            page_numbers = [page["pageNumber"] for page in result.get("pages") or []]
+            if page_numbers:
+                page_offset = first_page_numbers[result_index] - min(page_numbers)
+
+        rebased = _rebase(result, content_offset, dict(element_offsets), page_offset)
+
+        for key, value in rebased.items():
+            if key == "content":
+                continue
+            if isinstance(value, list):
+                if key == "sections" and value:
+                    root_sections.append(element_offsets.get("sections", 0))
+                merged.setdefault(key, []).extend(value)
+            else:
+                # Values such as the model id and API version are the same in every result
+                merged.setdefault(key, value)
+
+        for key, value in result.items():
+            if isinstance(value, list):
+                element_offsets[key] = element_offsets.get(key, 0) + len(value)
+
+        content = result.get("content") or ""
+        contents.append(content)
+        content_offset += len(content) + len(PAGE_BREAK)
+
+    merged["content"] = PAGE_BREAK.join(contents)
+
+    # Attach the root section of each later result to the root section of the first one
+    if len(root_sections) > 1:
+        root_section = merged["sections"][root_sections[0]]
+        root_section["elements"] = list(root_section.get("elements") or []) + [
+            f"/sections/{section_index}" for section_index in root_sections[1:]
+        ]
+
+    return merged
+
+
+def _rebase(value, content_offset, element_offsets, page_offset, key=None):
+    """
+    Returns a copy of a result (or part of it) with its offsets, element references and page numbers rebased.
+    """
+    if isinstance(value, dict):
+        rebased = {
+            item_key: _rebase(item_value, content_offset, element_offsets, page_offset, item_key)
+            for item_key, item_value in value.items()
+        }
+        if key in ("span", "spans") and "offset" in value:
+            rebased["offset"] = value["offset"] + content_offset
+        return rebased
+
+    if isinstance(value, list):
+        return [_rebase(item, content_offset, element_offsets, page_offset, key) for item in value]
+
+    if key == "pageNumber" and isinstance(value, int):
+        return value + page_offset
+
+    if key == "elements" and isinstance(value, str):
+        match = _element_reference_pattern.match(value)
+        if match:
+            element_type, element_index = match.groups()
+            rebased_index = int(element_index) + element_offsets.get(element_type, 0)
+            return f"/{element_type}/{rebased_index}{value[match.end():]}"
+        return value
+
+    if key == "id" and page_offset and isinstance(value, str):
+        # Figure ids are made of the page number and the figure's index on the page
+        match = _figure_id_pattern.match(value)
+        if match:
+            return f"{int(match.group(1)) + page_offset}.{match.group(2)}"
+
+    return value
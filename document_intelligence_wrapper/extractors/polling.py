@@ -0,0 +1,200 @@
+# document_intelligence_wrapper/extractors/polling.py
+
+import email.utils
+import time
+
+from azure.core.polling.async_base_polling import AsyncLROBasePolling
+from azure.core.polling.base_polling import LROBasePolling
+
+from document_intelligence_wrapper.extractors.columnar import loads_json
+from document_intelligence_wrapper.extractors.document_source import document_length
+from document_intelligence_wrapper.extractors.page_ranges import count_pdf_pages
+
+# The analysis time estimate behind the first polling delay: a fixed overhead plus a share per page and per MB
+BASE_SECONDS = 1.0
+SECONDS_PER_PAGE = 0.2
+SECONDS_PER_MB = 0.5
+
+# The bounds of the polling delay, in seconds, and its growth between two status requests
+MIN_POLLING_DELAY = 0.25
+DEFAULT_MAX_POLLING_DELAY = 10.0
+POLLING_DELAY_GROWTH = 1.5
+
+
+def adaptive_initial_delay(page_count=None, file_size=None, max_delay=DEFAULT_MAX_POLLING_DELAY):
+    """
+    Returns the delay before the first status request of an analysis, from the size of the document.
+
+    The first status request is made halfway through the expected analysis time, so a one-page receipt
+    is checked within a second while a long report is not polled needlessly early.
+
+    Args:
+        page_count (int, optional): The number of pages analyzed. Defaults to 1.
+        file_size (int, optional): The size of the document in bytes. Defaults to 0.
+        max_delay (float): The ceiling of the delay, in seconds.
+
+    Returns:
+        float: The delay in seconds.
+    """
+    expected_seconds = BASE_SECONDS + SECONDS_PER_PAGE * (page_count or 1) + SECONDS_PER_MB * (file_size or 0) / 1024 ** 2
+    return min(max(expected_seconds / 2, MIN_POLLING_DELAY), max_delay)
+
+
+def retry_after_seconds(response):
+    """
+    Returns the delay requested by a response's retry headers, or None if there is none.
+
+    Args:
+        response: The HTTP response carrying the headers.
+
+    Returns:
+        float: The number of seconds to wait before the next request.
+    """
+    headers = getattr(response, "headers", None) or {}
+
+    for header in ("retry-after-ms", "x-ms-retry-after-ms"):
+        value = headers.get(header)
+        if value:
+            try:
+                return float(value) / 1000
+            except ValueError:
+                pass
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    # Retry-After may also be an HTTP date
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def document_size(source, pages=None):
+    """
+    Returns the number of pages analyzed and the size in bytes of a document.
+
+    Args:
+        source (str, bytes-like, mmap or file-like): The document.
+        pages (str, optional): The pages analyzed, such as "1-3,5". Defaults to every page.
+
+    Returns:
+        tuple: The number of pages, or None when it is unknown, and the size in bytes.
+    """
+    file_size = document_length(source)
+    if pages:
+        page_count = 0
+        for page_range in pages.split(","):
+            first, _, last = page_range.partition("-")
+            page_count += int(last or first) - int(first) + 1
+    else:
+        page_count = count_pdf_pages(source)
+    return page_count, file_size
+
+
+class _AdaptiveDelay:
+    """
+    Replaces the fixed delay between status requests with delays growing from an estimate of the analysis time.
+    The service's Retry-After is a lower bound: it is waited for when it is longer than the adaptive delay.
+    """
+    def _init_delay(self, page_count, file_size, max_delay):
+        self._max_delay = max_delay
+        self._next_delay = adaptive_initial_delay(page_count, file_size, max_delay)
+
+    def _extract_delay(self):
+        delay = self._next_delay
+        self._next_delay = min(delay * POLLING_DELAY_GROWTH, self._max_delay)
+        if self._pipeline_response is not None:
+            delay = max(delay, retry_after_seconds(self._pipeline_response.http_response) or 0)
+        return delay
+
+
+class _JsonResult:
+    """
+    Optionally returns the analysis result as the dictionary decoded from the final response, skipping the
+    SDK's deserialization into AnalyzeResult models, which takes longer than the post-processing on large results.
+    """
+    _json_result = False
+
+    def resource(self):
+        if not self._json_result:
+            return super().resource()
+        return loads_json(self._pipeline_response.http_response.body()).get("analyzeResult")
+
+
+class AdaptivePolling(_JsonResult, _AdaptiveDelay, LROBasePolling):
+    """
+    A polling method whose delay starts from the expected analysis time of the document and grows by half
+    after every status request, up to max_delay. When the service asks for a longer delay with Retry-After,
+    that delay is waited for instead.
+
+    Args:
+        page_count (int, optional): The number of pages analyzed.
+        file_size (int, optional): The size of the document in bytes.
+        max_delay (float): The ceiling of the delay between two status requests, in seconds. Default is 10.
+        json_result (bool): Flag to return the result as a plain dictionary decoded from the response JSON
+            instead of an AnalyzeResult. Default is False.
+        **kwargs: The arguments of azure.core.polling.base_polling.LROBasePolling.
+    """
+    def __init__(self, page_count=None, file_size=None, max_delay=DEFAULT_MAX_POLLING_DELAY, json_result=False, **kwargs):
+        super().__init__(**kwargs)
+        self._init_delay(page_count, file_size, max_delay)
+        self._json_result = json_result
+
+
+class AsyncAdaptivePolling(_JsonResult, _AdaptiveDelay, AsyncLROBasePolling):
+    """
+    The asynchronous counterpart of AdaptivePolling.
+    """
+    def __init__(self, page_count=None, file_size=None, max_delay=DEFAULT_MAX_POLLING_DELAY, json_result=False, **kwargs):
+        super().__init__(**kwargs)
+        self._init_delay(page_count, file_size, max_delay)
+        self._json_result = json_result
+
+
+class JsonResultPolling(_JsonResult, LROBasePolling):
+    """
+    A polling method with the SDK's cadence that returns the result as a plain dictionary decoded from the
+    response JSON instead of an AnalyzeResult.
+
+    Args:
+        timeout (float): The delay between status requests when the service sends no Retry-After, in seconds.
+            Default is 30, as for the SDK's client.
+        **kwargs: The arguments of azure.core.polling.base_polling.LROBasePolling.
+    """
+    _json_result = True
+
+
+class AsyncJsonResultPolling(_JsonResult, AsyncLROBasePolling):
+    """
+    The asynchronous counterpart of JsonResultPolling.
+    """
+    _json_result = True
+
+
+def polling_method(source, pages=None, max_polling_delay=None, json_result=False, asynchronous=False, polling_interval=None):
+    """
+    Returns the polling method of an analysis, or None to keep the SDK's.
+
+    Args:
+        source: The document, used to estimate the analysis time when max_polling_delay is given.
+        pages (str, optional): The pages analyzed.
+        max_polling_delay (float, optional): Polls adaptively up to this delay, in seconds.
+        json_result (bool): Flag to have the poller return the decoded JSON dictionary.
+        asynchronous (bool): Flag to return a polling method for the asynchronous client.
+        polling_interval (float, optional): The delay between status requests of a json_result poller when the
+            service sends no Retry-After, in seconds. Defaults to the SDK's 30.
+    """
+    if max_polling_delay is not None:
+        polling_class = AsyncAdaptivePolling if asynchronous else AdaptivePolling
+        return polling_class(*document_size(source, pages), max_delay=max_polling_delay, json_result=json_result)
+    if json_result:
+        polling_class = AsyncJsonResultPolling if asynchronous else JsonResultPolling
+        return polling_class() if polling_interval is None else polling_class(polling_interval)
+    return None
@@ -0,0 +1,196 @@
+# document_intelligence_wrapper/extractors/result_cache.py
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+
+from document_intelligence_wrapper.extractors.document_source import is_buffer
+
+# Size of the blocks read when hashing a document
+HASH_BLOCK_SIZE = 1024 * 1024
+
+CACHE_FILE_SUFFIX = ".json.gz"
+
+
+def hash_document(source):
+    """
+    Returns the SHA-256 hex digest of a document's content.
+
+    Args:
+        source (str, bytes-like, mmap or file-like): The file path to the document, the document in memory,
+            or a seekable binary file-like object. A stream is rewound to where it started once it has been hashed.
+
+    Returns:
+        str: The hex digest of the document's bytes.
+    """
+    digest = hashlib.sha256()
+
+    if is_buffer(source):
+        # Hashed in place, without copying the document
+        digest.update(source)
+    elif hasattr(source, "read"):
+        start_position = source.tell()
+        for block in iter(lambda: source.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+        source.seek(start_position)
+    else:
+        with open(source, "rb") as f:
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+
+    return digest.hexdigest()
+
+
+class AnalyzeResultCache:
+    """
+    A content-addressed on-disk cache of raw analysis results.
+
+    Each entry is stored as gzip-compressed JSON under a key derived from the document's content hash and
+    the analysis options. When the cache grows beyond max_bytes, the least recently used entries are removed.
+    Reading an entry refreshes its modification time, which is what recency is tracked by, so several
+    processes can share one cache directory.
+
+    Attributes:
+        directory (str): The directory holding the cache entries.
+        max_bytes (int): The size the cache is trimmed back to after a write.
+    """
+    def __init__(self, directory: str, max_bytes: int = 10 * 1024 ** 3, compresslevel: int = 6):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.compresslevel = compresslevel
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        self._total_bytes = sum(size for _, size, _ in self._entries())
+
+    @staticmethod
+    def make_key(document_hash: str, model_id: str, output_format: str, **options) -> str:
+        """
+        Builds the cache key of an analysis.
+
+        Args:
+            document_hash (str): The content hash of the document, as returned by hash_document.
+            model_id (str): The model used for the analysis.
+            output_format (str): The content format requested from the service.
+            **options: Any other analysis options that change the result, such as the pages analyzed.
+
+        Returns:
+            str: The cache key.
+        """
+        key_material = json.dumps([document_hash, model_id, str(output_format), options], sort_keys=True, default=str)
+        return hashlib.sha256(key_material.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        # Spread the entries over subdirectories to keep directory listings short
+        return os.path.join(self.directory, key[:2], key + CACHE_FILE_SUFFIX)
+
+    def _entries(self):
+        """
+        Yields the (path, size, modification time) of every cache entry.
+        """
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(CACHE_FILE_SUFFIX):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+
+    def get(self, key: str):
+        """
+        Returns the cached result for the key, or None on a miss.
+        """
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                value = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError) as e:
+            # A truncated or corrupt entry is dropped and treated as a miss
+            logging.warning("Discarding unreadable cache entry %s: %s", path, e)
+            with self._lock:
+                self._total_bytes -= self._remove_entry(path)
+            return None
+
+        # Mark the entry as recently used
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+        return value
+
+    def put(self, key: str, value) -> None:
+        """
+        Stores a result under the key and evicts the least recently used entries if the cache is too large.
+
+        Args:
+            key (str): The cache key, as returned by make_key.
+            value (dict): The JSON-serializable result to store.
+        """
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write to a temporary file first so readers never see a partially written entry
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=self.compresslevel) as f:
+                f.write(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+            size = os.path.getsize(temp_path)
+
+            with self._lock:
+                # An entry stored under the same key is replaced, so its size no longer counts
+                self._total_bytes -= self._entry_size(path)
+                os.replace(temp_path, path)
+                self._total_bytes += size
+                if self._total_bytes > self.max_bytes:
+                    self._evict()
+        except BaseException:
+            self._remove(temp_path)
+            raise
+
+    def _evict(self):
+        """
+        Removes the least recently used entries until the cache fits in max_bytes.
+        """
+        # Rescan, since other processes may share the directory
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total_bytes = sum(size for _, size, _ in entries)
+
+        for path, size, _ in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            if self._remove(path):
+                total_bytes -= size
+
+        self._total_bytes = total_bytes
+
+    @staticmethod
+    def _entry_size(path):
+        try:
+            return os.path.getsize(path)
+        except FileNotFoundError:
+            return 0
+
+    def _remove_entry(self, path):
+        """
+        Removes an entry and returns the number of bytes it took, 0 if it was already gone.
+        """
+        size = self._entry_size(path)
+        return size if self._remove(path) else 0
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
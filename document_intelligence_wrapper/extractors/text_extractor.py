@@ -1,20 +1,58 @@
 # document_intelligence_wrapper/extractors/pdf_text_extractor.py
 
-from azure.core.credentials import AzureKeyCredential
-from azure.ai.documentintelligence import DocumentIntelligenceClient
-from azure.ai.documentintelligence.models import AnalyzeDocumentRequest, ContentFormat, AnalyzeResult
+import asyncio
+import concurrent.futures
+import functools
+from typing import TYPE_CHECKING
+
+from document_intelligence_wrapper.extractors.columnar import ColumnarDocument
 from document_intelligence_wrapper.extractors.document_processor import process_document
+from document_intelligence_wrapper.extractors.document_source import content_length_headers, is_buffer, open_document, open_upload
 from document_intelligence_wrapper.extractors.extract_utils import extract_page_text
+from document_intelligence_wrapper.extractors.instrumentation import stage
+from document_intelligence_wrapper.extractors.page_ranges import merge_analyze_results, pdf_page_ranges
+from document_intelligence_wrapper.extractors.result_cache import hash_document
+
+if TYPE_CHECKING:
+    from azure.ai.documentintelligence.models import AnalyzeResult
+
+# The model used to analyze documents
+MODEL_ID = "prebuilt-layout"
 
-def analyze_document_text(client, file_path: str, calculate_confidence: bool = True, calculate_cell_confidence: bool = False) -> dict:
+def analyze_document_text(client, file_path, calculate_confidence: bool = True, calculate_cell_confidence: bool = False, cache=None,
+                          pages_per_request: int = None, max_concurrency: int = 4, max_polling_delay: float = None,
+                          columnar: bool = False, text_assembly: str = "render", polling_interval: float = None) -> dict:
     """
     Extracts text from a file using Azure Document Intelligence and processes the result.
 
     Args:
         client (DocumentIntelligenceClient): The Azure Document Intelligence client.
-        pdf_file_path (str): The file path to the PDF document.
+        file_path (str, bytes-like, mmap or file-like): The file path to the document, the document itself as bytes,
+            bytearray, memoryview or memory-mapped file, or a binary file-like object to read it from. In-memory
+            documents are streamed to the service in place, without being copied or written to disk.
         calculate_confidence (bool): Flag to calculate confidence scores for paragraphs, tables, and figures. Default is True.
         calculate_cell_confidence (bool): Flag to calculate confidence scores for individual table cells. Default is False.
+        cache (AnalyzeResultCache, optional): A cache of raw analysis results. On a hit the service is not called
+            and the cached result is post-processed directly; on a miss the new result is stored. Streams must be
+            seekable to be used with a cache.
+        pages_per_request (int, optional): Splits PDF documents with more pages than this into page ranges that are
+            analyzed concurrently, using the service's pages parameter. The results are merged into a single result,
+            with page numbers, element indexes and references rebased, before being post-processed. Every range
+            uploads the whole document, so this shortens the analysis but does not help with the service's limit
+            on the request size. Pages are counted with pypdf, which must be installed. By default the whole
+            document is analyzed in one request.
+        max_concurrency (int): The maximum number of page ranges analyzed at a time. Default is 4.
+        max_polling_delay (float, optional): Polls the analysis adaptively: the first status request is timed from
+            the page count and size of the document, and the delay grows after each request up to this ceiling,
+            in seconds. A longer delay asked for by the service with Retry-After is still waited for. By default
+            the SDK's polling cadence is used.
+        columnar (bool): Flag to decode the service's response JSON directly into a ColumnarDocument, skipping
+            the SDK's AnalyzeResult models, whose deserialization dominates the run time on large documents.
+            The cache then stores and returns the decoded dictionaries. Default is False.
+        text_assembly (str): "render" (default) to render tables with table_markdown, or "spans" to slice the text
+            of every element from the Markdown content returned by the service (see extract_utils.iter_page_text).
+        polling_interval (float, optional): The delay between status requests when the service sends no Retry-After
+            and max_polling_delay is not given, in seconds. Defaults to the client's polling interval.
 
     Returns:
         tuple: A tuple containing:
@@ -22,7 +60,8 @@ def analyze_document_text(client, file_path: str, calculate_confidence: bool = T
             - table_text (dict): A dictionary with table content keyed by a unique table identifier.
             - full_doc_text_combined (str): A string representing the full text of the document, combining all pages.
             - all_page_elements (list): A list of JSON objects representing the details of each element on each page.
-            - ocr_json (AnalyzeResult): The raw OCR result from the Azure Document Intelligence API.
+            - ocr_json (AnalyzeResult or ColumnarDocument): The raw OCR result from the Azure Document Intelligence API,
+              or its ColumnarDocument when columnar is set.
     
     Supported Formats:
         - PDF
@@ -30,31 +69,245 @@ def analyze_document_text(client, file_path: str, calculate_confidence: bool = T
         - Microsoft Office: Word (DOCX)
 
     """
-    with open(file_path, "rb") as f:
+    cache_key = None
+    if cache is not None:
+        cache_key = _cache_key(cache, file_path, pages_per_request)
+        ocr_result = _cached_result(cache, cache_key, columnar)
+        if ocr_result is not None:
+            return post_process_result(ocr_result, calculate_confidence, calculate_cell_confidence, columnar, text_assembly)
+
+    page_ranges = _page_ranges(file_path, pages_per_request)
+    if len(page_ranges) > 1:
+        # Every range is sent the whole document, so read a stream only once; in-memory documents are shared as they are
+        source = file_path.read() if hasattr(file_path, "read") and not is_buffer(file_path) else file_path
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_concurrency, len(page_ranges))) as executor:
+            analyze_pages = functools.partial(analyze_range, client, source, max_polling_delay=max_polling_delay, columnar=columnar,
+                                              polling_interval=polling_interval)
+            results = list(executor.map(analyze_pages, page_ranges))
+        ocr_result = _merge_results(results, columnar)
+    else:
+        ocr_result: "AnalyzeResult" = analyze_range(client, file_path, max_polling_delay=max_polling_delay, columnar=columnar,
+                                                    polling_interval=polling_interval)
+
+    if cache is not None:
+        cache.put(cache_key, ocr_result if columnar else ocr_result.as_dict())
+
+    return post_process_result(ocr_result, calculate_confidence, calculate_cell_confidence, columnar, text_assembly)
+
+
+async def analyze_document_text_async(client, file_path, calculate_confidence: bool = True, calculate_cell_confidence: bool = False, executor=None, cache=None,
+                                      pages_per_request: int = None, max_concurrency: int = 4, max_polling_delay: float = None,
+                                      columnar: bool = False, text_assembly: str = "render", polling_interval: float = None) -> tuple:
+    """
+    Extracts text from a file using the asynchronous Azure Document Intelligence client and processes the result.
+
+    The analysis is awaited without blocking the event loop, and the CPU-bound post-processing runs in an
+    executor, so a single event loop can keep many analyses in flight.
+
+    Args:
+        client (azure.ai.documentintelligence.aio.DocumentIntelligenceClient): The asynchronous Azure Document Intelligence client.
+        file_path (str, bytes-like, mmap or file-like): The document, as in analyze_document_text.
+        calculate_confidence (bool): Flag to calculate confidence scores for paragraphs, tables, and figures. Default is True.
+        calculate_cell_confidence (bool): Flag to calculate confidence scores for individual table cells. Default is False.
+        executor (concurrent.futures.Executor, optional): The executor running the post-processing. Defaults to the
+            event loop's default executor.
+        cache (AnalyzeResultCache, optional): A cache of raw analysis results, used as in analyze_document_text.
+            Cache reads and writes also run in the executor.
+        pages_per_request (int, optional): Splits PDF documents into page ranges analyzed concurrently, as in
+            analyze_document_text.
+        max_concurrency (int): The maximum number of page ranges analyzed at a time. Default is 4.
+        max_polling_delay (float, optional): Polls the analysis adaptively, as in analyze_document_text.
+        columnar (bool): Flag to decode the result into a ColumnarDocument, as in analyze_document_text. The
+            columns are built in the executor. Default is False.
+        text_assembly (str): "render" (default) or "spans", as in analyze_document_text.
+        polling_interval (float, optional): The delay between status requests, as in analyze_document_text.
+
+    Returns:
+        tuple: The same tuple as analyze_document_text.
+    """
+    loop = asyncio.get_running_loop()
+
+    cache_key = None
+    ocr_result = None
+    if cache is not None:
+        cache_key = await loop.run_in_executor(executor, _cache_key, cache, file_path, pages_per_request)
+        ocr_result = await loop.run_in_executor(executor, _cached_result, cache, cache_key, columnar)
+
+    if ocr_result is None:
+        page_ranges = await loop.run_in_executor(executor, _page_ranges, file_path, pages_per_request)
+        if len(page_ranges) > 1:
+            source = file_path
+            if hasattr(file_path, "read") and not is_buffer(file_path):
+                source = await loop.run_in_executor(executor, file_path.read)
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def analyze_pages(pages):
+                async with semaphore:
+                    return await analyze_range_async(client, source, pages, max_polling_delay, columnar, polling_interval)
+
+            results = await asyncio.gather(*(analyze_pages(pages) for pages in page_ranges))
+            ocr_result = await loop.run_in_executor(executor, _merge_results, results, columnar)
+        else:
+            ocr_result = await analyze_range_async(client, file_path, max_polling_delay=max_polling_delay, columnar=columnar,
+                                                   polling_interval=polling_interval)
+
+        if cache is not None:
+            await loop.run_in_executor(executor, cache.put, cache_key, ocr_result if columnar else ocr_result.as_dict())
+
+    # Offload the post-processing so it does not block the event loop
+    return await loop.run_in_executor(
+        executor,
+        functools.partial(post_process_result, ocr_result, calculate_confidence, calculate_cell_confidence, columnar, text_assembly)
+    )
+
+
+def _cache_key(cache, source, pages_per_request=None):
+    """
+    Returns the cache key of a document analyzed with this module's model and content format.
+    """
+    from azure.ai.documentintelligence.models import ContentFormat
+
+    # Results merged from page ranges are kept apart from whole-document results
+    options = {"pages_per_request": pages_per_request} if pages_per_request else {}
+    return cache.make_key(hash_document(source), MODEL_ID, ContentFormat.MARKDOWN, **options)
+
+
+def _page_ranges(source, pages_per_request):
+    """
+    Returns the page ranges to analyze the document in, or an empty list to analyze it in one request.
+    """
+    if not pages_per_request:
+        return []
+    return pdf_page_ranges(source, pages_per_request)
+
+
+def analyze_range(client, source, pages=None, max_polling_delay=None, columnar=False, polling_interval=None):
+    """
+    Analyzes a document, or only the given page range of it, without post-processing the result.
+
+    Args:
+        client (DocumentIntelligenceClient): The Azure Document Intelligence client.
+        source (str, bytes-like, mmap or file-like): The document, as in analyze_document_text.
+        pages (str, optional): The pages to analyze, such as "1-100". Defaults to every page.
+        max_polling_delay (float, optional): Polls the analysis adaptively, as in analyze_document_text.
+        columnar (bool): Flag to return the decoded JSON dictionary of the result. Default is False.
+        polling_interval (float, optional): The delay between status requests, as in analyze_document_text.
+
+    Returns:
+        AnalyzeResult or dict: The result of the analysis, or its dictionary when columnar is set.
+    """
+    # Imported here so that post-processing cached results does not load the SDK models
+    from azure.ai.documentintelligence.models import ContentFormat
+
+    options = _polling_options(client, source, pages, max_polling_delay, columnar, polling_interval, asynchronous=False)
+
+    with open_document(source) as f, stage("upload", pages=pages or "all"):
         poller = client.begin_analyze_document(
-            model_id="prebuilt-layout",
+            model_id=MODEL_ID,
+            analyze_request=f,
+            pages=pages,
+            output_content_format=ContentFormat.MARKDOWN,
+            content_type="application/octet-stream",
+            **options
+        )
+
+    with stage("polling", pages=pages or "all"):
+        return poller.result()
+
+
+async def analyze_range_async(client, source, pages=None, max_polling_delay=None, columnar=False, polling_interval=None):
+    """
+    Analyzes a document, or only the given page range of it, with the asynchronous client. The arguments and
+    result are those of analyze_range.
+    """
+    from azure.ai.documentintelligence.models import ContentFormat
+
+    options = _polling_options(client, source, pages, max_polling_delay, columnar, polling_interval, asynchronous=True)
+
+    with open_upload(source) as f, stage("upload", pages=pages or "all"):
+        poller = await client.begin_analyze_document(
+            model_id=MODEL_ID,
             analyze_request=f,
+            pages=pages,
             output_content_format=ContentFormat.MARKDOWN,
             content_type="application/octet-stream",
+            headers=content_length_headers(f),
+            **options
         )
 
-    ocr_result: AnalyzeResult = poller.result()
+    with stage("polling", pages=pages or "all"):
+        return await poller.result()
+
+
+def _polling_options(client, source, pages, max_polling_delay, columnar, polling_interval, asynchronous):
+    """
+    Returns the polling keyword arguments of begin_analyze_document, empty to keep the SDK's polling.
+    """
+    if max_polling_delay is None and not columnar:
+        return {} if polling_interval is None else {"polling_interval": polling_interval}
+    if polling_interval is None:
+        # The SDK only applies the client's polling interval to the polling methods it builds itself
+        polling_interval = client._config.polling_interval
+    from document_intelligence_wrapper.extractors.polling import polling_method
+    return {"polling": polling_method(source, pages, max_polling_delay, json_result=columnar, asynchronous=asynchronous,
+                                      polling_interval=polling_interval)}
+
+
+def _merge_results(results, columnar=False):
+    """
+    Merges the results of the page ranges of a document into one AnalyzeResult, or one dictionary when columnar is set.
+    """
+    if columnar:
+        return merge_analyze_results(results)
+
+    from azure.ai.documentintelligence.models import AnalyzeResult
+
+    return AnalyzeResult(merge_analyze_results([result.as_dict() for result in results]))
+
+
+def _cached_result(cache, cache_key, columnar=False):
+    """
+    Returns the cached analysis result as an AnalyzeResult, or as its dictionary when columnar is set, or None on a miss.
+    """
+    cached = cache.get(cache_key)
+    if cached is None or columnar:
+        return cached
+
+    from azure.ai.documentintelligence.models import AnalyzeResult
+
+    return AnalyzeResult(cached)
 
-    print("ocr_result",ocr_result)
+
+def post_process_result(ocr_result, calculate_confidence=True, calculate_cell_confidence=False, columnar=False, text_assembly="render"):
+    """
+    Runs process_document and extract_page_text on an analysis result, first decoded into a ColumnarDocument
+    when columnar is set.
+
+    Args:
+        ocr_result (AnalyzeResult, dict or ColumnarDocument): The analysis result.
+        calculate_confidence (bool): Flag to calculate confidence scores for paragraphs, tables, and figures. Default is True.
+        calculate_cell_confidence (bool): Flag to calculate confidence scores for individual table cells. Default is False.
+        columnar (bool): Flag to decode a result dictionary into a ColumnarDocument first. Default is False.
+        text_assembly (str): "render" (default) or "spans", as in analyze_document_text.
+
+    Returns:
+        tuple: The page text, table text, full document text, page elements and the OCR result itself.
+    """
+    if columnar:
+        with stage("columnar"):
+            ocr_result = ColumnarDocument.from_dict(ocr_result)
 
     # Process the document to extract page sections and figure associations
     page_section, figure_associations = process_document(ocr_result)
 
-    print("page_section",page_section)
-    print("figure_associations",figure_associations)
-
     # Extract page text with the option to calculate confidence scores based on flags
     page_text, table_text, doc_text, all_page_elements = extract_page_text(
         ocr_result,
         page_section,
         figure_associations,
         calculate_confidence=calculate_confidence,
-        calculate_cell_confidence=calculate_cell_confidence
+        calculate_cell_confidence=calculate_cell_confidence,
+        text_assembly=text_assembly
     )
 
     return page_text, table_text, doc_text, all_page_elements, ocr_result
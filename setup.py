@@ -12,10 +12,24 @@ setup(
     url='https://github.com/ankitkhandelwal18/document-intelligence-wrapper',
     packages=find_packages(),
     install_requires=[
-        'tabulate==0.9.0',
         'azure-ai-documentintelligence==1.0.0b3',
-        'pandas==2.2.2'
+        'numpy==1.26.4'
     ],
+    extras_require={
+        # AsyncDocumentIntelligenceClientWrapper and analyze_document_text_async
+        'async': ['aiohttp>=3.8'],
+        # pages_per_request and analyze_document_incremental
+        'pdf': ['pypdf>=3.0'],
+        # Faster decoding of columnar results and serialization of page elements
+        'fast-json': ['orjson>=3.6'],
+        # ParquetExporter, export_parquet and page_element_batches
+        'arrow': ['pyarrow>=12.0,<21'],
+    },
+    entry_points={
+        'console_scripts': [
+            'document-intelligence-postprocess=document_intelligence_wrapper.extractors.offline_processor:main',
+        ],
+    },
     classifiers=[
         'Programming Language :: Python :: 3',
         'Programming Language :: Python :: 3.10',
@@ -0,0 +1,20 @@
+# tests/conftest.py
+
+import json
+import os
+
+import pytest
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# A small saved layout result: three pages with paragraphs, a table with a merged header cell and a figure each
+LAYOUT_PATH = os.path.join(DATA_DIR, "layout.json")
+
+
+@pytest.fixture
+def analyze_result():
+    """
+    Returns a fresh copy of the saved AnalyzeResult as a dictionary.
+    """
+    with open(LAYOUT_PATH, encoding="utf-8") as f:
+        return json.load(f)
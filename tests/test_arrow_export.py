@@ -0,0 +1,123 @@
+# tests/test_arrow_export.py
+
+import os
+
+import pytest
+
+from document_intelligence_wrapper.extractors.element_model import PageElements
+from document_intelligence_wrapper.extractors.text_extractor import post_process_result
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from document_intelligence_wrapper.extractors.arrow_export import ParquetExporter, export_parquet, page_element_batches  # noqa: E402
+
+SCHEMAS = {
+    "elements": [
+        ("document_id", pa.string()), ("page_number", pa.int32()), ("element_index", pa.int32()),
+        ("element_name", pa.string()), ("content", pa.string()), ("polygon", pa.list_(pa.float64())),
+        ("confidence_average", pa.float64()), ("confidence_weighted", pa.float64()),
+    ],
+    "tables": [
+        ("document_id", pa.string()), ("table_index", pa.int32()), ("page_number", pa.int32()),
+        ("element_index", pa.int32()), ("row_count", pa.int32()), ("column_count", pa.int32()),
+        ("cell_count", pa.int32()), ("markdown", pa.string()),
+    ],
+    "cells": [
+        ("document_id", pa.string()), ("table_index", pa.int32()), ("page_number", pa.int32()),
+        ("row_index", pa.int32()), ("column_index", pa.int32()), ("row_span", pa.int32()),
+        ("column_span", pa.int32()), ("content", pa.string()), ("polygon", pa.list_(pa.float64())),
+        ("confidence_average", pa.float64()), ("confidence_weighted", pa.float64()),
+    ],
+}
+
+
+def _expected_rows(document_id, all_page_elements):
+    """
+    Returns the rows each dataset should hold for the page elements, built from their dictionary form.
+    """
+    rows = {"elements": [], "tables": [], "cells": []}
+    table_index = 0
+    for page in all_page_elements:
+        page_number = page["page_number"]
+        for element_index, element in enumerate(page["elements"]):
+            confidence = element["confidence_score"]
+            rows["elements"].append({
+                "document_id": document_id, "page_number": page_number, "element_index": element_index,
+                "element_name": element["element_name"], "content": element["content"], "polygon": element["bounding_box"],
+                "confidence_average": confidence["average"], "confidence_weighted": confidence["weighted"],
+            })
+            if element["element_name"] != "table":
+                continue
+
+            table_index += 1
+            cells = element.get("cells")
+            for cell in cells or ():
+                rows["cells"].append({
+                    "document_id": document_id, "table_index": table_index, "page_number": page_number,
+                    "row_index": cell["rowIndex"], "column_index": cell["columnIndex"],
+                    "row_span": cell["rowSpan"], "column_span": cell["columnSpan"], "content": cell["content"],
+                    "polygon": cell["bounding_box"], "confidence_average": cell["confidence_score"]["average"],
+                    "confidence_weighted": cell["confidence_score"]["weighted"],
+                })
+            rows["tables"].append({
+                "document_id": document_id, "table_index": table_index, "page_number": page_number,
+                "element_index": element_index,
+                "row_count": max(cell["rowIndex"] + cell["rowSpan"] for cell in cells) if cells else None,
+                "column_count": max(cell["columnIndex"] + cell["columnSpan"] for cell in cells) if cells else None,
+                "cell_count": None if cells is None else len(cells),
+                "markdown": element["content"],
+            })
+    return rows
+
+
+def test_batches_hold_the_page_elements(analyze_result):
+    all_page_elements = post_process_result(analyze_result, calculate_cell_confidence=True)[3]
+    expected = _expected_rows("layout", all_page_elements)
+    assert [len(expected[name]) for name in SCHEMAS] == [18, 3, 30]
+
+    for pages in (all_page_elements, [PageElements.from_dict(page) for page in all_page_elements]):
+        batches = page_element_batches("layout", pages)
+        assert list(batches) == list(SCHEMAS)
+        for name, batch in batches.items():
+            assert batch.schema == pa.schema(SCHEMAS[name])
+            assert batch.to_pylist() == expected[name]
+
+
+def test_tables_without_cell_details(analyze_result):
+    all_page_elements = post_process_result(analyze_result)[3]
+
+    batches = page_element_batches("layout", all_page_elements)
+
+    assert batches["cells"].num_rows == 0
+    assert batches["cells"].schema == pa.schema(SCHEMAS["cells"])
+    # The counts that come from the cells are left empty
+    assert batches["tables"].to_pylist() == _expected_rows("layout", all_page_elements)["tables"]
+    assert batches["tables"].column("cell_count").null_count == 3
+
+
+def test_parquet_datasets_hold_every_document(tmp_path, analyze_result):
+    all_page_elements = post_process_result(analyze_result, calculate_cell_confidence=True)[3]
+    documents = [("first", all_page_elements), ("second", [PageElements.from_dict(page) for page in all_page_elements])]
+
+    # Small batches write several row groups per dataset
+    with ParquetExporter(str(tmp_path / "out"), batch_rows=3, part_name="part") as exporter:
+        for document_id, pages in documents:
+            exporter.add(document_id, pages)
+
+    for name in SCHEMAS:
+        path = tmp_path / "out" / name / "part.parquet"
+        assert pq.ParquetFile(path).metadata.num_row_groups > 1
+        table = pq.read_table(path)
+        assert table.schema == pa.schema(SCHEMAS[name])
+        # Tables are numbered within each document
+        assert table.to_pylist() == _expected_rows("first", all_page_elements)[name] + _expected_rows("second", all_page_elements)[name]
+
+
+def test_export_skips_datasets_without_rows(tmp_path, analyze_result):
+    all_page_elements = post_process_result(analyze_result)[3]
+
+    paths = export_parquet([("layout", all_page_elements)], str(tmp_path))
+
+    assert sorted(os.path.relpath(path, tmp_path).split(os.sep)[0] for path in paths) == ["elements", "tables"]
+    assert not os.path.exists(tmp_path / "cells")
@@ -0,0 +1,74 @@
+# tests/test_async_upload.py
+
+import asyncio
+import mmap
+import urllib.error
+import urllib.request
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from benchmarks.mock_service import MockDocumentIntelligenceService
+from document_intelligence_wrapper import AsyncDocumentIntelligenceClientWrapper, analyze_document_text_async, submit_document_async
+
+DOCUMENT = b"%PDF-1.4\n" + b"0" * 100000 + b"\n%%EOF\n"
+
+
+@pytest.fixture
+def service():
+    # One request per second: the test drains the bucket, so the upload is answered 429 and retried
+    with MockDocumentIntelligenceService(pages=2, latency=0, rate_limit=1, burst=1, poll_retry_after=0) as service:
+        yield service
+
+
+def _throttle_next_request(service):
+    # A status request takes the only token of the bucket, whatever its answer
+    try:
+        urllib.request.urlopen(f"{service.endpoint}/documentModels/prebuilt-layout/analyzeResults/unknown").close()
+    except urllib.error.HTTPError as e:
+        assert e.code == 404
+
+
+async def _analyze(endpoint, source):
+    async with AsyncDocumentIntelligenceClientWrapper(endpoint, "key", retry_backoff_factor=0) as wrapper:
+        return await analyze_document_text_async(wrapper.client, source, calculate_confidence=False)
+
+
+@pytest.mark.parametrize("make_source", [bytes, bytearray, memoryview], ids=["bytes", "bytearray", "memoryview"])
+def test_retried_upload_resends_in_memory_document(service, make_source):
+    _throttle_next_request(service)
+
+    page_text, _, doc_text, _, ocr_result = asyncio.run(_analyze(service.endpoint, make_source(DOCUMENT)))
+
+    assert service.stats["throttled"] >= 1
+    assert service.stats["submitted"] == 1
+    assert service.stats["bytes_received"] == len(DOCUMENT)
+    assert len(page_text) == len(ocr_result.pages) == 2
+    assert doc_text
+
+
+def test_retried_upload_releases_memory_mapped_document(service, tmp_path):
+    path = tmp_path / "document.pdf"
+    path.write_bytes(DOCUMENT)
+    _throttle_next_request(service)
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        asyncio.run(_analyze(service.endpoint, mapped))
+        assert service.stats["bytes_received"] == len(DOCUMENT)
+    # Closing the map above fails if the upload still holds a view of it
+    assert mapped.closed
+
+
+def test_retried_submission_resends_document(service):
+    _throttle_next_request(service)
+
+    async def submit():
+        async with AsyncDocumentIntelligenceClientWrapper(service.endpoint, "key", retry_backoff_factor=0) as wrapper:
+            return await submit_document_async(wrapper.client, DOCUMENT)
+
+    handle = asyncio.run(submit())
+
+    assert handle.operation_id
+    assert service.stats["throttled"] >= 1
+    assert service.stats["bytes_received"] == len(DOCUMENT)
@@ -0,0 +1,106 @@
+# tests/test_batch_extractor.py
+
+import io
+import os
+import threading
+
+from azure.core.exceptions import HttpResponseError
+
+from document_intelligence_wrapper.extractors import batch_extractor
+from document_intelligence_wrapper.extractors.batch_extractor import analyze_documents
+
+
+def _fake_analysis(monkeypatch):
+    """
+    Replaces the analysis of every document with an instant one, and returns the list of analyzed sources.
+    """
+    started = []
+    lock = threading.Lock()
+
+    def analyze_document_text(client, source, **options):
+        with lock:
+            started.append(source)
+        return ("result", source)
+
+    monkeypatch.setattr(batch_extractor, "analyze_document_text", analyze_document_text)
+    return started
+
+
+def test_results_waiting_for_the_consumer_hold_back_submissions(monkeypatch):
+    started = _fake_analysis(monkeypatch)
+    max_concurrency = 3
+
+    consumed = 0
+    for batch_result in analyze_documents(None, range(20), max_concurrency=max_concurrency):
+        assert batch_result.error is None
+        # Besides the result being handed back, at most max_concurrency analyses are running or waiting
+        assert len(started) - consumed - 1 <= max_concurrency
+        consumed += 1
+
+    assert consumed == 20
+    assert sorted(started) == list(range(20))
+
+
+def test_errors_reading_sources_are_reported(monkeypatch):
+    _fake_analysis(monkeypatch)
+
+    def sources():
+        yield "a"
+        yield "b"
+        raise PermissionError("unreadable directory")
+
+    results = list(analyze_documents(None, sources(), max_concurrency=2))
+
+    assert sorted(result.source for result in results if result.error is None) == ["a", "b"]
+    failed, = [result for result in results if result.error is not None]
+    assert failed.source is None
+    assert failed.attempts == 0
+    assert isinstance(failed.error, PermissionError)
+
+
+def _pipe(data):
+    read_fd, write_fd = os.pipe()
+    with open(write_fd, "wb") as writer:
+        writer.write(data)
+    return open(read_fd, "rb")
+
+
+def test_pipes_are_analyzed_and_unreadable_streams_reported(monkeypatch):
+    started = _fake_analysis(monkeypatch)
+    pipe = _pipe(b"%PDF-1.7")
+    closed = io.BytesIO(b"%PDF-1.7")
+    closed.close()
+
+    with pipe:
+        results = list(analyze_documents(None, [pipe, closed, "a"], max_concurrency=2))
+
+    def result_of(source):
+        result, = [result for result in results if result.source is source]
+        return result
+
+    assert result_of(pipe).error is None
+    assert result_of("a").error is None
+    # The closed stream fails on its own, before any analysis, without ending the batch
+    assert isinstance(result_of(closed).error, ValueError)
+    assert result_of(closed).attempts == 0
+    assert closed not in started
+
+
+def test_throttled_pipes_are_not_retried(monkeypatch):
+    attempts = []
+
+    def analyze_document_text(client, source, **options):
+        attempts.append(source.read())
+        error = HttpResponseError("Too many requests")
+        error.status_code = 429
+        raise error
+
+    monkeypatch.setattr(batch_extractor, "analyze_document_text", analyze_document_text)
+
+    with _pipe(b"%PDF-1.7") as pipe:
+        result, = analyze_documents(None, [pipe], backoff_base=0)
+
+    # A retry would send whatever is left of the stream, which is nothing
+    assert attempts == [b"%PDF-1.7"]
+    assert result.attempts == 1
+    assert result.error.status_code == 429
@@ -0,0 +1,118 @@
+# tests/test_chunker.py
+
+import pytest
+
+from document_intelligence_wrapper.extractors.chunker import iter_chunks
+from document_intelligence_wrapper.extractors.element_model import PageElements
+from document_intelligence_wrapper.extractors.text_extractor import post_process_result
+
+SEPARATOR = "\n\n"
+
+
+def _element(element_name, content, weighted=0.5):
+    return {
+        "element_name": element_name,
+        "content": content,
+        "bounding_box": [0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0],
+        "confidence_score": {"average": weighted, "weighted": weighted},
+    }
+
+
+def _pieces(chunks):
+    """
+    Returns the (page number, element index) and text of every piece of the chunks, in order.
+    """
+    pieces = []
+    for chunk in chunks:
+        texts = chunk.text.split(SEPARATOR)
+        assert len(texts) == len(chunk.elements) == len(chunk.bounding_boxes)
+        pieces.extend(zip(chunk.elements, texts))
+    return pieces
+
+
+@pytest.mark.parametrize("max_chars", [40, 75, 150, 400, 5000])
+def test_chunks_cover_the_elements_once_and_in_order(analyze_result, max_chars):
+    all_page_elements = post_process_result(analyze_result)[3]
+    elements = {
+        (page["page_number"], element_index): element
+        for page in all_page_elements for element_index, element in enumerate(page["elements"])
+    }
+
+    chunks = list(iter_chunks(all_page_elements, max_chars=max_chars, separator=SEPARATOR))
+    pieces = _pieces(chunks)
+
+    # Joining the pieces of each element gives back its text, and no text is repeated between chunks
+    joined = {}
+    for position, text in pieces:
+        joined.setdefault(position, []).append(text)
+    assert list(joined) == list(elements)
+    for position, texts in joined.items():
+        assert " ".join(texts) == elements[position]["content"]
+
+    for chunk in chunks:
+        if len(chunk.text) > max_chars:
+            # Only a table too long for any chunk goes over the bound, alone
+            (position,) = chunk.elements
+            assert elements[position]["element_name"] == "table"
+        assert chunk.page_numbers == tuple(dict.fromkeys(page_number for page_number, _ in chunk.elements))
+
+    # A chunk is only closed when the next piece does not fit in it
+    next_piece = 0
+    for chunk in chunks[:-1]:
+        next_piece += len(chunk.elements)
+        _, next_text = pieces[next_piece]
+        assert len(chunk.text) + len(SEPARATOR) + len(next_text) > max_chars
+
+
+def test_long_paragraphs_continue_in_the_next_chunk():
+    paragraph = " ".join(f"word{index}" for index in range(30))
+    pages = [{"page_number": 1, "elements": [_element("paragraph", "before"), _element("paragraph", paragraph)]},
+             {"page_number": 2, "elements": [_element("paragraph", "after")]}]
+
+    chunks = list(iter_chunks(pages, max_chars=50, separator=SEPARATOR))
+
+    assert all(len(chunk.text) <= 50 for chunk in chunks)
+    # The paragraph is split at whitespace, and each chunk it continues in holds the next words only
+    split = [text for position, text in _pieces(chunks) if position == (1, 1)]
+    assert len(split) > 2
+    assert " ".join(split) == paragraph
+    assert all(not text.startswith(" ") and not text.endswith(" ") for text in split)
+    # Consecutive chunks share only the element split between them
+    for previous, current in zip(chunks, chunks[1:]):
+        assert set(previous.elements) & set(current.elements) <= {(1, 1)}
+    assert chunks[0].elements[0] == (1, 0)
+    assert chunks[-1].elements[-1] == (2, 0)
+    assert chunks[-1].page_numbers == (1, 2)
+
+
+def test_tables_are_never_split():
+    table = "| a | b |\n|:--|:--|\n" + "\n".join(f"| {index} | {index * 2} |" for index in range(10))
+    pages = [{"page_number": 1, "elements": [_element("paragraph", "x" * 10), _element("table", table), _element("figure", "y" * 10)]}]
+
+    chunks = list(iter_chunks(pages, max_chars=30, separator=SEPARATOR))
+
+    assert [chunk.text for chunk in chunks] == ["x" * 10, table, "y" * 10]
+    assert [chunk.elements for chunk in chunks] == [((1, 0),), ((1, 1),), ((1, 2),)]
+
+
+def test_words_longer_than_a_chunk_are_cut():
+    pages = [{"page_number": 1, "elements": [_element("paragraph", "a" * 25 + " b")]}]
+
+    assert [chunk.text for chunk in iter_chunks(pages, max_chars=10)] == ["a" * 10, "a" * 10, "a" * 5 + " b"]
+
+
+def test_confidence_is_averaged_by_text_length():
+    pages = [{"page_number": 1, "elements": [_element("paragraph", "a" * 30, 1.0), _element("paragraph", "", 0.9),
+                                             _element("figure", "b" * 10, 0.0)]}]
+
+    for data in (pages, [PageElements.from_dict(page) for page in pages]):
+        chunk, = iter_chunks(data, max_chars=100, separator=" ")
+        assert chunk.text == "a" * 30 + " " + "b" * 10
+        # Elements without text are skipped
+        assert chunk.elements == ((1, 0), (1, 2))
+        assert chunk.confidence == pytest.approx(0.75)
+
+
+def test_max_chars_must_be_positive():
+    with pytest.raises(ValueError):
+        list(iter_chunks([], max_chars=0))
@@ -0,0 +1,86 @@
+# tests/test_confidence_engine.py
+
+import pytest
+
+from document_intelligence_wrapper.extractors import confidence_engine
+from document_intelligence_wrapper.extractors.columnar import ColumnarDocument
+from document_intelligence_wrapper.extractors.confidence_engine import build_confidence_engines, score_elements
+from document_intelligence_wrapper.extractors.document_processor import process_document
+from document_intelligence_wrapper.extractors.extract_utils import extract_page_text
+from document_intelligence_wrapper.extractors.helpers import calculate_confidence_score
+
+
+def _elements(result):
+    return result["paragraphs"] + result["tables"] + [cell for table in result["tables"] for cell in table["cells"]]
+
+
+def _flat(scores):
+    # pytest.approx does not compare nested sequences
+    return [value for score in scores for value in score]
+
+
+def _reference_scores(result, elements):
+    """
+    Scores every element with the per-element helper, which scans the words of the element's page.
+    """
+    return [calculate_confidence_score(element, result) for element in elements]
+
+
+def test_scores_match_the_per_element_helper(analyze_result):
+    elements = _elements(analyze_result)
+    scores = score_elements(elements, analyze_result)
+
+    assert _flat(scores) == pytest.approx(_flat(_reference_scores(analyze_result, elements)))
+    # The comparison only means something if the fixture's elements contain words
+    assert any(weighted > 0 for _, weighted in scores)
+
+
+def test_columnar_documents_score_the_same(analyze_result):
+    elements = _elements(analyze_result)
+    columnar = ColumnarDocument.from_dict(analyze_result)
+
+    assert _flat(score_elements(elements, columnar)) == pytest.approx(_flat(score_elements(elements, analyze_result)))
+
+
+def test_chunked_masks_score_the_same(analyze_result, monkeypatch):
+    elements = _elements(analyze_result)
+    expected = score_elements(elements, analyze_result)
+
+    # Compare one element at a time against the page's words
+    monkeypatch.setattr(confidence_engine, "MAX_MASK_SIZE", 1)
+    assert _flat(score_elements(elements, analyze_result)) == pytest.approx(_flat(expected))
+
+
+def test_only_words_of_the_element_page_are_scored():
+    polygon = [0, 0, 10, 0, 10, 10, 0, 10]
+    word = {"polygon": [1, 1, 2, 1, 2, 2, 1, 2], "content": "word"}
+    result = {
+        "pages": [
+            {"pageNumber": 1, "words": [dict(word, confidence=0.2)]},
+            {"pageNumber": 2, "words": [dict(word, confidence=0.8)]},
+        ],
+    }
+    on_page_2 = {"boundingRegions": [{"pageNumber": 2, "polygon": polygon}]}
+    on_missing_page = {"boundingRegions": [{"pageNumber": 3, "polygon": polygon}]}
+
+    assert score_elements([on_page_2, on_missing_page], result) == [(0.8, 0.8), (0, 0)]
+    assert set(build_confidence_engines(result, {2})) == {2}
+
+
+def test_extract_page_text_scores_with_the_engine(analyze_result):
+    paragraphs = analyze_result["paragraphs"]
+    expected = dict(zip((paragraph["content"] for paragraph in paragraphs), _reference_scores(analyze_result, paragraphs)))
+
+    all_page_elements = extract_page_text(analyze_result, *process_document(analyze_result), calculate_confidence=True)[3]
+
+    paragraph_scores = [
+        (element["content"], element["confidence_score"])
+        for page in all_page_elements
+        for element in page["elements"]
+        if element["element_name"] == "paragraph"
+    ]
+    assert paragraph_scores
+    for content, confidence_score in paragraph_scores:
+        average, weighted = expected[content]
+        assert confidence_score["average"] == pytest.approx(average)
+        assert confidence_score["weighted"] == pytest.approx(weighted)
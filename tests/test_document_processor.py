@@ -0,0 +1,44 @@
+# tests/test_document_processor.py
+
+from document_intelligence_wrapper.extractors.columnar import ColumnarDocument
+from document_intelligence_wrapper.extractors.document_processor import process_document
+
+FIGURE_POLYGON = [0.5, 7.772727272727273, 4.25, 7.772727272727273, 4.25, 10.5, 0.5, 10.5]
+
+# Each page holds four body paragraphs, a table and a figure whose caption is the page's last paragraph
+EXPECTED_PAGES = {
+    1: ["paragraphs 0", "paragraphs 1", "paragraphs 2", "paragraphs 3", "tables 0", "figures 0"],
+    2: ["paragraphs 5", "paragraphs 6", "paragraphs 7", "paragraphs 8", "tables 1", "figures 1"],
+    3: ["paragraphs 10", "paragraphs 11", "paragraphs 12", "paragraphs 13", "tables 2", "figures 2"],
+}
+
+EXPECTED_FIGURES = {
+    f"figures {index}": {"associated_paragraphs": [caption], "polygons": [FIGURE_POLYGON]}
+    for index, caption in enumerate([4, 9, 14])
+}
+
+
+def _forms(result):
+    """
+    Returns the result as a dictionary and as a ColumnarDocument.
+    """
+    return [result, ColumnarDocument.from_dict(result)]
+
+
+def test_elements_follow_the_sections(analyze_result):
+    for data in _forms(analyze_result):
+        page_section, figure_associations = process_document(data)
+        assert page_section == EXPECTED_PAGES
+        assert list(page_section) == [1, 2, 3]
+        assert figure_associations == EXPECTED_FIGURES
+
+
+def test_section_order_wins_over_element_order(analyze_result):
+    # Reading the second page's section backwards reverses that page only
+    analyze_result["sections"][2]["elements"].reverse()
+    expected = {**EXPECTED_PAGES, 2: EXPECTED_PAGES[2][::-1]}
+
+    for data in _forms(analyze_result):
+        page_section, figure_associations = process_document(data)
+        assert page_section == expected
+        assert figure_associations == EXPECTED_FIGURES
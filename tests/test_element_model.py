@@ -0,0 +1,31 @@
+# tests/test_element_model.py
+
+import json
+
+import pytest
+
+from document_intelligence_wrapper.extractors.document_processor import process_document
+from document_intelligence_wrapper.extractors.element_model import PageElements, dumps_page_elements
+from document_intelligence_wrapper.extractors.extract_utils import extract_page_text
+
+
+@pytest.mark.parametrize("calculate_cell_confidence", [False, True])
+def test_compact_elements_round_trip(analyze_result, calculate_cell_confidence):
+    page_section, figure_associations = process_document(analyze_result)
+
+    def extract(compact_elements):
+        return extract_page_text(analyze_result, page_section, figure_associations, calculate_cell_confidence=calculate_cell_confidence,
+                                 execution_mode="serial", compact_elements=compact_elements)
+
+    page_text, table_text, full_text, all_page_elements = extract(False)
+    compact = extract(True)
+
+    assert compact[:3] == (page_text, table_text, full_text)
+    assert all(isinstance(page, PageElements) for page in compact[3])
+    assert any(element.cells is not None for page in compact[3] for element in page.elements) == calculate_cell_confidence
+
+    # The compact pages give back the dictionary form exactly, however they were built
+    assert [page.to_dict() for page in compact[3]] == all_page_elements
+    assert [PageElements.from_dict(page).to_dict() for page in all_page_elements] == all_page_elements
+    assert json.loads(dumps_page_elements(compact[3])) == all_page_elements
+    assert json.loads(dumps_page_elements(all_page_elements)) == all_page_elements
@@ -0,0 +1,48 @@
+# tests/test_extract_utils.py
+
+import copy
+
+from document_intelligence_wrapper.extractors.document_processor import process_document
+from document_intelligence_wrapper.extractors.extract_utils import _rebase_spans, page_data_slice, span_text
+
+
+def test_rebased_spans_slice_the_same_text():
+    content = "0123456789abcdefghij"
+    paragraphs = {4: {"spans": [{"offset": 10, "length": 3}]}}
+    tables = {1: {"spans": [{"offset": 2, "length": 2}, {"offset": 15, "length": 4}]}}
+    figures = {0: {"spans": []}, 2: {}}
+    elements = [paragraphs[4], tables[1], figures[0], figures[2]]
+    original = copy.deepcopy(elements)
+
+    rebased_content = _rebase_spans(content, (paragraphs, tables, figures))
+
+    assert rebased_content == "abc23fghi"
+    assert paragraphs[4]["spans"] == [{"offset": 0, "length": 3}]
+    assert tables[1]["spans"] == [{"offset": 3, "length": 2}, {"offset": 5, "length": 4}]
+    assert figures == {0: {"spans": []}, 2: {"spans": []}}
+
+    # The elements are given new dictionaries, so the ones passed in are left as they were
+    assert elements == original
+
+
+def test_rebased_spans_do_not_modify_the_document(analyze_result):
+    paragraphs = dict(enumerate(analyze_result["paragraphs"]))
+    original = copy.deepcopy(analyze_result["paragraphs"])
+
+    _rebase_spans(analyze_result["content"], (paragraphs, {}, {}))
+
+    assert analyze_result["paragraphs"] == original
+
+
+def test_page_slices_hold_the_span_text_of_their_elements(analyze_result):
+    page_section, figure_associations = process_document(analyze_result)
+    pages_by_number = {page["pageNumber"]: page for page in analyze_result["pages"]}
+
+    for elements in page_section.values():
+        page_slice = page_data_slice(analyze_result, elements, figure_associations, pages_by_number, text_assembly="spans")
+
+        # The slice only keeps the content its elements need
+        assert len(page_slice["content"]) < len(analyze_result["content"])
+        for element_type in ("paragraphs", "tables", "figures"):
+            for index in page_slice[element_type]:
+                assert span_text(page_slice, element_type, index) == span_text(analyze_result, element_type, index)
@@ -0,0 +1,35 @@
+# tests/test_helpers.py
+
+from document_intelligence_wrapper.extractors.columnar import ColumnarDocument
+from document_intelligence_wrapper.extractors.helpers import calculate_cell_confidence_score, calculate_confidence_score
+
+POLYGON = [0, 0, 10, 0, 10, 10, 0, 10]
+WORD = {"polygon": [1, 1, 2, 1, 2, 2, 1, 2], "content": "word"}
+RESULT = {
+    "pages": [
+        {"pageNumber": 1, "words": [dict(WORD, confidence=0.2)]},
+        {"pageNumber": 2, "words": [dict(WORD, confidence=0.8), dict(WORD, polygon=[20, 20, 21, 20, 21, 21, 20, 21], confidence=0.1)]},
+        {"pageNumber": 3},
+    ],
+}
+
+
+def _element(page_number):
+    return {"boundingRegions": [{"pageNumber": page_number, "polygon": POLYGON}]}
+
+
+def test_only_words_of_the_element_page_are_scored():
+    for data in (RESULT, ColumnarDocument.from_dict(RESULT)):
+        assert calculate_confidence_score(_element(1), data) == (0.2, 0.2)
+        assert calculate_cell_confidence_score(_element(2), data) == (0.8, 0.8)
+        # Pages without words, and pages missing from the result, score 0
+        assert calculate_confidence_score(_element(3), data) == (0, 0)
+        assert calculate_cell_confidence_score(_element(4), data) == (0, 0)
+
+
+def test_helpers_match_the_layout_fixture_for_both_forms(analyze_result):
+    columnar = ColumnarDocument.from_dict(analyze_result)
+    for paragraph in analyze_result["paragraphs"]:
+        assert calculate_confidence_score(paragraph, columnar) == calculate_confidence_score(paragraph, analyze_result)
+    for cell in (cell for table in analyze_result["tables"] for cell in table["cells"]):
+        assert calculate_cell_confidence_score(cell, columnar) == calculate_cell_confidence_score(cell, analyze_result)
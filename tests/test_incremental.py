@@ -0,0 +1,114 @@
+# tests/test_incremental.py
+
+import io
+import re
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from document_intelligence_wrapper.extractors import incremental
+from document_intelligence_wrapper.extractors.incremental import analyze_document_incremental, page_fingerprints
+from document_intelligence_wrapper.extractors.result_cache import AnalyzeResultCache
+from document_intelligence_wrapper.extractors.text_extractor import post_process_result
+from test_merge_analyze_results import _split_by_page
+
+pypdf = pytest.importorskip("pypdf")
+
+
+def _pdf(labels):
+    """
+    Returns a PDF whose pages each draw their label, such as "2" or "2 revised".
+    """
+    from pypdf.generic import DecodedStreamObject
+
+    writer = pypdf.PdfWriter()
+    for label in labels:
+        page = writer.add_blank_page(200, 200)
+        stream = DecodedStreamObject()
+        stream.set_data(f"BT /F1 12 Tf 10 100 Td ({label}) Tj ET".encode())
+        page.replace_contents(stream)
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
+@pytest.fixture
+def service(analyze_result, monkeypatch):
+    """
+    Replaces the analysis of single pages: a page labelled "N" or "N ..." comes back as page N of the layout
+    fixture, analyzed on its own. Returns the list of analyzed labels.
+    """
+    page_results = _split_by_page(analyze_result, local_page_numbers=True)
+    analyzed = []
+    lock = threading.Lock()
+
+    def analyze_range(client, document):
+        page, = pypdf.PdfReader(io.BytesIO(document)).pages
+        label = re.search(rb"\((.*)\) Tj", page.get_contents().get_data()).group(1).decode()
+        with lock:
+            analyzed.append(label)
+        page_result = page_results[int(label.split()[0]) - 1]
+        return SimpleNamespace(as_dict=lambda: page_result)
+
+    monkeypatch.setattr(incremental, "analyze_range", analyze_range)
+    return analyzed
+
+
+def test_fingerprints_follow_content_not_position():
+    first, second, third = page_fingerprints(_pdf(["1", "2", "3"]))
+
+    # Inserting, removing and reordering pages keeps the fingerprints of the pages that moved
+    assert page_fingerprints(_pdf(["0", "1", "2", "3"]))[1:] == [first, second, third]
+    assert page_fingerprints(_pdf(["3", "1"])) == [third, first]
+
+    revised = page_fingerprints(_pdf(["1", "2 revised", "3"]))
+    assert revised[0] == first and revised[2] == third
+    assert revised[1] not in (first, second, third)
+
+
+def test_unchanged_pages_come_from_the_cache(tmp_path, service):
+    cache = AnalyzeResultCache(str(tmp_path))
+
+    first = analyze_document_incremental(None, _pdf(["1", "2", "3"]), cache, max_concurrency=2)
+    assert sorted(service) == ["1", "2", "3"]
+
+    # The same document is served entirely from the cache
+    service.clear()
+    again = analyze_document_incremental(None, _pdf(["1", "2", "3"]), cache, max_concurrency=2)
+    assert service == []
+    assert again[:4] == first[:4]
+
+    # Only the revised page is sent to the service
+    analyze_document_incremental(None, _pdf(["1", "2 revised", "3"]), cache, max_concurrency=2)
+    assert service == ["2 revised"]
+
+
+def test_output_matches_the_whole_document(tmp_path, service, analyze_result):
+    page_text, table_text, _, all_page_elements, ocr_result = analyze_document_incremental(
+        None, _pdf(["1", "2", "3"]), AnalyzeResultCache(str(tmp_path))
+    )
+    expected = post_process_result(analyze_result)
+
+    assert page_text == expected[0]
+    assert table_text == expected[1]
+    assert all_page_elements == expected[3]
+    # The merged result keeps the page numbers of the document rather than those of each single-page analysis
+    assert [page["pageNumber"] for page in ocr_result["pages"]] == [1, 2, 3]
+    assert [paragraph["boundingRegions"][0]["pageNumber"] for paragraph in ocr_result["paragraphs"]] == [
+        paragraph["boundingRegions"][0]["pageNumber"] for paragraph in analyze_result["paragraphs"]
+    ]
+
+
+def test_moved_pages_are_numbered_by_their_new_position(tmp_path, service, analyze_result):
+    cache = AnalyzeResultCache(str(tmp_path))
+    original = analyze_document_incremental(None, _pdf(["1", "2", "3"]), cache)
+
+    service.clear()
+    page_text, _, _, all_page_elements, ocr_result = analyze_document_incremental(None, _pdf(["3", "1"]), cache)
+
+    assert service == []
+    assert [page["page_number"] for page in all_page_elements] == [1, 2]
+    assert [page["elements"] for page in all_page_elements] == [original[3][2]["elements"], original[3][0]["elements"]]
+    assert [page["pageNumber"] for page in ocr_result["pages"]] == [1, 2]
+    assert ocr_result["content"].startswith(analyze_result["content"][755:800])
@@ -0,0 +1,200 @@
+# tests/test_markdown_renderer.py
+
+import pytest
+
+from document_intelligence_wrapper.extractors.extract_utils import table_markdown
+from document_intelligence_wrapper.extractors.markdown_renderer import render_markdown_table
+
+# Headers, rows and the Markdown that tabulate's "pipe" format, which pandas.DataFrame.to_markdown used,
+# renders for them
+TABLES = {
+    "numeric_and_bool_columns": (
+        ["Item", "Count", "Price", "Paid"],
+        [["Apples", "3", "1.5", "True"], ["Pears", "12", "0.25", "False"], ["Plums", "-4", "1e-05", "True"]],
+        "\n".join([
+            "| Item   |   Count |   Price | Paid   |",
+            "|:-------|--------:|--------:|:-------|",
+            "| Apples |       3 |   1.5   | True   |",
+            "| Pears  |      12 |   0.25  | False  |",
+            "| Plums  |      -4 |   1e-05 | True   |",
+        ]),
+    ),
+    "mixed_columns": (
+        ["A", "B", "C"],
+        [["1", "True", "1.0"], ["2", "3", "abc"], ["1,000", "False", "nan"]],
+        "\n".join([
+            "| A     |     B | C   |",
+            "|:------|------:|:----|",
+            "| 1     |  True | 1.0 |",
+            "| 2     |     3 | abc |",
+            "| 1,000 | False | nan |",
+        ]),
+    ),
+    "float_formatting": (
+        ["A", "B"],
+        [["1", "2.50"], ["-30", "1e3"], ["+4", ".5"]],
+        "\n".join([
+            "|   A |      B |",
+            "|----:|-------:|",
+            "|   1 |    2.5 |",
+            "| -30 | 1000   |",
+            "|  +4 |    0.5 |",
+        ]),
+    ),
+    "special_floats": (
+        ["A"],
+        [["inf"], ["1"]],
+        "\n".join([
+            "|   A |",
+            "|----:|",
+            "| inf |",
+            "|   1 |",
+        ]),
+    ),
+    "empty_cells_and_rows": (
+        ["Name", "Qty", "Note"],
+        [["a", "1", ""], ["", "", ""], ["c", "", "x"]],
+        "\n".join([
+            "| Name   | Qty   | Note   |",
+            "|:-------|:------|:-------|",
+            "| a      | 1     |        |",
+            "|        |       |        |",
+            "| c      |       | x      |",
+        ]),
+    ),
+    "surrounding_whitespace": (
+        ["A", "B"],
+        [[" x ", " 1 "], ["y", "22"]],
+        "\n".join([
+            "| A   |   B |",
+            "|:----|----:|",
+            "| x   |  1  |",
+            "| y   |  22 |",
+        ]),
+    ),
+    "multiline_cells": (
+        ["Region\nName", "Total"],
+        [["North\nEast", "10"], ["South", "2.5"]],
+        "\n".join([
+            "| Region   |   Total |",
+            "| Name     |         |",
+            "|:---------|--------:|",
+            "| North    |    10   |",
+            "| East     |         |",
+            "| South    |     2.5 |",
+        ]),
+    ),
+    "header_only": (
+        ["Col A", "Col B"],
+        [],
+        "\n".join([
+            "| Col A   | Col B   |",
+            "|---------|---------|",
+        ]),
+    ),
+}
+
+# Wide characters are sized by their terminal width, which both sides only know with wcwidth installed
+WIDE_TABLE = (
+    ["名前", "Città", "Emoji"],
+    [["東京都", "Zürich", "🙂"], ["大阪", "Åre", "ok"]],
+    "\n".join([
+        "| 名前   | Città   | Emoji   |",
+        "|:-------|:--------|:--------|",
+        "| 東京都 | Zürich  | 🙂      |",
+        "| 大阪   | Åre     | ok      |",
+    ]),
+)
+
+
+def _cell(row_index, column_index, content, **attributes):
+    return dict(rowIndex=row_index, columnIndex=column_index, content=content, **attributes)
+
+
+# Tables in the service's format and the Markdown the pandas implementation of table_markdown returned
+SERVICE_TABLES = {
+    "row_and_column_spans": (
+        {"rowCount": 5, "columnCount": 4, "cells": [
+            _cell(0, 0, "Region", kind="columnHeader", rowSpan=2),
+            _cell(0, 1, "Sales", kind="columnHeader", columnSpan=2),
+            _cell(0, 3, "Notes", kind="columnHeader", rowSpan=2),
+            _cell(1, 1, "Q1", kind="columnHeader"),
+            _cell(1, 2, "Q2", kind="columnHeader"),
+            _cell(2, 0, "North", rowSpan=2),
+            _cell(2, 1, "1,200"), _cell(2, 2, "13.5"), _cell(2, 3, "new\nstore"),
+            _cell(3, 1, "800"), _cell(3, 2, "7"),
+            _cell(4, 0, "South"), _cell(4, 1, "950"), _cell(4, 2, "12.25"), _cell(4, 3, ""),
+        ]},
+        "\n".join([
+            "| Region   | Sales   |   Sales | Notes    |",
+            "|          | Q1      |      Q2 |          |",
+            "|:---------|:--------|--------:|:---------|",
+            "| North    | 1,200   |   13.5  | newstore |",
+            "|          | 800     |    7    |          |",
+            "| South    | 950     |   12.25 |          |",
+        ]),
+    ),
+    "merged_header_columns": (
+        {"rowCount": 3, "columnCount": 3, "cells": [
+            _cell(0, 0, "Item", kind="columnHeader"),
+            _cell(0, 1, "Amount", kind="columnHeader", columnSpan=2),
+            _cell(1, 0, "Tax"), _cell(1, 1, "10"), _cell(1, 2, "USD"),
+            _cell(2, 0, "Fee"), _cell(2, 1, ""), _cell(2, 2, "2.5"),
+        ]},
+        "\n".join([
+            "| Item   | Amount   |",
+            "|:-------|:---------|",
+            "| Tax    | 10 USD   |",
+            "| Fee    | 2.5      |",
+        ]),
+    ),
+    "default_headers_and_empty_row": (
+        {"rowCount": 3, "columnCount": 2, "cells": [
+            _cell(0, 0, "a"), _cell(0, 1, "1"), _cell(2, 0, "c"), _cell(2, 1, "3"),
+        ]},
+        "\n".join([
+            "| Column 1   | Column 2   |",
+            "|:-----------|:-----------|",
+            "| a          | 1          |",
+            "|            |            |",
+            "| c          | 3          |",
+        ]),
+    ),
+    "header_only": (
+        {"rowCount": 1, "columnCount": 2, "cells": [
+            _cell(0, 0, "Only", kind="columnHeader"), _cell(0, 1, "Headers", kind="columnHeader"),
+        ]},
+        "\n".join([
+            "| Only   | Headers   |",
+            "|--------|-----------|",
+        ]),
+    ),
+}
+
+
+@pytest.mark.parametrize("name", TABLES)
+def test_render_matches_the_golden_output(name):
+    headers, rows, expected = TABLES[name]
+    assert render_markdown_table(headers, rows) == expected
+
+
+@pytest.mark.parametrize("name", TABLES)
+def test_golden_output_is_tabulate_pipe_output(name):
+    tabulate = pytest.importorskip("tabulate")
+    headers, rows, expected = TABLES[name]
+    assert tabulate.tabulate(rows, headers, tablefmt="pipe") == expected
+
+
+def test_wide_characters_are_aligned_by_display_width():
+    pytest.importorskip("wcwidth")
+    headers, rows, expected = WIDE_TABLE
+    assert render_markdown_table(headers, rows) == expected
+
+    tabulate = pytest.importorskip("tabulate")
+    assert tabulate.tabulate(rows, headers, tablefmt="pipe") == expected
+
+
+@pytest.mark.parametrize("name", SERVICE_TABLES)
+def test_service_tables_match_the_golden_output(name):
+    table, expected = SERVICE_TABLES[name]
+    assert table_markdown(table) == expected
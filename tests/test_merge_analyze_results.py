@@ -0,0 +1,126 @@
+# tests/test_merge_analyze_results.py
+
+import re
+
+import pytest
+
+from document_intelligence_wrapper.extractors.extract_utils import span_text
+from document_intelligence_wrapper.extractors.page_ranges import PAGE_BREAK, merge_analyze_results
+from document_intelligence_wrapper.extractors.text_extractor import post_process_result
+
+ELEMENT_TYPES = ("paragraphs", "tables", "figures")
+
+
+def _split_by_page(result, local_page_numbers):
+    """
+    Returns the result of each page as the service returns it for an analysis of that page alone: content, span
+    offsets and element references are relative to the page, and with local_page_numbers, so are page numbers
+    and figure ids, as for a page split out of the document before analysis.
+    """
+    page_results = []
+    for page in result["pages"]:
+        page_number = page["pageNumber"]
+        content_offset = page["spans"][0]["offset"]
+        content_length = page["spans"][0]["length"]
+        page_offset = 1 - page_number if local_page_numbers else 0
+
+        indexes = {
+            element_type: [
+                index for index, element in enumerate(result[element_type])
+                if element["boundingRegions"][0]["pageNumber"] == page_number
+            ]
+            for element_type in ELEMENT_TYPES
+        }
+        local_indexes = {
+            element_type: {index: local_index for local_index, index in enumerate(type_indexes)}
+            for element_type, type_indexes in indexes.items()
+        }
+
+        def localize(value, key=None):
+            if isinstance(value, dict):
+                localized = {item_key: localize(item_value, item_key) for item_key, item_value in value.items()}
+                if key in ("span", "spans"):
+                    localized["offset"] = value["offset"] - content_offset
+                return localized
+            if isinstance(value, list):
+                return [localize(item, key) for item in value]
+            if key == "pageNumber":
+                return value + page_offset
+            if key == "elements":
+                element_type, index = re.match(r"^/(\w+)/(\d+)$", value).groups()
+                return f"/{element_type}/{local_indexes[element_type][int(index)]}"
+            if key == "id" and local_page_numbers:
+                return f"{page_number + page_offset}.{value.split('.')[1]}"
+            return value
+
+        page_section, = [section for section in result["sections"][1:] if section["spans"][0]["offset"] == content_offset]
+        page_result = {key: value for key, value in result.items() if not isinstance(value, list)}
+        page_result.update({
+            "content": result["content"][content_offset:content_offset + content_length],
+            "pages": [localize(page)],
+            "sections": [
+                {"spans": [{"offset": 0, "length": content_length}], "elements": ["/sections/1"]},
+                localize(page_section),
+            ],
+        })
+        for element_type, type_indexes in indexes.items():
+            page_result[element_type] = [localize(result[element_type][index]) for index in type_indexes]
+        page_results.append(page_result)
+
+    return page_results
+
+
+def _section_leaves(result, reference="/sections/0"):
+    """
+    Returns the texts of the elements reached from the root section, in reading order.
+    """
+    element_type, index = re.match(r"^/(\w+)/(\d+)$", reference).groups()
+    if element_type == "sections":
+        return [leaf for child in result["sections"][int(index)]["elements"] for leaf in _section_leaves(result, child)]
+    return [span_text(result, element_type, int(index))]
+
+
+@pytest.mark.parametrize("local_page_numbers", [False, True])
+def test_merged_pages_read_like_the_whole_document(analyze_result, local_page_numbers):
+    page_results = _split_by_page(analyze_result, local_page_numbers)
+    first_page_numbers = [page["pageNumber"] for page in analyze_result["pages"]] if local_page_numbers else None
+
+    merged = merge_analyze_results(page_results, first_page_numbers)
+
+    assert merged["content"] == PAGE_BREAK.join(page_result["content"] for page_result in page_results)
+    assert [page["pageNumber"] for page in merged["pages"]] == [1, 2, 3]
+    assert merged["modelId"] == analyze_result["modelId"]
+
+    for element_type in ELEMENT_TYPES:
+        assert len(merged[element_type]) == len(analyze_result[element_type])
+        for index, (merged_element, element) in enumerate(zip(merged[element_type], analyze_result[element_type])):
+            assert span_text(merged, element_type, index) == span_text(analyze_result, element_type, index)
+            assert merged_element["boundingRegions"] == element["boundingRegions"]
+
+    for merged_figure, figure in zip(merged["figures"], analyze_result["figures"]):
+        assert merged_figure["id"] == figure["id"]
+        assert merged_figure["elements"] == figure["elements"]
+
+    for merged_table, table in zip(merged["tables"], analyze_result["tables"]):
+        merged_cells = [merged["content"][span["offset"]:span["offset"] + span["length"]]
+                        for cell in merged_table["cells"] for span in cell["spans"]]
+        assert merged_cells == [cell["content"] for cell in table["cells"]]
+
+    assert _section_leaves(merged) == _section_leaves(analyze_result)
+
+
+@pytest.mark.parametrize("text_assembly", ["render", "spans"])
+def test_merged_pages_post_process_like_the_whole_document(analyze_result, text_assembly):
+    merged = merge_analyze_results(_split_by_page(analyze_result, True), [1, 2, 3])
+
+    page_text, table_text, _, all_page_elements, _ = post_process_result(merged, calculate_cell_confidence=True, text_assembly=text_assembly)
+    expected = post_process_result(analyze_result, calculate_cell_confidence=True, text_assembly=text_assembly)
+
+    assert page_text == expected[0]
+    assert table_text == expected[1]
+    assert all_page_elements == expected[3]
+
+
+def test_there_must_be_results_to_merge():
+    with pytest.raises(ValueError):
+        merge_analyze_results([])
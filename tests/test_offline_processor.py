@@ -0,0 +1,65 @@
+# tests/test_offline_processor.py
+
+import gzip
+import json
+import os
+import shutil
+
+from conftest import LAYOUT_PATH
+from document_intelligence_wrapper.extractors.columnar import ColumnarDocument, ElementColumns, load_columnar_document
+from document_intelligence_wrapper.extractors.offline_processor import load_analyze_result, process_saved_results
+
+
+def _process(inputs, output_dir):
+    outcomes = list(process_saved_results([str(path) for path in inputs], str(output_dir), max_workers=1, calculate_confidence=False))
+    assert [error for _, _, error in outcomes if error is not None] == []
+    return {path: output_paths for path, output_paths, _ in outcomes}
+
+
+def test_inputs_with_the_same_name_get_distinct_outputs(tmp_path):
+    for directory in ("a", "b"):
+        os.makedirs(tmp_path / directory)
+        shutil.copy(LAYOUT_PATH, tmp_path / directory / "x.json")
+    with open(LAYOUT_PATH, "rb") as source, gzip.open(tmp_path / "a" / "x.json.gz", "wb") as compressed:
+        shutil.copyfileobj(source, compressed)
+    inputs = [tmp_path / "a" / "x.json", tmp_path / "b" / "x.json", tmp_path / "a" / "x.json.gz"]
+
+    outputs = _process(inputs, tmp_path / "out")
+
+    text_files = [output_paths[3] for output_paths in outputs.values()]
+    assert sorted(os.path.basename(path) for path in text_files) == ["x-2.txt", "x-3.txt", "x.txt"]
+    for output_paths in outputs.values():
+        assert all(os.path.exists(path) for path in output_paths)
+
+
+def test_directory_inputs_mirror_their_layout(tmp_path):
+    for directory in ("a", "b"):
+        os.makedirs(tmp_path / "in" / directory)
+        shutil.copy(LAYOUT_PATH, tmp_path / "in" / directory / "x.json")
+
+    outputs = _process([tmp_path / "in"], tmp_path / "out")
+
+    assert sorted(os.path.relpath(output_paths[0], tmp_path / "out") for output_paths in outputs.values()) == [
+        os.path.join("a", "x.page_text.json"), os.path.join("b", "x.page_text.json")
+    ]
+    with open(outputs[str(tmp_path / "in" / "a" / "x.json")][0], encoding="utf-8") as f:
+        assert len(json.load(f)) == 3
+
+
+def _columns(document):
+    """
+    Returns the columns of a ColumnarDocument, with those of its elements, as comparable dictionaries.
+    """
+    return {
+        name: {slot: getattr(value, slot) for slot in ElementColumns.__slots__} if isinstance(value, ElementColumns) else value
+        for name, value in vars(document).items()
+    }
+
+
+def test_saved_results_load_the_same_from_every_form(tmp_path, analyze_result):
+    with gzip.open(tmp_path / "wrapped.json.gz", "wt", encoding="utf-8") as f:
+        json.dump({"status": "succeeded", "analyzeResult": analyze_result}, f)
+
+    for path in (LAYOUT_PATH, str(tmp_path / "wrapped.json.gz")):
+        assert load_analyze_result(path) == analyze_result
+        assert _columns(load_columnar_document(path)) == _columns(ColumnarDocument.from_dict(analyze_result))
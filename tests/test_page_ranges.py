@@ -0,0 +1,69 @@
+# tests/test_page_ranges.py
+
+import io
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from document_intelligence_wrapper.extractors.page_ranges import count_pdf_pages, pdf_page_ranges
+
+pypdf = pytest.importorskip("pypdf")
+
+
+def _incrementally_updated_pdf(page_count):
+    """
+    Returns a PDF with an outline, whose first pages were rewritten by an incremental update.
+    """
+    from pypdf.generic import NameObject, NumberObject
+
+    writer = pypdf.PdfWriter()
+    for _ in range(page_count):
+        writer.add_blank_page(200, 200)
+    # Outline items carry /Count entries of their own
+    parent = writer.add_outline_item("Part", 0)
+    for page_index in range(page_count):
+        writer.add_outline_item(f"Page {page_index + 1}", page_index, parent=parent)
+    original = io.BytesIO()
+    writer.write(original)
+
+    # The update appends new copies of the rewritten page objects after the original ones
+    updater = pypdf.PdfWriter(io.BytesIO(original.getvalue()), incremental=True)
+    for page in list(updater.pages)[:2]:
+        page[NameObject("/Rotate")] = NumberObject(90)
+    updated = io.BytesIO()
+    updater.write(updated)
+    return updated.getvalue()
+
+
+def test_count_reads_the_root_page_tree():
+    document = _incrementally_updated_pdf(3)
+
+    assert count_pdf_pages(document) == 3
+    assert pdf_page_ranges(document, 2) == ["1-2", "3"]
+
+
+def test_count_rewinds_streams():
+    stream = io.BytesIO(b"prefix" + _incrementally_updated_pdf(3))
+    stream.seek(6)
+
+    assert count_pdf_pages(stream) == 3
+    assert stream.tell() == 6
+
+
+def test_documents_other_than_pdfs_are_not_split():
+    assert count_pdf_pages(b"\x89PNG\r\n\x1a\n") is None
+    assert pdf_page_ranges(b"\x89PNG\r\n\x1a\n", 2) == []
+
+
+def test_pypdf_is_imported_on_first_use(monkeypatch):
+    code = "import sys, document_intelligence_wrapper.extractors.text_extractor; assert 'pypdf' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).resolve().parent.parent)
+
+    # Without pypdf, pages are not counted and PDFs cannot be split
+    monkeypatch.setitem(sys.modules, "pypdf", None)
+    document = _incrementally_updated_pdf(3)
+    assert count_pdf_pages(document) is None
+    with pytest.raises(ImportError):
+        pdf_page_ranges(document, 2)
@@ -0,0 +1,62 @@
+# tests/test_polling.py
+
+from types import SimpleNamespace
+
+from azure.ai.documentintelligence import DocumentIntelligenceClient
+from azure.core.credentials import AzureKeyCredential
+from azure.core.utils import CaseInsensitiveDict
+
+from document_intelligence_wrapper.extractors.polling import (
+    AdaptivePolling, JsonResultPolling, adaptive_initial_delay, polling_method, retry_after_seconds
+)
+from document_intelligence_wrapper.extractors.text_extractor import _polling_options
+
+
+def _response(headers):
+    return SimpleNamespace(headers=CaseInsensitiveDict(headers))
+
+
+def _status_response(headers):
+    return SimpleNamespace(http_response=_response(headers))
+
+
+def test_adaptive_delay_waits_for_longer_retry_after():
+    polling = AdaptivePolling(page_count=1, file_size=0, max_delay=10)
+    initial_delay = adaptive_initial_delay(1, 0, 10)
+
+    polling._pipeline_response = _status_response({"Retry-After": "5"})
+    assert polling._extract_delay() == 5
+
+    # A shorter Retry-After does not hold back the adaptive delay, which kept growing meanwhile
+    polling._pipeline_response = _status_response({"Retry-After": "0"})
+    assert polling._extract_delay() == initial_delay * 1.5
+
+    polling._pipeline_response = _status_response({})
+    assert polling._extract_delay() == initial_delay * 1.5 ** 2
+
+
+def test_retry_after_seconds():
+    assert retry_after_seconds(_response({"retry-after-ms": "250"})) == 0.25
+    assert retry_after_seconds(_response({"Retry-After": "2"})) == 2
+    assert retry_after_seconds(_response({"Retry-After": "Thu, 01 Jan 1970 00:00:00 GMT"})) == 0
+    assert retry_after_seconds(_response({})) is None
+
+
+def test_polling_method_takes_the_interval():
+    assert polling_method(b"", json_result=False) is None
+    polling = polling_method(b"", json_result=True, polling_interval=2)
+    assert isinstance(polling, JsonResultPolling)
+    assert polling._timeout == 2
+
+
+def test_columnar_polling_keeps_the_client_interval():
+    client = DocumentIntelligenceClient("https://example.invalid", AzureKeyCredential("key"), polling_interval=0.5)
+
+    polling = _polling_options(client, b"", None, None, True, None, asynchronous=False)["polling"]
+    assert isinstance(polling, JsonResultPolling)
+    assert polling._timeout == 0.5
+
+    # An explicit interval wins over the client's
+    assert _polling_options(client, b"", None, None, True, 2, asynchronous=False)["polling"]._timeout == 2
+    # Without a polling method of our own, the SDK applies the client's interval itself
+    assert _polling_options(client, b"", None, None, False, None, asynchronous=False) == {}
@@ -0,0 +1,110 @@
+# tests/test_result_cache.py
+
+import gzip
+import os
+import random
+
+from document_intelligence_wrapper.extractors.result_cache import AnalyzeResultCache
+
+
+def _keys(count):
+    return [AnalyzeResultCache.make_key(f"document {index}", "prebuilt-layout", "markdown") for index in range(count)]
+
+
+def _value(index):
+    # Incompressible enough for every entry to take about the same room on disk
+    return {"content": random.Random(index).randbytes(200).hex(), "index": index}
+
+
+def _entry_size(tmp_path):
+    """
+    Returns the size on disk of one entry.
+    """
+    cache = AnalyzeResultCache(str(tmp_path / "sizing"))
+    key, = _keys(1)
+    cache.put(key, _value(0))
+    return os.path.getsize(cache._path(key))
+
+
+def _disk_bytes(cache):
+    return sum(size for _, size, _ in cache._entries())
+
+
+def test_least_recently_used_entries_are_evicted_first(tmp_path):
+    entry_size = _entry_size(tmp_path)
+    cache = AnalyzeResultCache(str(tmp_path / "cache"), max_bytes=int(entry_size * 3.5))
+    keys = _keys(5)
+
+    for age, key in enumerate(keys[:3]):
+        cache.put(key, _value(age))
+        # Older entries have older modification times, without waiting on the file system's clock resolution
+        os.utime(cache._path(key), (1000 + age, 1000 + age))
+
+    # Reading the oldest entry makes it the most recently used one
+    assert cache.get(keys[0]) == _value(0)
+
+    cache.put(keys[3], _value(3))
+    assert [cache.get(key) is not None for key in keys[:4]] == [True, False, True, True]
+
+    cache.put(keys[4], _value(4))
+    assert cache.get(keys[2]) is None
+    assert [cache.get(key) is not None for key in (keys[0], keys[3], keys[4])] == [True, True, True]
+
+
+def test_cache_stays_within_its_byte_bound(tmp_path):
+    entry_size = _entry_size(tmp_path)
+    max_bytes = int(entry_size * 2.5)
+    cache = AnalyzeResultCache(str(tmp_path / "cache"), max_bytes=max_bytes)
+    keys = _keys(10)
+
+    for index, key in enumerate(keys):
+        cache.put(key, _value(index))
+        assert _disk_bytes(cache) <= max_bytes
+        assert cache._total_bytes == _disk_bytes(cache)
+
+
+def test_overwriting_an_entry_counts_its_size_once(tmp_path, monkeypatch):
+    entry_size = _entry_size(tmp_path)
+    cache = AnalyzeResultCache(str(tmp_path / "cache"), max_bytes=int(entry_size * 2.5))
+    first, second = _keys(2)
+    evictions = []
+    monkeypatch.setattr(cache, "_evict", lambda: evictions.append(cache._total_bytes))
+
+    cache.put(first, _value(0))
+    cache.put(second, _value(1))
+    for index in range(5):
+        cache.put(first, _value(index))
+        assert cache._total_bytes == _disk_bytes(cache)
+
+    # The cache never looked full, so it was never rescanned for entries to evict
+    assert evictions == []
+    assert cache.get(second) == _value(1)
+
+
+def test_corrupt_and_partial_entries_are_misses(tmp_path):
+    cache = AnalyzeResultCache(str(tmp_path / "cache"))
+    truncated, not_gzip, not_json = _keys(3)
+
+    cache.put(truncated, _value(0))
+    path = cache._path(truncated)
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(data[:len(data) // 2])
+
+    os.makedirs(os.path.dirname(cache._path(not_gzip)), exist_ok=True)
+    with open(cache._path(not_gzip), "wb") as f:
+        f.write(b"not gzip")
+    os.makedirs(os.path.dirname(cache._path(not_json)), exist_ok=True)
+    with gzip.open(cache._path(not_json), "wb") as f:
+        f.write(b'{"content": ')
+
+    cache = AnalyzeResultCache(str(tmp_path / "cache"))
+    for key in (truncated, not_gzip, not_json):
+        assert cache.get(key) is None
+        assert not os.path.exists(cache._path(key))
+    assert cache._total_bytes == 0
+
+    # The key can be stored again once the unreadable entry is gone
+    cache.put(truncated, _value(0))
+    assert cache.get(truncated) == _value(0)